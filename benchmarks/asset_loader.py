@@ -0,0 +1,80 @@
+import os
+from time import perf_counter, thread_time, sleep
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pygame_ui_toolkit.elements import button
+from pygame_ui_toolkit import images
+from pygame_ui_toolkit import assets
+
+
+# Each button has a different size, so every image has to be loaded and scaled
+NUM_BUTTONS = 60
+MIN_SIZE = 40
+
+FRAME_SLEEP = 0.005
+
+IMAGE_PATHS = [os.path.join(os.path.dirname(__file__), "..", "examples", "images", f"smile{i}.png") for i in (1, 2, 3)]
+
+
+pygame.init()
+window = pygame.display.set_mode((500, 500))
+
+
+def create_buttons(loader):
+    return [button.ImageButton(window, 250, 250, MIN_SIZE + i, MIN_SIZE + i, IMAGE_PATHS[i % len(IMAGE_PATHS)], smooth=True, loader=loader) for i in range(NUM_BUTTONS)]
+
+
+def time_sync():
+    """Return the time (in milliseconds) the main thread spends creating the buttons without a loader."""
+    images.clear()
+
+    start = thread_time()
+    create_buttons(None)
+
+    return (thread_time() - start) * 1e3
+
+
+def time_async():
+    """
+    Return the time (in milliseconds) the main thread spends creating the buttons with a loader, the longest update() call,
+    the number of frames until every image has loaded (with the main thread sleeping for FRAME_SLEEP seconds each frame, like pygame.time.Clock.tick()) and the total time until then.
+    """
+    images.clear()
+    loader = assets.AssetLoader()
+
+    # thread_time() only counts the time spent by the main thread, not the worker threads
+    start = perf_counter()
+    create_start = thread_time()
+    create_buttons(loader)
+    create_ms = (thread_time() - create_start) * 1e3
+
+    longest_update = 0
+    num_frames = 0
+
+    while not loader.is_done():
+        update_start = thread_time()
+        loader.update()
+        longest_update = max(longest_update, thread_time() - update_start)
+
+        num_frames += 1
+        sleep(FRAME_SLEEP)
+
+    total_ms = (perf_counter() - start) * 1e3
+    loader.shutdown()
+
+    return create_ms, longest_update * 1e3, num_frames, total_ms
+
+
+def main():
+    sync_ms = time_sync()
+    create_ms, update_ms, num_frames, total_ms = time_async()
+
+    print(f"creating {NUM_BUTTONS} image buttons of different sizes:")
+    print(f"    without a loader: {sync_ms :.1f} ms of main thread time")
+    print(f"    with a loader:    {create_ms :.1f} ms of main thread time, longest update() {update_ms :.2f} ms, loaded after {num_frames} frames ({total_ms :.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import os
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pygame_ui_toolkit.elements import button
+from pygame_ui_toolkit import atlas
+from pygame_ui_toolkit import images
+
+
+NUM_FRAMES = 200
+NUM_REPEATS = 5
+NUM_COLUMNS = 40
+NUM_ROWS = 25
+
+# Each button is a different size, so every button has an image of its own
+MIN_SIZE = 12
+NUM_SIZES = 12
+
+IMAGE_PATHS = [os.path.join(os.path.dirname(__file__), "..", "examples", "images", f"smile{i}.png") for i in (1, 2, 3)]
+
+
+pygame.init()
+window = pygame.display.set_mode((1000, 1000))
+
+
+def create_buttons(texture_atlas):
+    """Return a grid of small image buttons, with a mix of images and sizes."""
+    buttons = []
+    for i in range(NUM_COLUMNS * NUM_ROWS):
+        x = 12 + (i % NUM_COLUMNS) * 24
+        y = 12 + (i // NUM_COLUMNS) * 24
+        size = MIN_SIZE + i // len(IMAGE_PATHS) % NUM_SIZES
+
+        buttons.append(button.ImageButton(window, x, y, size, size, IMAGE_PATHS[i % len(IMAGE_PATHS)], atlas=texture_atlas))
+
+    return buttons
+
+
+def time_draw(draw_func):
+    """Return the average time (in microseconds) of calling draw_func(), from the quickest of NUM_REPEATS runs."""
+    total = min(timeit.repeat(draw_func, number=NUM_FRAMES, repeat=NUM_REPEATS))
+
+    return total / NUM_FRAMES * 1e6
+
+
+def draw_each(buttons):
+    for btn in buttons:
+        btn.draw()
+
+
+def main():
+    images.clear()
+    separate = create_buttons(None)
+    num_images = images.get_stats()["size"]
+    image_bytes = images.get_stats()["bytes"]
+
+    texture_atlas = atlas.TextureAtlas()
+    packed = create_buttons(texture_atlas)
+    atlas_stats = texture_atlas.get_stats()
+
+    print(f"drawing {len(separate)} image buttons ({num_images} different images):")
+    print(f"    separate images, draw() each:       {time_draw(lambda: draw_each(separate)) :.0f} us")
+    print(f"    separate images, one blits() call:  {time_draw(lambda: atlas.draw_image_buttons(separate)) :.0f} us")
+    print(f"    atlas, draw() each:                 {time_draw(lambda: draw_each(packed)) :.0f} us")
+    print(f"    atlas, one blits() call:            {time_draw(lambda: atlas.draw_image_buttons(packed)) :.0f} us")
+
+    print()
+    print(f"separate images: {num_images} surfaces, {image_bytes / 1024 :.0f} KiB")
+    print(f"atlas: {atlas_stats['pages']} page(s), {atlas_stats['bytes'] / 1024 :.0f} KiB, {atlas_stats['used'] :.0%} used")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import os
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pygame_ui_toolkit.elements import button, button_array
+from pygame_ui_toolkit import input_state
+
+
+NUM_COLUMNS = 100
+NUM_ROWS = 100
+NUM_FRAMES = 50
+
+BUTTON_SIZE = 4
+GAP = 1
+
+
+pygame.init()
+window = pygame.display.set_mode((500, 500))
+
+
+def on_hover(btn):
+    pass
+
+
+def on_hover_index(index):
+    pass
+
+
+def time_per_frame(func, num_frames):
+    """Return the average time (in milliseconds) of calling func."""
+    return timeit.timeit(func, number=num_frames) / num_frames * 1e3
+
+
+def main():
+    grid = button_array.create_grid(window, 2, 2, NUM_COLUMNS, NUM_ROWS, BUTTON_SIZE, BUTTON_SIZE, (255, 255, 255), GAP, GAP, on_hover=on_hover_index)
+    buttons = [button.RectButton(window, x, y, (255, 255, 255), BUTTON_SIZE, BUTTON_SIZE, on_hover=on_hover) for x, y in grid.positions.tolist()]
+
+    input_state.set_state(input_state.InputState((250, 250), (False, False, False)))
+
+    def update_buttons():
+        for i in buttons:
+            i.update_state()
+
+    def draw_buttons():
+        for i in buttons:
+            i.draw()
+
+    buttons_update_ms = time_per_frame(update_buttons, NUM_FRAMES)
+    grid_update_ms = time_per_frame(grid.update_state, NUM_FRAMES)
+
+    buttons_draw_ms = time_per_frame(draw_buttons, NUM_FRAMES)
+    grid_draw_ms = time_per_frame(grid.draw, NUM_FRAMES)
+
+    print(f"{len(buttons)} buttons in a {NUM_COLUMNS}x{NUM_ROWS} grid")
+    print(f"RectButton.update_state() for every button: {buttons_update_ms :.2f} ms per frame")
+    print(f"ButtonArray.update_state():                 {grid_update_ms :.2f} ms per frame ({buttons_update_ms / grid_update_ms :.0f}x faster)")
+    print(f"RectButton.draw() for every button:         {buttons_draw_ms :.2f} ms per frame")
+    print(f"ButtonArray.draw():                         {grid_draw_ms :.2f} ms per frame")
+
+
+if __name__ == "__main__":
+    main()
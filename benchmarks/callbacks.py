@@ -0,0 +1,52 @@
+import os
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pygame_ui_toolkit.elements import button
+from pygame_ui_toolkit import utils
+
+
+NUM_CALLS = 200000
+NUM_FRAMES = 20000
+
+
+pygame.init()
+window = pygame.display.set_mode((500, 500))
+
+
+def on_click(btn):
+    pass
+
+
+def on_hover(btn):
+    pass
+
+
+def on_normal(btn):
+    pass
+
+
+def time_per_call(func, num_calls):
+    """Return the average time (in nanoseconds) of calling func."""
+    total = timeit.timeit(func, number=num_calls)
+
+    return total / num_calls * 1e9
+
+
+def main():
+    btn = button.RectButton(window, 250, 250, (255, 255, 255), 100, 50, on_click, on_hover, on_normal, click_once=False)
+    bound = utils.bind_func(on_normal)
+
+    call_func_ns = time_per_call(lambda: utils.call_func(on_normal, btn), NUM_CALLS)
+    bound_ns = time_per_call(lambda: bound(btn), NUM_CALLS)
+    update_ns = time_per_call(btn.update, NUM_FRAMES)
+
+    print(f"utils.call_func() per call:    {call_func_ns :.0f} ns")
+    print(f"utils.bind_func() per call:    {bound_ns :.0f} ns")
+    print(f"RectButton.update() per frame: {update_ns :.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import os
+import random
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pygame_ui_toolkit.elements import button
+from pygame_ui_toolkit import hit_test
+
+
+NUM_BUTTONS = 3000
+NUM_POINTS = 100
+
+# A regular hexagon around (0, 0)
+HEXAGON = ((20, 0), (10, 17), (-10, 17), (-20, 0), (-10, -17), (10, -17))
+
+
+pygame.init()
+window = pygame.display.set_mode((500, 500))
+
+
+def create_buttons(rng):
+    """Return an equal number of rectangle, circle and polygon buttons spread over a 1000x1000 area."""
+    buttons = []
+    for i in range(NUM_BUTTONS):
+        x = rng.randrange(1000)
+        y = rng.randrange(1000)
+
+        if i % 3 == 0:
+            buttons.append(button.RectButton(window, x, y, (255, 255, 255), 40, 20))
+        elif i % 3 == 1:
+            buttons.append(button.CircleButton(window, x, y, (255, 255, 255), 15))
+        else:
+            buttons.append(button.PolygonButton(window, [(x + dx, y + dy) for dx, dy in HEXAGON], (255, 255, 255)))
+
+    return buttons
+
+
+def time_per_test(func, buttons, points):
+    """Return the average time (in nanoseconds) of calling func(button, x, y) for every button and point."""
+    total = timeit.timeit(lambda: [func(i, x, y) for x, y in points for i in buttons], number=1)
+
+    return total / (len(buttons) * len(points)) * 1e9
+
+
+def main():
+    rng = random.Random(0)
+
+    buttons = create_buttons(rng)
+    points = [(rng.randrange(1000), rng.randrange(1000)) for _ in range(NUM_POINTS)]
+
+    print(f"{NUM_POINTS} points against {NUM_BUTTONS // 3} of each button")
+
+    for button_type in (button.RectButton, button.CircleButton, button.PolygonButton):
+        same_type = [i for i in buttons if type(i) == button_type]
+
+        exact_ns = time_per_test(lambda btn, x, y: btn.contains_point(x, y), same_type, points)
+        two_phase_ns = time_per_test(hit_test.check_point, same_type, points)
+
+        print(f"{button_type.__name__ + ':':<14} exact test only {exact_ns :.0f} ns, hit rect then exact {two_phase_ns :.0f} ns")
+
+    hit_test.reset_stats()
+    time_per_test(hit_test.check_point, buttons, points)
+
+    stats = hit_test.get_stats()
+
+    print(f"counters for every button: {stats}")
+    print(f"exact tests avoided: {stats['avoided'] / stats['tests'] :.1%}")
+
+
+if __name__ == "__main__":
+    main()
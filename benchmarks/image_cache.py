@@ -0,0 +1,77 @@
+import os
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pygame_ui_toolkit.elements import button
+from pygame_ui_toolkit import input_state
+from pygame_ui_toolkit import images
+
+
+NUM_SWAPS = 2000
+NUM_FRAMES = 2000
+
+IMAGE_PATHS = [os.path.join(os.path.dirname(__file__), "..", "examples", "images", f"smile{i}.png") for i in (1, 2, 3)]
+
+
+pygame.init()
+window = pygame.display.set_mode((500, 500))
+
+
+def time_swaps(clear_cache):
+    """Return the average time (in microseconds) of changing the image of an ImageButton, optionally clearing the image cache before each change (like loading from disk every time)."""
+    btn = button.ImageButton(window, 250, 250, 150, 150, IMAGE_PATHS[0])
+    index = 0
+
+    def swap():
+        nonlocal index
+
+        index = (index + 1) % len(IMAGE_PATHS)
+
+        if clear_cache:
+            images.clear()
+
+        btn.update_image(IMAGE_PATHS[index])
+
+    total = timeit.timeit(swap, number=NUM_SWAPS)
+
+    return total / NUM_SWAPS * 1e6
+
+
+def time_hover_frames():
+    """Return the average time (in microseconds) of updating a button with preloaded hover and click images, as the mouse moves on and off it."""
+    btn = button.ImageButton(window, 250, 250, 150, 150, IMAGE_PATHS[0], click_once=False, hover_image_path=IMAGE_PATHS[1], click_image_path=IMAGE_PATHS[2])
+    states = [input_state.InputState((250, 250), (False, False, False)), input_state.InputState((0, 0), (False, False, False))]
+    frame = 0
+
+    def update():
+        nonlocal frame
+
+        frame += 1
+        input_state.set_state(states[frame % 2])
+
+        btn.update_state()
+
+    total = timeit.timeit(update, number=NUM_FRAMES)
+    input_state.set_state(None)
+
+    return total / NUM_FRAMES * 1e6
+
+
+def main():
+    uncached_us = time_swaps(True)
+
+    images.clear()
+    cached_us = time_swaps(False)
+
+    print("changing the image of an ImageButton:")
+    print(f"    loading and scaling every time: {uncached_us :.1f} us")
+    print(f"    with the image cache:           {cached_us :.1f} us")
+    print()
+    print(f"hovering on and off a button with preloaded images: {time_hover_frames() :.1f} us per frame")
+    print(f"    {images.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import os
+import random
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from pygame_ui_toolkit import polygons
+
+
+NUM_POLYGONS = 500
+NUM_POINTS = 500
+NUM_REPEATS = 5
+
+# The polygons are regular hexagons spread over a 1000x1000 area
+HEXAGON = ((20, 0), (10, 17), (-10, 17), (-20, 0), (-10, -17), (10, -17))
+
+
+def get_inequalities(points, center_x, center_y):
+    """The slope/intercept inequalities PolygonButton used before polygons.Polygon (kept here for comparison)."""
+    inequalities = []
+    for i, x in enumerate(points):
+        try:
+            m = (x[1] - points[i - 1][1]) / (x[0] - points[i - 1][0])
+        except ZeroDivisionError:
+            m = 1e10
+
+        c = x[1] - m * x[0]
+        inequalities.append((m, c, (m * center_x + c) < center_y))
+
+    return inequalities
+
+
+def inequalities_contain_point(inequalities, x, y):
+    for m, c, greater_than in inequalities:
+        if (m * x + c < y) != greater_than:
+            return False
+
+    return True
+
+
+def time_per_test(func, num_tests):
+    """Return the average time (in nanoseconds) of each point in polygon test done by func."""
+    return timeit.timeit(func, number=NUM_REPEATS) / (NUM_REPEATS * num_tests) * 1e9
+
+
+def main():
+    rng = random.Random(0)
+
+    centers = [(rng.randrange(1000), rng.randrange(1000)) for _ in range(NUM_POLYGONS)]
+    points = [(rng.randrange(1000), rng.randrange(1000)) for _ in range(NUM_POINTS)]
+
+    shapes = [[(x + dx, y + dy) for dx, dy in HEXAGON] for x, y in centers]
+
+    all_inequalities = [get_inequalities(i, x, y) for i, (x, y) in zip(shapes, centers)]
+    all_polygons = [polygons.Polygon(i) for i in shapes]
+    batch = polygons.PolygonBatch(all_polygons)
+
+    num_tests = NUM_POLYGONS * NUM_POINTS
+
+    inequalities_ns = time_per_test(lambda: [inequalities_contain_point(i, x, y) for x, y in points for i in all_inequalities], num_tests)
+    polygon_ns = time_per_test(lambda: [i.contains_point(x, y) for x, y in points for i in all_polygons], num_tests)
+    batch_ns = time_per_test(lambda: batch.contains_points(points), num_tests)
+
+    print(f"{NUM_POINTS} points against {NUM_POLYGONS} hexagons")
+    print(f"slope/intercept inequalities: {inequalities_ns :.1f} ns per test")
+    print(f"Polygon.contains_point():     {polygon_ns :.1f} ns per test")
+    print(f"PolygonBatch.contains_points: {batch_ns :.1f} ns per test")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import os
+import gc
+import sys
+import weakref
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pygame_ui_toolkit.presets import button_colour_change, button_size_change, input_size_colour_change, slider_value_text
+
+
+NUM_BUTTONS = 100000
+NUM_ROUNDS = 10
+
+# Text inputs and sliders render text when they are created, so fewer are made
+NUM_TEXT_INPUTS = 2000
+NUM_SLIDERS = 2000
+
+# The most the traced memory can grow by between the first and last round
+MAX_GROWTH = 256 * 1024
+
+
+pygame.init()
+window = pygame.display.set_mode((500, 500))
+
+
+def create_screen(num_buttons, num_text_inputs, num_sliders):
+    """Create (and throw away) a screen of preset elements, returning weak references to them."""
+    elements = []
+
+    for i in range(num_buttons // 2):
+        elements.append(button_colour_change.create_button((255, 255, 255), (200, 200, 200), (100, 100, 100), window, i % 500, 50, 40, 20))
+        elements.append(button_size_change.create_button((40, 20), (44, 22), (36, 18), window, i % 500, 100, (255, 255, 255)))
+
+    for i in range(num_text_inputs):
+        elements.append(input_size_colour_change.create_text_input((255, 255, 255), (200, 200, 200), (100, 30), (104, 32), (96, 28), window, i % 500, 200, (0, 0, 0), 20))
+
+    for i in range(num_sliders):
+        elements.append(slider_value_text.create_slider_text(window, 250, 300, 250, 330, 200, 10, 0, 100, i % 100, (200, 200, 200), None, 20, (255, 255, 255)))
+
+    return [weakref.ref(i) for i in elements]
+
+
+def main():
+    tracemalloc.start()
+
+    usage = []
+    num_alive = 0
+    for _ in range(NUM_ROUNDS):
+        refs = create_screen(NUM_BUTTONS // NUM_ROUNDS, NUM_TEXT_INPUTS // NUM_ROUNDS, NUM_SLIDERS // NUM_ROUNDS)
+        gc.collect()
+
+        num_alive += sum(i() != None for i in refs)
+        del refs
+
+        current, _ = tracemalloc.get_traced_memory()
+        usage.append(current)
+
+    tracemalloc.stop()
+
+    growth = usage[-1] - usage[0]
+
+    print(f"{NUM_BUTTONS} buttons, {NUM_TEXT_INPUTS} text inputs and {NUM_SLIDERS} sliders created and discarded in {NUM_ROUNDS} rounds")
+    print(f"traced memory after each round (KiB): {[i // 1024 for i in usage]}")
+    print(f"growth: {growth / 1024 :.1f} KiB, elements still alive: {num_alive}")
+
+    if growth > MAX_GROWTH or num_alive != 0:
+        print("FAIL: preset state is leaking")
+        sys.exit(1)
+
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
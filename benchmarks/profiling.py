@@ -0,0 +1,70 @@
+import os
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pygame_ui_toolkit.elements import manager
+from pygame_ui_toolkit.presets import button_colour_change
+from pygame_ui_toolkit import input_state
+from pygame_ui_toolkit import profiling
+
+
+NUM_BUTTONS = 400
+NUM_COLUMNS = 20
+NUM_FRAMES = 200
+
+
+pygame.init()
+window = pygame.display.set_mode((1000, 1000))
+
+
+def create_buttons():
+    """Return a grid of buttons that change colour when hovered over or clicked on (so their callbacks are called every frame)."""
+    buttons = []
+    for i in range(NUM_BUTTONS):
+        x = 30 + (i % NUM_COLUMNS) * 48
+        y = 30 + (i // NUM_COLUMNS) * 48
+
+        buttons.append(button_colour_change.create_button((200, 200, 200), (150, 150, 150), (100, 100, 100), window, x, y, 40, 40))
+
+    return buttons
+
+
+def time_frames(ui_manager):
+    """Return the average time (in microseconds) of updating and drawing every element in the manager."""
+    input_state.set_state(input_state.InputState((500, 500), (False, False, False)))
+
+    def frame():
+        ui_manager.update_elements([])
+        ui_manager.draw_elements()
+
+        if profiling.active_profiler != None:
+            profiling.active_profiler.end_frame()
+
+    total = timeit.timeit(frame, number=NUM_FRAMES)
+    input_state.set_state(None)
+
+    return total / NUM_FRAMES * 1e6
+
+
+def main():
+    ui_manager = manager.UIManager(create_buttons())
+
+    disabled_us = time_frames(ui_manager)
+
+    profiler = profiling.enable()
+    enabled_us = time_frames(ui_manager)
+    profiling.disable()
+
+    print(f"{NUM_BUTTONS} buttons per frame:")
+    print(f"    profiling disabled: {disabled_us :.0f} us")
+    print(f"    profiling enabled:  {enabled_us :.0f} us")
+    print()
+
+    for line in profiling.get_overlay_lines(profiler):
+        print(f"    {line}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import os
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pygame_ui_toolkit.elements import button
+from pygame_ui_toolkit.elements import text
+from pygame_ui_toolkit.elements import manager
+
+
+NUM_FRAMES = 200
+NUM_COLUMNS = 20
+NUM_ROWS = 20
+
+
+pygame.init()
+window = pygame.display.set_mode((1000, 1000))
+
+
+def create_buttons():
+    """Return a grid of rounded text buttons (each drawn with two blits)."""
+    buttons = []
+    for i in range(NUM_COLUMNS * NUM_ROWS):
+        x = 30 + (i % NUM_COLUMNS) * 48
+        y = 30 + (i // NUM_COLUMNS) * 48
+
+        btn = button.RectButton(window, x, y, (200, 200, 200), 40, 40, corner_radius=8)
+        buttons.append(button.TextWrapper(btn, str(i), (0, 0, 0), 20))
+
+    return buttons
+
+
+def time_draw(ui_manager):
+    """Return the average time (in microseconds) of drawing every element in the manager."""
+    total = timeit.timeit(ui_manager.draw_elements, number=NUM_FRAMES)
+
+    return total / NUM_FRAMES * 1e6
+
+
+def main():
+    num_elements = NUM_COLUMNS * NUM_ROWS
+
+    unbatched = manager.UIManager(create_buttons())
+    batched = manager.UIManager(create_buttons(), batch_draws=True)
+
+    unbatched_us = time_draw(unbatched)
+    batched_us = time_draw(batched)
+
+    print(f"drawing {num_elements} text buttons:")
+    print(f"    element.draw() each:    {unbatched_us :.0f} us")
+    print(f"    batched render queue:   {batched_us :.0f} us {batched.draw_queue.get_stats()}")
+
+    # An opaque panel on top of half of the buttons (added first, but with a higher z order)
+    panel = text.RectTextBox(window, 500, 250, 1000, 500, "panel", (50, 50, 50), (255, 255, 255), 40)
+
+    unbatched = manager.UIManager()
+    unbatched.add(panel, z=1)
+    unbatched.add(*create_buttons())
+
+    batched = manager.UIManager(batch_draws=True)
+    batched.add(panel, z=1)
+    batched.add(*create_buttons())
+
+    unbatched_us = time_draw(unbatched)
+    batched_us = time_draw(batched)
+
+    print()
+    print(f"drawing {num_elements} text buttons, half covered by a panel:")
+    print(f"    element.draw() each:    {unbatched_us :.0f} us")
+    print(f"    batched render queue:   {batched_us :.0f} us {batched.draw_queue.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
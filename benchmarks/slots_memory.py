@@ -0,0 +1,132 @@
+import os
+import re
+import types
+import timeit
+import inspect
+import importlib
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+
+NUM_ELEMENTS = 2000
+NUM_FRAMES = 200
+
+# The element modules in the order they import each other
+MODULE_NAMES = ("button", "text", "slider", "toggle", "dropdown", "input")
+
+
+pygame.init()
+window = pygame.display.set_mode((500, 500))
+
+
+def load_modules(slotted):
+    """
+    Return a dict of the element modules.
+
+    If slotted is False, the modules are compiled again from their source with the __slots__ lines removed, so every element stores its attributes in a __dict__ (like before __slots__ were added).
+    """
+    modules = {}
+    for name in MODULE_NAMES:
+        real_module = importlib.import_module(f"pygame_ui_toolkit.elements.{name}")
+
+        if slotted:
+            modules[name] = real_module
+            continue
+
+        source = re.sub(r"^ *__slots__ = .*$", "", inspect.getsource(real_module), flags=re.MULTILINE)
+
+        module = types.ModuleType(f"unslotted_{name}")
+        exec(compile(source, real_module.__file__, "exec"), module.__dict__)
+
+        # Make the module use the other unslotted modules instead of the real ones
+        for other_name, other_module in modules.items():
+            if other_name in module.__dict__:
+                setattr(module, other_name, other_module)
+
+        modules[name] = module
+
+    return modules
+
+
+def get_factories(modules):
+    """Return a dict of functions that each create an element when given its index."""
+    button = modules["button"]
+    text = modules["text"]
+    slider = modules["slider"]
+    toggle = modules["toggle"]
+    dropdown = modules["dropdown"]
+    text_input = modules["input"]
+
+    return {
+        "RectButton": lambda i: button.RectButton(window, i % 500, 50, (255, 255, 255), 40, 20),
+        "CircleButton": lambda i: button.CircleButton(window, i % 500, 100, (255, 255, 255), 10),
+        "PolygonButton": lambda i: button.PolygonButton(window, [(0, 0), (40, 0), (20, 30)], (255, 255, 255)),
+        "BorderedRectButton": lambda i: button.BorderedRectButton(window, i % 500, 150, (255, 255, 255), (0, 0, 0), 40, 20, 2),
+        "RectTextBox": lambda i: text.RectTextBox(window, 100, 200, 100, 30, "text", (255, 255, 255), (0, 0, 0), 20),
+        "HorizontalSlider": lambda i: slider.HorizontalSlider(window, 200, 10, 250, 250, 0, 100, i % 100, (200, 200, 200)),
+        "TickBox": lambda i: toggle.TickBox(window, 3, (0, 0, 0), 100, 300, (255, 255, 255), 20),
+        "RectDropdown": lambda i: dropdown.RectDropdown(window, ["a", "b", "c"], 300, 50, (255, 255, 255), 80, 20, (0, 0, 0), 20),
+        "RectTextInput": lambda i: text_input.RectTextInput(window, 100, 400, (255, 255, 255), 100, 30, (0, 0, 0), 20),
+    }
+
+
+def measure_memory(factory):
+    """Return the average traced memory (in bytes) used by each element that factory creates."""
+    # Create one element first so the shared font and shape caches are already filled
+    factory(0)
+
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+
+    elements = [factory(i) for i in range(NUM_ELEMENTS)]
+
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del elements
+
+    return (end - start) / NUM_ELEMENTS
+
+
+def time_update_state(modules):
+    """Return the average time (in nanoseconds) of calling update_state() on a RectButton."""
+    buttons = [modules["button"].RectButton(window, i % 500, (i // 500) * 25, (255, 255, 255), 20, 20) for i in range(NUM_ELEMENTS)]
+
+    def frame():
+        for i in buttons:
+            i.update_state()
+
+    return timeit.timeit(frame, number=NUM_FRAMES) / (NUM_FRAMES * NUM_ELEMENTS) * 1e9
+
+
+def main():
+    slotted_modules = load_modules(True)
+    unslotted_modules = load_modules(False)
+
+    slotted_factories = get_factories(slotted_modules)
+    unslotted_factories = get_factories(unslotted_modules)
+
+    print(f"memory per element ({NUM_ELEMENTS} of each):")
+    print(f"{'':>20} {'__dict__':>10} {'__slots__':>10} {'saved':>8}")
+
+    for name, factory in slotted_factories.items():
+        unslotted_bytes = measure_memory(unslotted_factories[name])
+        slotted_bytes = measure_memory(factory)
+
+        saved = 1 - slotted_bytes / unslotted_bytes
+
+        print(f"{name:>20} {unslotted_bytes :>8.0f} B {slotted_bytes :>8.0f} B {saved :>8.0%}")
+
+    unslotted_ns = time_update_state(unslotted_modules)
+    slotted_ns = time_update_state(slotted_modules)
+
+    print()
+    print(f"RectButton.update_state() with __dict__:  {unslotted_ns :.0f} ns")
+    print(f"RectButton.update_state() with __slots__: {slotted_ns :.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
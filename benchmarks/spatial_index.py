@@ -0,0 +1,79 @@
+import os
+import random
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pygame_ui_toolkit.elements import button, manager
+from pygame_ui_toolkit import input_state
+from pygame_ui_toolkit import spatial
+
+
+NUM_BUTTONS = 10000
+GRID_WIDTH = 100
+BUTTON_SIZE = 8
+SPACING = 10
+
+NUM_QUERIES = 2000
+NUM_FRAMES = 20
+
+
+pygame.init()
+window = pygame.display.set_mode((GRID_WIDTH * SPACING, NUM_BUTTONS // GRID_WIDTH * SPACING))
+
+
+def create_buttons():
+    buttons = []
+    for i in range(NUM_BUTTONS):
+        x = (i % GRID_WIDTH) * SPACING + SPACING // 2
+        y = (i // GRID_WIDTH) * SPACING + SPACING // 2
+
+        buttons.append(button.RectButton(window, x, y, (255, 255, 255), BUTTON_SIZE, BUTTON_SIZE))
+
+    return buttons
+
+
+def time_queries(buttons, points):
+    """Return the average time (in microseconds) of a linear scan and a grid query for the buttons containing a point."""
+    grid = spatial.SpatialGrid()
+
+    for i in buttons:
+        grid.insert(i)
+
+    linear = timeit.timeit(lambda: [[b for b in buttons if b.contains_point(x, y)] for x, y in points], number=1)
+    indexed = timeit.timeit(lambda: [grid.elements_at(x, y) for x, y in points], number=1)
+
+    for i in buttons:
+        grid.remove(i)
+
+    return linear / len(points) * 1e6, indexed / len(points) * 1e6
+
+
+def time_update_pass(use_spatial_index):
+    """Return the average time (in milliseconds) of a manager update pass over every button."""
+    ui_manager = manager.UIManager(create_buttons(), use_spatial_index)
+
+    input_state.set_state(input_state.InputState((505, 505), (False, False, False)))
+    total = timeit.timeit(lambda: ui_manager.update_elements([]), number=NUM_FRAMES)
+    input_state.set_state(None)
+
+    return total / NUM_FRAMES * 1e3
+
+
+def main():
+    buttons = create_buttons()
+    width, height = window.get_size()
+    points = [(random.randrange(width), random.randrange(height)) for _ in range(NUM_QUERIES)]
+
+    linear_us, indexed_us = time_queries(buttons, points)
+
+    print(f"{NUM_BUTTONS} buttons")
+    print(f"point query, linear scan:        {linear_us :.1f} us")
+    print(f"point query, spatial grid:       {indexed_us :.1f} us")
+    print(f"UIManager update pass, no index: {time_update_pass(False) :.2f} ms")
+    print(f"UIManager update pass, index:    {time_update_pass(True) :.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
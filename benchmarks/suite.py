@@ -0,0 +1,322 @@
+import os
+import sys
+import json
+import math
+import argparse
+import platform
+import statistics
+import tracemalloc
+from time import perf_counter
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pygame_ui_toolkit.elements import button
+from pygame_ui_toolkit.elements import slider
+from pygame_ui_toolkit.elements import dropdown
+from pygame_ui_toolkit.elements import input
+from pygame_ui_toolkit.elements import toggle
+from pygame_ui_toolkit.elements import manager
+from pygame_ui_toolkit import input_state
+from pygame_ui_toolkit import hit_test
+from pygame_ui_toolkit import fonts
+from pygame_ui_toolkit import shapes
+from pygame_ui_toolkit import text_surfaces
+from pygame_ui_toolkit import images
+
+
+WINDOW_SIZE = 1000
+
+DEFAULT_COUNT = 100
+DEFAULT_FRAMES = 300
+
+# The mouse moves to a new element every FRAMES_PER_ELEMENT frames, and is held down for the last CLICK_FRAMES of them
+FRAMES_PER_ELEMENT = 6
+CLICK_FRAMES = 2
+
+# A key is pressed every KEY_INTERVAL frames, and every BACKSPACE_INTERVAL-th key is a backspace
+KEY_INTERVAL = 2
+BACKSPACE_INTERVAL = 4
+
+IMAGE_PATHS = [os.path.join(os.path.dirname(__file__), "..", "examples", "images", f"smile{i}.png") for i in (1, 2, 3)]
+
+BACKGROUND_COLOUR = (200, 200, 200)
+FONT_COLOUR = (0, 0, 0)
+FONT_SIZE = 20
+
+
+def create_rect_button(surface, x, y, size):
+    return button.RectButton(surface, x, y, BACKGROUND_COLOUR, size, size * 2 // 3, corner_radius=size // 8)
+
+
+def create_polygon_button(surface, x, y, size):
+    points = [(x, y - size // 2), (x + size // 2, y), (x + size // 4, y + size // 2), (x - size // 4, y + size // 2), (x - size // 2, y)]
+
+    return button.PolygonButton(surface, points, BACKGROUND_COLOUR)
+
+
+def create_image_button(surface, x, y, size):
+    """Return an image button whose callbacks change its image when it is hovered over or clicked on."""
+    on_click = lambda btn: btn.update_image(IMAGE_PATHS[2])
+    on_hover = lambda btn: btn.update_image(IMAGE_PATHS[1])
+    on_normal = lambda btn: btn.update_image(IMAGE_PATHS[0])
+
+    return button.ImageButton(surface, x, y, size, size, IMAGE_PATHS[0], on_click, on_hover, on_normal, False)
+
+
+def create_text_wrapper(surface, x, y, size):
+    return button.TextWrapper(create_rect_button(surface, x, y, size), f"{x},{y}", FONT_COLOUR, FONT_SIZE)
+
+
+def create_horizontal_slider(surface, x, y, size):
+    return slider.HorizontalSlider(surface, size, size // 10, x, y, 0, 100, 50, BACKGROUND_COLOUR)
+
+
+def create_rect_dropdown(surface, x, y, size):
+    return dropdown.RectDropdown(surface, ["one", "two", "three"], x, y - size // 3, BACKGROUND_COLOUR, size, size // 4, FONT_COLOUR, FONT_SIZE, y_offset=0)
+
+
+def create_rect_text_input(surface, x, y, size):
+    return input.RectTextInput(surface, x, y, BACKGROUND_COLOUR, size, size // 2, FONT_COLOUR, FONT_SIZE)
+
+
+def create_tick_box_toggle(surface, x, y, size):
+    return toggle.TickBoxToggle(surface, 2, FONT_COLOUR, (255, 255, 255), BACKGROUND_COLOUR, x, y, size, size // 2, "tick", FONT_COLOUR, FONT_SIZE // 2)
+
+
+# The element types that are benchmarked, and a function that returns one of them centred on x, y and fitting in a size x size cell
+ELEMENT_FACTORIES = {
+    "RectButton": create_rect_button,
+    "PolygonButton": create_polygon_button,
+    "ImageButton": create_image_button,
+    "TextWrapper": create_text_wrapper,
+    "HorizontalSlider": create_horizontal_slider,
+    "RectDropdown": create_rect_dropdown,
+    "RectTextInput": create_rect_text_input,
+    "TickBoxToggle": create_tick_box_toggle
+}
+
+
+def get_cell_centres(count):
+    """Return the size of each cell, and the centre of each of count cells in a square grid covering the window."""
+    num_columns = math.ceil(math.sqrt(count))
+    size = WINDOW_SIZE // num_columns
+
+    return size, [((i % num_columns) * size + size // 2, (i // num_columns) * size + size // 2) for i in range(count)]
+
+
+def create_inputs(centres, num_frames):
+    """
+    Return the synthetic input state for each frame.
+
+    The mouse visits each cell centre in turn (moving slightly every frame), clicking on it before moving on. Keys are typed regularly, with some backspaces.
+    """
+    states = []
+    prev_buttons = (False, False, False)
+
+    for frame in range(num_frames):
+        x, y = centres[frame // FRAMES_PER_ELEMENT % len(centres)]
+        x += frame % 3 - 1
+
+        held = frame % FRAMES_PER_ELEMENT >= FRAMES_PER_ELEMENT - CLICK_FRAMES
+        buttons = (held, False, False)
+
+        events = [pygame.event.Event(pygame.MOUSEMOTION, pos=(x, y), rel=(1, 0), buttons=buttons)]
+
+        if buttons != prev_buttons:
+            event_type = pygame.MOUSEBUTTONDOWN if held else pygame.MOUSEBUTTONUP
+            events.append(pygame.event.Event(event_type, pos=(x, y), button=1))
+
+        if frame % KEY_INTERVAL == 0:
+            if frame // KEY_INTERVAL % BACKSPACE_INTERVAL == BACKSPACE_INTERVAL - 1:
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_BACKSPACE, unicode="\b", mod=0))
+            else:
+                char = chr(ord("a") + frame % 26)
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=ord(char), unicode=char, mod=0))
+
+        states.append(input_state.InputState((x, y), buttons, events, prev_buttons))
+        prev_buttons = buttons
+
+    return states
+
+
+def run_frame(ui_manager, surface, state):
+    """Update and draw every element for one frame with the input state, and return the update and draw times (in seconds)."""
+    input_state.set_state(state)
+
+    surface.fill((0, 0, 0))
+
+    ui_manager.update_elements(state.events)
+    ui_manager.draw_elements()
+
+    return ui_manager.update_time, ui_manager.draw_time
+
+
+def summarise_times(times):
+    """Return the mean, median, 95th percentile and maximum of a list of times in seconds, in milliseconds."""
+    ordered = sorted(times)
+
+    return {
+        "mean": statistics.fmean(ordered) * 1e3,
+        "median": statistics.median(ordered) * 1e3,
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1e3,
+        "max": ordered[-1] * 1e3
+    }
+
+
+def reset_counters():
+    """Empty the shared caches and reset the hit test counters, so each benchmark starts from the same state."""
+    fonts.clear()
+    shapes.clear()
+    text_surfaces.clear()
+    images.clear()
+    hit_test.reset_stats()
+
+
+def benchmark_element(name, count, num_frames, batch_draws):
+    """Return the results of updating and drawing count elements of a type for num_frames frames."""
+    reset_counters()
+
+    surface = pygame.display.get_surface()
+    size, centres = get_cell_centres(count)
+
+    start = perf_counter()
+    elements = [ELEMENT_FACTORIES[name](surface, x, y, size) for x, y in centres]
+    ui_manager = manager.UIManager(elements, batch_draws=batch_draws)
+    construct_time = perf_counter() - start
+
+    states = create_inputs(centres, num_frames)
+
+    # The font, image, shape and text counters only count the work done by the frames, not the construction of the elements
+    font_loads = fonts.get_stats()["misses"]
+    image_loads = images.get_stats()["misses"]
+    shape_renders = shapes.get_stats()["misses"]
+    text_renders = text_surfaces.get_stats()["misses"]
+    hit_test.reset_stats()
+
+    update_times = []
+    draw_times = []
+
+    for state in states:
+        update_time, draw_time = run_frame(ui_manager, surface, state)
+
+        update_times.append(update_time)
+        draw_times.append(draw_time)
+
+    frame_stats = {
+        "font_loads": fonts.get_stats()["misses"] - font_loads,
+        "image_loads": images.get_stats()["misses"] - image_loads,
+        "shape_renders": shapes.get_stats()["misses"] - shape_renders,
+        "text_renders": text_surfaces.get_stats()["misses"] - text_renders,
+        "hit_tests": hit_test.get_stats()
+    }
+
+    # The frames are run again with tracemalloc, since tracing slows everything down
+    tracemalloc.start()
+
+    frame_peaks = []
+    start_size, _ = tracemalloc.get_traced_memory()
+
+    for state in states:
+        frame_start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        run_frame(ui_manager, surface, state)
+
+        _, peak = tracemalloc.get_traced_memory()
+        frame_peaks.append(peak - frame_start)
+
+    end_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    input_state.set_state(None)
+
+    return {
+        "count": count,
+        "frames": num_frames,
+        "construct_ms": construct_time * 1e3,
+        "update_ms": summarise_times(update_times),
+        "draw_ms": summarise_times(draw_times),
+        "frame_ms": summarise_times([u + d for u, d in zip(update_times, draw_times)]),
+        "alloc_peak_kib": {
+            "mean": statistics.fmean(frame_peaks) / 1024,
+            "max": max(frame_peaks) / 1024
+        },
+        "retained_kib": (end_size - start_size) / 1024,
+        **frame_stats
+    }
+
+
+def run_suite(names, count, num_frames, batch_draws):
+    """Return the results of every benchmark, along with the details needed to compare them across runs."""
+    results = {}
+    for name in names:
+        results[name] = benchmark_element(name, count, num_frames, batch_draws)
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "sdl": ".".join(str(i) for i in pygame.get_sdl_version()),
+            "platform": platform.platform(),
+            "video_driver": pygame.display.get_driver()
+        },
+        "settings": {
+            "count": count,
+            "frames": num_frames,
+            "batch_draws": batch_draws
+        },
+        "results": results
+    }
+
+
+def print_table(suite_results):
+    settings = suite_results["settings"]
+
+    print(f"{settings['count']} elements, {settings['frames']} frames (batch_draws={settings['batch_draws']})")
+    print(f"{'element':<18} {'update ms':>10} {'draw ms':>10} {'p95 ms':>10} {'alloc KiB':>10} {'fonts':>6} {'shapes':>7} {'texts':>6}")
+
+    for name, result in suite_results["results"].items():
+        print(f"{name:<18} {result['update_ms']['mean'] :>10.3f} {result['draw_ms']['mean'] :>10.3f} {result['frame_ms']['p95'] :>10.3f} {result['alloc_peak_kib']['mean'] :>10.1f} {result['font_loads'] :>6} {result['shape_renders'] :>7} {result['text_renders'] :>6}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Update and draw many of each element with synthetic input, without a window, and report the cost of each frame.")
+    parser.add_argument("elements", nargs="*", help=f"the element types to benchmark, from {', '.join(ELEMENT_FACTORIES)} (defaults to all of them)")
+    parser.add_argument("-n", "--count", type=int, default=DEFAULT_COUNT, help=f"the number of each element (defaults to {DEFAULT_COUNT})")
+    parser.add_argument("-f", "--frames", type=int, default=DEFAULT_FRAMES, help=f"the number of frames (defaults to {DEFAULT_FRAMES})")
+    parser.add_argument("-b", "--batch-draws", action="store_true", help="draw through the manager's render queue")
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file ('-' for stdout instead of the table)")
+
+    args = parser.parse_args()
+
+    for name in args.elements:
+        if name not in ELEMENT_FACTORIES:
+            parser.error(f"unknown element type {name}")
+
+    return args
+
+
+def main():
+    args = parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((WINDOW_SIZE, WINDOW_SIZE))
+
+    names = args.elements or list(ELEMENT_FACTORIES)
+    suite_results = run_suite(names, args.count, args.frames, args.batch_draws)
+
+    if args.output == "-":
+        json.dump(suite_results, sys.stdout, indent=4)
+        print()
+        return
+
+    print_table(suite_results)
+
+    if args.output != None:
+        with open(args.output, "w") as file:
+            json.dump(suite_results, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
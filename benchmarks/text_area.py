@@ -0,0 +1,64 @@
+import os
+from time import perf_counter
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pygame_ui_toolkit.elements import text_area
+
+
+LINE_COUNTS = (1000, 10000, 100000)
+NUM_FRAMES = 300
+
+# The number of rows scrolled each frame, and the number of frames between lines being added to the end
+SCROLL_ROWS = 3
+APPEND_INTERVAL = 3
+
+
+pygame.init()
+window = pygame.display.set_mode((600, 600))
+
+
+def create_text(num_lines):
+    """Return num_lines lines of text, some of which are long enough to be wrapped."""
+    return "\n".join(f"{i}: lorem ipsum dolor sit amet" + " consectetur" * (i % 9) for i in range(num_lines))
+
+
+def time_frames(text_area_obj, frame_func):
+    """Return the average time (in microseconds) of calling frame_func() and drawing the text area (not including filling the window)."""
+    total = 0
+
+    for i in range(NUM_FRAMES):
+        window.fill((0, 0, 0))
+
+        start = perf_counter()
+        frame_func(i)
+        text_area_obj.update([])
+        total += perf_counter() - start
+
+    return total / NUM_FRAMES * 1e6
+
+
+def main():
+    print(f"updating and drawing a 560x560 text area for {NUM_FRAMES} frames:")
+
+    for num_lines in LINE_COUNTS:
+        text = create_text(num_lines)
+
+        start = perf_counter()
+        text_area_obj = text_area.TextArea(window, 300, 300, 560, 560, (255, 255, 255), (0, 0, 0), 18, text=text, scrollbar_colour=(150, 150, 150))
+        create_ms = (perf_counter() - start) * 1e3
+
+        text_area_obj.scroll_to_line(num_lines // 2)
+
+        scroll_us = time_frames(text_area_obj, lambda i: text_area_obj.scroll(SCROLL_ROWS))
+        idle_us = time_frames(text_area_obj, lambda i: None)
+
+        text_area_obj.scroll_to_end()
+        append_us = time_frames(text_area_obj, lambda i: i % APPEND_INTERVAL == 0 and text_area_obj.append_text(f"log line {i}"))
+
+        print(f"    {num_lines :>6} lines:  create {create_ms :>5.1f} ms,  scrolling {scroll_us :>5.0f} us/frame,  idle {idle_us :>5.0f} us/frame,  logging {append_us :>5.0f} us/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import os
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pygame_ui_toolkit.elements import button
+from pygame_ui_toolkit import text_surfaces
+
+
+NUM_CALLS = 20000
+
+# Strings that a label switches between, like a toggle or dropdown selection
+LABELS = ("ON", "OFF", "Easy", "Medium", "Hard", "Very hard")
+
+
+pygame.init()
+window = pygame.display.set_mode((500, 500))
+
+
+def time_label_switches(clear_cache):
+    """Return the average time (in nanoseconds) of changing the text of a TextWrapper to the next label, optionally clearing the text cache before each change."""
+    btn = button.RectButton(window, 250, 250, (255, 255, 255), 200, 50)
+    text_button = button.TextWrapper(btn, LABELS[0], (0, 0, 0), 30)
+
+    index = 0
+
+    def switch():
+        nonlocal index
+
+        index = (index + 1) % len(LABELS)
+
+        if clear_cache:
+            text_surfaces.clear()
+
+        text_button.update_text(LABELS[index], (0, 0, 0), 30, None)
+
+    total = timeit.timeit(switch, number=NUM_CALLS)
+
+    return total / NUM_CALLS * 1e9
+
+
+def fill_cache(num_strings, font_size):
+    """Render num_strings different strings and return the text cache stats."""
+    btn = button.RectButton(window, 250, 250, (255, 255, 255), 200, 50)
+    text_button = button.TextWrapper(btn, "", (0, 0, 0), font_size)
+
+    for i in range(num_strings):
+        text_button.update_text(f"label number {i}", (0, 0, 0), font_size, None)
+
+    return text_surfaces.get_stats()
+
+
+def main():
+    uncached_ns = time_label_switches(True)
+
+    text_surfaces.clear()
+    cached_ns = time_label_switches(False)
+
+    print(f"switching between {len(LABELS)} labels:")
+    print(f"    without the text cache: {uncached_ns :.0f} ns")
+    print(f"    with the text cache:    {cached_ns :.0f} ns")
+    print(f"    {text_surfaces.get_stats()}")
+
+    for font_size in (20, 100):
+        text_surfaces.clear()
+        stats = fill_cache(2000, font_size)
+
+        print()
+        print(f"2000 different strings at font size {font_size}:")
+        print(f"    {stats['size']} surfaces cached, {stats['bytes'] / 1024 :.0f} KiB of {stats['max_bytes'] / 1024 :.0f} KiB, {stats['evictions']} evictions")
+
+
+if __name__ == "__main__":
+    main()
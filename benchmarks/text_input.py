@@ -0,0 +1,64 @@
+import os
+from time import perf_counter
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pygame_ui_toolkit.elements import input
+from pygame_ui_toolkit import text_surfaces
+
+
+TEXT_LENGTHS = (0, 1000, 4000, 16000)
+NUM_KEYS = 200
+
+
+pygame.init()
+window = pygame.display.set_mode((1000, 200))
+
+
+def create_key_events(text):
+    """Return a KEYDOWN event for each character of text."""
+    return [pygame.event.Event(pygame.KEYDOWN, key=ord(char), unicode=char, mod=0) for char in text]
+
+
+def time_typing(text_length, cursor_position):
+    """
+    Return the average time (in microseconds) of updating and drawing a text input for each key press (not including filling the window), and the average number of text surfaces rendered.
+
+    The input starts with text_length characters, and the keys are typed at cursor_position (a fraction of the way through the text).
+    """
+    text_surfaces.clear()
+
+    text_input = input.RectTextInput(window, 500, 100, (255, 255, 255), 400, 60, (0, 0, 0), 32, text="x" * text_length)
+    text_input.selected = True
+    text_input.buffer.move_cursor(int(text_length * cursor_position))
+
+    text_input.update([])
+
+    events = create_key_events("abcdefghij" * (NUM_KEYS // 10))
+    text_renders = text_surfaces.get_stats()["misses"]
+
+    total = 0
+
+    for event in events:
+        window.fill((0, 0, 0))
+
+        start = perf_counter()
+        text_input.update([event])
+        total += perf_counter() - start
+
+    return total / NUM_KEYS * 1e6, (text_surfaces.get_stats()["misses"] - text_renders) / NUM_KEYS
+
+
+def main():
+    print(f"typing {NUM_KEYS} keys into a text input:")
+
+    for text_length in TEXT_LENGTHS:
+        end_us, end_renders = time_typing(text_length, 1)
+        middle_us, middle_renders = time_typing(text_length, 0.5)
+
+        print(f"    {text_length :>6} characters:  at the end {end_us :>7.0f} us/key ({end_renders :.1f} renders),  in the middle {middle_us :>7.0f} us/key ({middle_renders :.1f} renders)")
+
+
+if __name__ == "__main__":
+    main()
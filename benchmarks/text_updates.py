@@ -0,0 +1,108 @@
+import os
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pygame_ui_toolkit.elements import text
+from pygame_ui_toolkit.elements import toggle
+from pygame_ui_toolkit.elements import button
+from pygame_ui_toolkit.presets import slider_value_text
+from pygame_ui_toolkit import utils
+
+
+NUM_CALLS = 20000
+
+# The slider is dragged from 0 to 100 in steps of DRAG_STEP
+DRAG_STEP = 0.05
+
+
+pygame.init()
+window = pygame.display.set_mode((500, 500))
+
+
+def time_per_call(func, num_calls):
+    """Return the average time (in nanoseconds) of calling func."""
+    total = timeit.timeit(func, number=num_calls)
+
+    return total / num_calls * 1e9
+
+
+def time_text_box():
+    """Return the average time of TextBox.update_text() when the text is unchanged and when it changes every call, along with the time of rendering the text directly."""
+    box = text.RectTextBox(window, 250, 250, 200, 50, "0", (255, 255, 255), (0, 0, 0), 30)
+    counter = iter(range(NUM_CALLS * 2))
+
+    unchanged_ns = time_per_call(lambda: box.update_text("1234", (0, 0, 0), 30, None), NUM_CALLS)
+    changed_ns = time_per_call(lambda: box.update_text(str(next(counter)), (0, 0, 0), 30, None), NUM_CALLS)
+    render_ns = time_per_call(lambda: box.font.render("1234", False, (0, 0, 0)), NUM_CALLS)
+
+    return unchanged_ns, changed_ns, render_ns
+
+
+def time_text_toggle():
+    """Return the average time of drawing the text of a TextToggle each frame, and the number of times its text was rendered."""
+    btn = button.RectButton(window, 250, 250, (255, 255, 255), 40, 40)
+    text_toggle = toggle.TextToggle(btn, "text toggle", 350, 250, (0, 0, 0), 30)
+
+    num_renders = 0
+    last_surface = text_toggle.text_surface
+
+    def frame():
+        nonlocal num_renders, last_surface
+
+        text_toggle.blit_text()
+
+        if text_toggle.text_surface is not last_surface:
+            num_renders += 1
+            last_surface = text_toggle.text_surface
+
+    draw_ns = time_per_call(frame, NUM_CALLS)
+
+    return draw_ns, num_renders
+
+
+def drag_slider(int_only):
+    """Return the average time of each on_value_changed() call while dragging a slider, and the number of times the text was rendered."""
+    slider_object = slider_value_text.create_slider_text(window, 250, 250, 250, 300, 200, 10, 0, 100, 0, (255, 255, 255), None, 30, (0, 0, 0), int_only=int_only)
+    variables = utils.get_preset_variables(slider_object, slider_value_text.PRESET_NAME)
+
+    values = [i * DRAG_STEP for i in range(1, int(100 / DRAG_STEP) + 1)]
+    num_renders = 0
+
+    def drag():
+        nonlocal num_renders
+
+        for i in values:
+            last_surface = variables["text_surface"]
+            slider_value_text.on_value_changed(i, slider_object)
+
+            if variables["text_surface"] is not last_surface:
+                num_renders += 1
+
+    total = timeit.timeit(drag, number=1)
+
+    return total / len(values) * 1e9, len(values), num_renders
+
+
+def main():
+    unchanged_ns, changed_ns, render_ns = time_text_box()
+
+    print(f"font.render() per call:                   {render_ns :.0f} ns")
+    print(f"TextBox.update_text() with the same text: {unchanged_ns :.0f} ns")
+    print(f"TextBox.update_text() with new text:      {changed_ns :.0f} ns")
+
+    draw_ns, num_renders = time_text_toggle()
+
+    print()
+    print(f"TextToggle.blit_text() per frame: {draw_ns :.0f} ns ({num_renders} renders in {NUM_CALLS} frames)")
+
+    print()
+    for int_only in (True, False):
+        call_ns, num_calls, num_renders = drag_slider(int_only)
+
+        print(f"slider drag (int_only={int_only}): {call_ns :.0f} ns per value change, {num_renders} renders for {num_calls} value changes")
+
+
+if __name__ == "__main__":
+    main()
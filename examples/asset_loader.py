@@ -0,0 +1,70 @@
+import pygame
+from os import getcwd
+from pygame_ui_toolkit.elements import button, manager
+from pygame_ui_toolkit import assets
+
+
+IMG_PATHS = [f"{getcwd()}\\examples\\images\\smile{i}.png" for i in range(1, 4)]
+
+FONT_SIZE = 32
+
+BAR_COLOUR = (255, 255, 255)
+BACKGROUND_COLOUR = (0, 0, 0)
+
+GRID_SIZE = 4
+BUTTON_SIZE = 80
+
+
+pygame.init()
+window = pygame.display.set_mode((500, 500))
+pygame.display.set_caption("Asset loader")
+
+
+def create_buttons(loader):
+    # The images are loaded on the loader's threads, and each button shows a grey placeholder until its image is ready
+    buttons = []
+
+    for i in range(GRID_SIZE):
+        for j in range(GRID_SIZE):
+            x = 100 + i * (BUTTON_SIZE + 20)
+            y = 100 + j * (BUTTON_SIZE + 20)
+
+            buttons.append(button.ImageButton(window, x, y, BUTTON_SIZE, BUTTON_SIZE, IMG_PATHS[0], click_once=False, hover_image_path=IMG_PATHS[1], click_image_path=IMG_PATHS[2], loader=loader))
+
+    return buttons
+
+
+def draw_progress_bar(loader):
+    width = int(400 * loader.get_progress())
+
+    pygame.draw.rect(window, BAR_COLOUR, (50, 475, width, 10))
+
+
+def main():
+    loader = assets.AssetLoader()
+    loader.load_font(None, FONT_SIZE)
+
+    ui_manager = manager.UIManager(create_buttons(loader))
+
+    while True:
+        # Finish any loads that have completed (this must happen on the main thread)
+        loader.update()
+
+        window.fill(BACKGROUND_COLOUR)
+
+        event_loop = pygame.event.get()
+        ui_manager.update(event_loop)
+
+        if not loader.is_done():
+            draw_progress_bar(loader)
+
+        pygame.display.update()
+
+        for event in event_loop:
+            if event.type == pygame.QUIT:
+                loader.shutdown()
+                quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import pygame
+from pygame_ui_toolkit.elements import button_array
+
+
+CLICK_COLOUR = (255, 0, 0)
+HOVER_COLOUR = (0, 0, 255)
+NORMAL_COLOUR = (0, 255, 0)
+SELECTED_COLOUR = (255, 255, 0)
+
+NUM_COLUMNS = 40
+NUM_ROWS = 40
+
+BUTTON_SIZE = 10
+GAP = 2
+
+
+pygame.init()
+window = pygame.display.set_mode((500, 500))
+pygame.display.set_caption("Button array")
+
+
+selected = set()
+
+
+def get_colour(index):
+    if index in selected:
+        return SELECTED_COLOUR
+    else:
+        return NORMAL_COLOUR
+
+
+def on_click(index, grid):
+    if index in selected:
+        selected.remove(index)
+    else:
+        selected.add(index)
+
+    grid.background_colours[index] = CLICK_COLOUR
+
+
+def on_hover(index, grid):
+    grid.background_colours[index] = HOVER_COLOUR
+
+
+def on_normal(index, grid):
+    grid.background_colours[index] = get_colour(index)
+
+
+def main():
+    grid = button_array.create_grid(window, 16, 16, NUM_COLUMNS, NUM_ROWS, BUTTON_SIZE, BUTTON_SIZE, NORMAL_COLOUR, GAP, GAP, on_click, on_hover, on_normal)
+
+    while True:
+        window.fill((0, 0, 0))
+        grid.update()
+        pygame.display.update()
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -16,21 +16,9 @@ window = pygame.display.set_mode((500, 500))
 pygame.display.set_caption("Image buttons")
 
 
-def on_click(btn):
-    btn.update_image(CLICK_IMG_PATH)
-
-
-def on_hover(btn):
-    btn.update_image(HOVER_IMG_PATH)
-
-
-
-def on_normal(btn):
-    btn.update_image(NORMAL_IMG_PATH)
-
-
 def create_button():
-    btn = button.ImageButton(window, 250, 250, WIDTH, HEIGHT, NORMAL_IMG_PATH, on_click, on_hover, on_normal, False)
+    # The hover and click images are loaded when the button is created, and shown automatically
+    btn = button.ImageButton(window, 250, 250, WIDTH, HEIGHT, NORMAL_IMG_PATH, click_once=False, hover_image_path=HOVER_IMG_PATH, click_image_path=CLICK_IMG_PATH)
 
     return btn
 
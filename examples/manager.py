@@ -0,0 +1,67 @@
+import pygame
+from pygame_ui_toolkit.elements import button, slider, toggle, manager
+from pygame_ui_toolkit.presets import button_colour_change
+
+
+NORMAL_COLOUR = (255, 255, 255)
+HOVER_COLOUR = (200, 200, 200)
+CLICK_COLOUR = (100, 100, 100)
+
+SLIDER_COLOUR = (200, 200, 200)
+
+TICK_COLOUR = (0, 0, 0)
+OUTER_COLOUR = (150, 150, 150)
+
+FONT_COLOUR = (0, 0, 0)
+FONT_SIZE = 32
+
+BACKGROUND_COLOUR = (0, 0, 0)
+
+GRID_SIZE = 8
+BUTTON_SIZE = 30
+
+
+pygame.init()
+window = pygame.display.set_mode((500, 500))
+pygame.display.set_caption("UI manager")
+
+
+def on_click(btn):
+    print(f"Clicked button at {btn.get_pos()}")
+
+
+def create_elements():
+    elements = []
+
+    for i in range(GRID_SIZE):
+        for j in range(GRID_SIZE):
+            x = 50 + i * (BUTTON_SIZE + 10)
+            y = 50 + j * (BUTTON_SIZE + 10)
+
+            btn = button_colour_change.create_button(NORMAL_COLOUR, HOVER_COLOUR, CLICK_COLOUR, window, x, y, BUTTON_SIZE, BUTTON_SIZE, on_click, corner_radius=4)
+            elements.append(btn)
+
+    elements.append(slider.HorizontalSlider(window, 300, 10, 250, 400, 0, 100, 50, SLIDER_COLOUR))
+    elements.append(toggle.TickBoxToggle(window, 6, TICK_COLOUR, NORMAL_COLOUR, OUTER_COLOUR, 250, 450, 200, 40, "Tick box", FONT_COLOUR, FONT_SIZE))
+
+    return elements
+
+
+def main():
+    # Only the parts of the window that change are redrawn, so the window is not filled each frame
+    # The elements are only updated when there is input, so the loop can wait for events instead of running constantly
+    ui_manager = manager.UIManager(create_elements(), background=BACKGROUND_COLOUR, event_driven=True)
+
+    while True:
+        event_loop = [pygame.event.wait()] + pygame.event.get()
+
+        dirty_rects = ui_manager.update(event_loop)
+        pygame.display.update(dirty_rects)
+
+        for event in event_loop:
+            if event.type == pygame.QUIT:
+                quit()
+
+
+if __name__ == "__main__":
+    main()
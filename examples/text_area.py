@@ -0,0 +1,58 @@
+import pygame
+from pygame_ui_toolkit.elements import text_area
+from pygame_ui_toolkit.elements import manager
+
+
+NUM_LINES = 100000
+
+BACKGROUND_COLOUR = (255, 255, 255)
+BORDER_COLOUR = (100, 100, 100)
+BORDER_WIDTH = 2
+
+SCROLLBAR_COLOUR = (150, 150, 150)
+
+FONT_COLOUR = (0, 0, 0)
+FONT_SIZE = 20
+
+# A new line is added to the log every LOG_INTERVAL milliseconds
+LOG_INTERVAL = 250
+
+
+pygame.init()
+window = pygame.display.set_mode((500, 500))
+pygame.display.set_caption("Text area")
+
+
+def create_text_area():
+    text = "\n".join(f"Line {i}: the quick brown fox jumps over the lazy dog" + " again" * (i % 7) for i in range(NUM_LINES))
+
+    log = text_area.TextArea(window, 250, 250, 460, 460, BACKGROUND_COLOUR, FONT_COLOUR, FONT_SIZE, text=text, border_colour=BORDER_COLOUR, border_width=BORDER_WIDTH, scrollbar_colour=SCROLLBAR_COLOUR)
+    log.scroll_to_end()
+
+    return log
+
+
+def main():
+    log = create_text_area()
+    ui_manager = manager.UIManager([log], background=(0, 0, 0))
+
+    clock = pygame.time.Clock()
+    next_log_time = LOG_INTERVAL
+
+    while True:
+        event_loop = pygame.event.get()
+
+        for event in event_loop:
+            if event.type == pygame.QUIT:
+                quit()
+
+        if pygame.time.get_ticks() >= next_log_time:
+            log.append_text(f"New line added after {next_log_time} ms")
+            next_log_time += LOG_INTERVAL
+
+        pygame.display.update(ui_manager.update(event_loop))
+        clock.tick(60)
+
+
+if __name__ == "__main__":
+    main()
@@ -26,7 +26,7 @@ def on_text_input(txt):
 
 
 def create_text_inputs():
-    input1 = input_size_colour_change.create_text_input(DESELECTED_COLOUR, SELECTED_COLOUR, NORMAL_SIZE, HOVER_SIZE, CLICK_SIZE, window, 250, 150, FONT_COLOUR, FONT_SIZE, on_text_input=on_text_input, prefix_text="Text: ")
+    input1 = input_size_colour_change.create_text_input(DESELECTED_COLOUR, SELECTED_COLOUR, NORMAL_SIZE, HOVER_SIZE, CLICK_SIZE, window, 250, 150, FONT_COLOUR, FONT_SIZE, on_text_input=on_text_input, prefix_text="Text: ", show_cursor=True)
     input2 = input_size_colour_change.create_text_input(DESELECTED_COLOUR, SELECTED_COLOUR, NORMAL_SIZE, HOVER_SIZE, CLICK_SIZE, window, 250, 350, FONT_COLOUR, FONT_SIZE, on_text_input=on_text_input)
 
     return input1, input2
@@ -0,0 +1,194 @@
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from pygame_ui_toolkit import images
+from pygame_ui_toolkit import fonts
+from pygame_ui_toolkit import utils
+from pygame_ui_toolkit import pygame
+
+
+DEFAULT_NUM_WORKERS = 4
+
+
+class AssetLoader:
+    """
+    Loads images and fonts on a pool of background threads, so the main loop is not blocked by reading and decoding files.
+
+    Files are read, decoded and scaled on the worker threads. Each image file is only decoded once, however many sizes of it are requested. update() must be called on the main thread (once per frame) to finish each load:
+    it converts images to the display's pixel format, creates fonts from the files that were read, adds each asset to the shared image or font cache and calls its on_loaded function.
+    Fonts are only created on the main thread because SDL_ttf is not thread safe, and other fonts may be rendering text at the same time.
+    Once an asset has been added to its cache, images.get_image() and fonts.get_font() return it straight away.
+
+    Until then, elements can show a placeholder (e.g. an ImageButton given a loader shows a PLACEHOLDER_COLOUR rectangle). get_progress() can be used to draw a loading screen.
+
+    Attributes
+    ----------
+    num_workers : int, optional
+        the number of threads files are loaded on (defaults to DEFAULT_NUM_WORKERS)
+    executor : concurrent.futures.ThreadPoolExecutor
+        the pool of threads files are loaded on
+    pending : dict[tuple, tuple]
+        the future, function that adds the asset to its cache, and on_loaded functions of each asset being loaded
+    originals : dict[str, pygame.Surface]
+        the decoded (unscaled) image from each file, while assets are being loaded
+    path_locks : dict[str, threading.Lock]
+        a lock for each image file, so only one thread decodes or scales it at a time
+    num_requested : int
+        the number of different assets that have been requested
+    num_loaded : int
+        the number of requested assets that have finished loading
+    errors : list[tuple[tuple, Exception]]
+        the key and exception of each asset that could not be loaded
+
+    Methods
+    -------
+    request(key: tuple, load: callable, store: callable, on_loaded: callable)
+        call load() on a worker thread, then pass the result to store() on the main thread
+    decode_image(path: str, size: tuple[int, int] | None, smooth: bool)
+        return an image loaded from a file and scaled to size, on a worker thread
+    load_image(path: str, size: tuple[int, int] | None = None, smooth: bool = False, on_loaded: callable = None)
+        start loading an image in the background
+    load_font(font_name: str | None, font_size: int, bold: bool = False, italic: bool = False, underline: bool = False, on_loaded: callable = None)
+        start loading a font in the background
+    update()
+        finish every load that has completed
+    get_progress()
+        return the fraction of requested assets that have finished loading
+    is_done()
+        return whether every requested asset has finished loading
+    wait()
+        block until every requested asset has finished loading, then finish them
+    shutdown()
+        stop the worker threads once the pending loads have completed
+    """
+
+    def __init__(self, num_workers: int = DEFAULT_NUM_WORKERS) -> None:
+        """Construct the necessary attributes for the AssetLoader object."""
+        self.num_workers = num_workers
+        self.executor = ThreadPoolExecutor(num_workers, "asset_loader")
+
+        self.pending = {}
+
+        self.originals = {}
+        self.path_locks = {}
+
+        self.num_requested = 0
+        self.num_loaded = 0
+        self.errors = []
+
+    def request(self, key: tuple, load: callable, store: callable, on_loaded: callable) -> None:
+        """
+        Call load() on a worker thread, then pass the result to store() on the main thread (in update()) and on_loaded() with what store() returns.
+
+        Requests with the same key as an asset that is already being loaded are only loaded once. on_loaded can accept 0 or 1 arguments (the asset).
+        """
+        bound_on_loaded = utils.bind_func(on_loaded)
+
+        if key in self.pending:
+            self.pending[key][2].append(bound_on_loaded)
+            return
+
+        self.num_requested += 1
+
+        future = self.executor.submit(load)
+        self.pending[key] = (future, store, [bound_on_loaded])
+
+    def decode_image(self, path: str, size: tuple[int, int] | None, smooth: bool) -> pygame.Surface:
+        """
+        Return a new image loaded from a file and scaled to size (if size is not None), without converting it. This is called on a worker thread.
+
+        The decoded file is kept in originals, so other sizes of it do not decode it again. The file's lock stops two threads using the same decoded image at once.
+        """
+        with self.path_locks[path]:
+            original = self.originals.get(path)
+
+            if original == None:
+                original = pygame.image.load(path)
+                self.originals[path] = original
+
+            if size == None:
+                return original.copy()
+
+            return images.scale_image(original, tuple(size), smooth)
+
+    def load_image(self, path: str, size: tuple[int, int] | None = None, smooth: bool = False, on_loaded: callable = None) -> None:
+        """
+        Start loading an image in the background (with the same arguments as images.get_image()).
+
+        If the image is already cached, on_loaded is called with it straight away.
+        """
+        if images.is_cached(path, size, smooth):
+            utils.call_func(on_loaded, images.get_image(path, size, smooth))
+            return
+
+        # Locks are only created on the main thread, so two threads cannot create different locks for the same file
+        self.path_locks.setdefault(path, Lock())
+
+        load = lambda: self.decode_image(path, size, smooth)
+        store = lambda image: images.add_image(path, size, smooth, image)
+
+        self.request(("image",) + images.get_key(path, size, smooth), load, store, on_loaded)
+
+    def load_font(self, font_name: str | None, font_size: int, bold: bool = False, italic: bool = False, underline: bool = False, on_loaded: callable = None) -> None:
+        """
+        Start loading a font in the background (with the same arguments as fonts.get_font()).
+
+        Only the font file is read in the background - the font is created from it in update(). If the font is already cached, on_loaded is called with it straight away.
+        """
+        if fonts.is_cached(font_name, font_size, bold, italic, underline):
+            utils.call_func(on_loaded, fonts.get_font(font_name, font_size, bold, italic, underline))
+            return
+
+        load = lambda: fonts.read_font_file(font_name)
+        store = lambda font_data: fonts.add_font(font_name, font_size, bold, italic, underline, font_data)
+
+        self.request(("font", font_name, font_size, bold, italic, underline), load, store, on_loaded)
+
+    def update(self) -> None:
+        """
+        Finish every load that has completed, adding the asset to its cache and calling its on_loaded functions.
+
+        This must be called on the main thread, since images are converted to the display's pixel format. Assets that could not be loaded are added to errors instead.
+        """
+        finished = [key for key, (future, _, _) in self.pending.items() if future.done()]
+
+        for key in finished:
+            future, store, on_loaded_funcs = self.pending.pop(key)
+
+            error = future.exception()
+
+            if error != None:
+                self.errors.append((key, error))
+                continue
+
+            asset = store(future.result())
+            self.num_loaded += 1
+
+            for on_loaded in on_loaded_funcs:
+                on_loaded(asset)
+
+        # Once nothing is being loaded, no thread is using the decoded files
+        if len(self.pending) == 0:
+            self.originals.clear()
+            self.path_locks.clear()
+
+    def get_progress(self) -> float:
+        """Return the fraction of requested assets that have finished loading or failed to load (1 if nothing has been requested)."""
+        if self.num_requested == 0:
+            return 1
+
+        return (self.num_requested - len(self.pending)) / self.num_requested
+
+    def is_done(self) -> bool:
+        """Return whether every requested asset has finished loading (or failed to load)."""
+        return len(self.pending) == 0
+
+    def wait(self) -> None:
+        """Block until every requested asset has finished loading, then finish them (see update())."""
+        wait([future for future, _, _ in self.pending.values()])
+
+        self.update()
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once the pending loads have completed. No more assets can be requested afterwards."""
+        self.executor.shutdown()
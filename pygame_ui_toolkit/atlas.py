@@ -0,0 +1,240 @@
+from pygame_ui_toolkit import images
+from pygame_ui_toolkit import render_queue
+from pygame_ui_toolkit import pygame
+
+
+DEFAULT_PAGE_SIZE = 512
+
+# The number of empty pixels left between images, so scaled or rotated blits of one image never pick up pixels from its neighbours
+DEFAULT_PADDING = 1
+
+
+class TextureAtlas:
+    """
+    Packs many small images into a few large surfaces (pages), so they share memory and can all be blitted from the same source.
+
+    Each image is copied into a free area of a page, and a subsurface of that area is returned in its place. Blitting the area of the page (or the subsurface) draws exactly the same pixels as blitting the original image.
+    Images are packed onto shelves: rows of images, each as tall as the first image placed on it. Images with per-pixel transparency are packed onto separate pages from opaque images, so opaque images can still be blitted quickly.
+    Adding the images in order of height (as preload() and add_images() do) wastes the least space.
+
+    Images are never removed from an atlas (other than by clear()), so an atlas should be used for sets of images that stay in use, such as the icons of a toolbar or the tiles of a level select screen.
+
+    Attributes
+    ----------
+    page_size : int, optional
+        the width and height of each page (defaults to DEFAULT_PAGE_SIZE). Images larger than this are given a page of their own
+    padding : int, optional
+        the number of empty pixels left between images (defaults to DEFAULT_PADDING)
+    pages : list[pygame.Surface]
+        the surfaces the images are packed into
+    page_alpha : list[bool]
+        whether each page has per-pixel transparency
+    shelves : list[list[list[int]]]
+        the y position, height and next free x position of each shelf on each page
+    next_shelf_y : list[int]
+        the y position the next shelf on each page starts at
+    regions : dict[object, tuple[pygame.Surface, pygame.Rect, pygame.Surface]]
+        the page, area and subsurface of each image, keyed by the key it was added with
+    used_area : int
+        the number of pixels covered by images
+
+    Methods
+    -------
+    find_shelf(page_index: int, width: int, height: int)
+        return the area of a page an image fits into, or None if it does not fit
+    add_page(width: int, height: int, alpha: bool)
+        add a new page and return its index
+    find_space(width: int, height: int, alpha: bool)
+        return the page and area an image is packed into, adding a page if none of them have space
+    add(key: object, image: pygame.Surface)
+        copy an image into the atlas (unless one has already been added with key) and return its subsurface
+    add_images(images_by_key: dict[object, pygame.Surface])
+        add several images, tallest first, and return their subsurfaces
+    preload(paths: list[str], size: tuple[int, int] | None = None, smooth: bool = False)
+        load images through the image cache and add them to the atlas
+    get_region(key: object)
+        return the page and area of an image
+    clear()
+        remove every page and image
+    get_stats()
+        return a dict of the atlas counters
+    """
+
+    def __init__(self, page_size: int = DEFAULT_PAGE_SIZE, padding: int = DEFAULT_PADDING) -> None:
+        """Construct the necessary attributes for the TextureAtlas object."""
+        self.page_size = page_size
+        self.padding = padding
+
+        self.pages = []
+        self.page_alpha = []
+
+        self.shelves = []
+        self.next_shelf_y = []
+
+        self.regions = {}
+        self.used_area = 0
+
+    def __len__(self) -> int:
+        """Return the number of images in the atlas."""
+        return len(self.regions)
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether an image has been added with key."""
+        return key in self.regions
+
+    def find_shelf(self, page_index: int, width: int, height: int) -> pygame.Rect | None:
+        """
+        Return the area of a page that an image of the size (including padding) is packed into, or None if it does not fit on the page.
+
+        The image is placed on the shortest shelf that it fits on, or on a new shelf if there is room for one.
+        """
+        page_width, page_height = self.pages[page_index].get_size()
+
+        best_shelf = None
+        for shelf in self.shelves[page_index]:
+            if height <= shelf[1] and shelf[2] + width <= page_width and (best_shelf == None or shelf[1] < best_shelf[1]):
+                best_shelf = shelf
+
+        if best_shelf == None:
+            y = self.next_shelf_y[page_index]
+
+            if y + height > page_height or width > page_width:
+                return None
+
+            best_shelf = [y, height, 0]
+            self.shelves[page_index].append(best_shelf)
+            self.next_shelf_y[page_index] += height
+
+        y, _, x = best_shelf
+        best_shelf[2] += width
+
+        return pygame.Rect(x, y, width, height)
+
+    def add_page(self, width: int, height: int, alpha: bool) -> int:
+        """Add a new page (with per-pixel transparency if alpha is True) and return its index."""
+        if alpha:
+            page = pygame.Surface((width, height), pygame.SRCALPHA)
+        else:
+            page = pygame.Surface((width, height))
+
+        self.pages.append(images.convert_image(page))
+        self.page_alpha.append(alpha)
+
+        self.shelves.append([])
+        self.next_shelf_y.append(0)
+
+        return len(self.pages) - 1
+
+    def find_space(self, width: int, height: int, alpha: bool) -> tuple[int, pygame.Rect]:
+        """Return the index of the page and the area (including padding) an image of the size is packed into, adding a new page if none of the pages have space for it."""
+        width += self.padding
+        height += self.padding
+
+        for page_index, page_alpha in enumerate(self.page_alpha):
+            if page_alpha != alpha:
+                continue
+
+            area = self.find_shelf(page_index, width, height)
+
+            if area != None:
+                return page_index, area
+
+        page_index = self.add_page(max(width, self.page_size), max(height, self.page_size), alpha)
+
+        return page_index, self.find_shelf(page_index, width, height)
+
+    def add(self, key: object, image: pygame.Surface) -> pygame.Surface:
+        """
+        Copy an image into the atlas and return the subsurface of the page it was copied into, which can be used in place of the image.
+
+        If an image has already been added with key, its subsurface is returned without copying the new image, so the same subsurface is returned for every call with the same key.
+        """
+        region = self.regions.get(key)
+
+        if region != None:
+            return region[2]
+
+        per_pixel_alpha = image.get_flags() & pygame.SRCALPHA
+
+        if image.get_alpha() != None and not per_pixel_alpha:
+            raise Exception("images with a surface alpha (set with set_alpha()) cannot be added to a texture atlas, since the alpha would apply to the whole page")
+
+        # Images with a colour key are packed onto pages with per-pixel transparency, where the colour key pixels are left transparent
+        alpha = bool(per_pixel_alpha) or image.get_colorkey() != None
+        page_index, area = self.find_space(*image.get_size(), alpha)
+
+        page = self.pages[page_index]
+        area.size = image.get_size()
+
+        if per_pixel_alpha:
+            # The area is still fully transparent, so taking the maximum of each channel copies the pixels exactly (a normal blit would blend them)
+            page.blit(image, area, special_flags=pygame.BLEND_RGBA_MAX)
+        else:
+            page.blit(image, area)
+
+        subsurface = page.subsurface(area)
+
+        self.regions[key] = (page, area, subsurface)
+        self.used_area += area.width * area.height
+
+        return subsurface
+
+    def add_images(self, images_by_key: dict[object, pygame.Surface]) -> list[pygame.Surface]:
+        """Add several images, tallest first so they pack more tightly, and return their subsurfaces (in the same order as images_by_key)."""
+        for key, image in sorted(images_by_key.items(), key=lambda item: item[1].get_height(), reverse=True):
+            self.add(key, image)
+
+        return [self.regions[key][2] for key in images_by_key]
+
+    def preload(self, paths: list[str], size: tuple[int, int] | None = None, smooth: bool = False) -> list[pygame.Surface]:
+        """
+        Load and scale each image through the shared image cache (see images.get_image()) and add it to the atlas, returning the subsurfaces.
+
+        The images are added with the same keys ImageButton uses, so image buttons given this atlas use these subsurfaces rather than adding the images again.
+        """
+        return self.add_images({images.get_key(path, size, smooth): images.get_image(path, size, smooth) for path in paths})
+
+    def get_region(self, key: object) -> tuple[pygame.Surface, pygame.Rect] | None:
+        """Return the page and area of the image added with key (None if there is not one), which can be passed to Surface.blit() as the source and area."""
+        region = self.regions.get(key)
+
+        if region == None:
+            return None
+
+        return region[0], region[1]
+
+    def clear(self) -> None:
+        """Remove every page and image. Subsurfaces that were returned keep working, but new images are packed onto new pages."""
+        self.pages = []
+        self.page_alpha = []
+
+        self.shelves = []
+        self.next_shelf_y = []
+
+        self.regions = {}
+        self.used_area = 0
+
+    def get_stats(self) -> dict[str, int | float]:
+        """Return a dict of the atlas counters (pages, images, bytes and the fraction of the pages covered by images)."""
+        total_area = sum(page.get_width() * page.get_height() for page in self.pages)
+
+        return {
+            "pages": len(self.pages),
+            "images": len(self.regions),
+            "bytes": sum(page.get_bytesize() * page.get_width() * page.get_height() for page in self.pages),
+            "used": self.used_area / total_area if total_area > 0 else 0
+        }
+
+
+def draw_image_buttons(buttons: list) -> None:
+    """
+    Draw image buttons with one Surface.blits() call for each surface they are drawn onto, rather than a Surface.blit() call each.
+
+    This is quickest when the buttons share a TextureAtlas, since every blit then has the same source. UIManager does this automatically for consecutive image buttons if batch_draws is True.
+    """
+    blits_by_surface = {}
+    for btn in buttons:
+        blits_by_surface.setdefault(btn.surface, []).append(btn.get_blit())
+
+    for surface, blit_sequence in blits_by_surface.items():
+        render_queue.blits(surface, blit_sequence)
@@ -0,0 +1,146 @@
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    A cache that evicts the least recently used items once it is full.
+
+    The cache can also be limited by the total memory used by its items, if a function that returns the size of an item (in bytes) is given.
+
+    Attributes
+    ----------
+    max_size : int
+        the maximum number of items stored in the cache
+    max_bytes : int | None, optional
+        the maximum total size (in bytes) of the items stored in the cache, or None for no limit (defaults to None)
+    get_item_size : callable | None, optional
+        a function that accepts an item and returns its size in bytes. This is required if max_bytes is given (defaults to None)
+    num_bytes : int
+        the total size (in bytes) of the cached items (always 0 if get_item_size is None)
+    items : collections.OrderedDict
+        the cached items, ordered from least to most recently used
+    hits : int
+        the number of times a requested item was already in the cache
+    misses : int
+        the number of times a requested item had to be created
+    evictions : int
+        the number of items removed to make room for new ones
+
+    Methods
+    -------
+    get(key: object, create: callable)
+        return the item stored with key, calling create() to make it if it is not cached
+    over_limits()
+        return whether the cache has more items, or uses more bytes, than its limits allow
+    evict()
+        remove least recently used items until the cache is within its limits
+    clear()
+        remove every item and reset the counters
+    get_stats()
+        return a dict of the cache counters
+    """
+
+    def __init__(self, max_size: int, max_bytes: int | None = None, get_item_size: callable = None) -> None:
+        """Construct the necessary attributes for the LRUCache object."""
+        if max_bytes != None and get_item_size == None:
+            raise Exception("get_item_size must be given to limit the cache by max_bytes")
+
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+
+        self.get_item_size = get_item_size
+        self.num_bytes = 0
+
+        self.items = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached items."""
+        return len(self.items)
+    
+    def __contains__(self, key: object) -> bool:
+        """Return whether an item is stored with key."""
+        return key in self.items
+
+    def get(self, key: object, create: callable) -> object:
+        """
+        Return the item stored with key, calling create() to make it if it is not cached.
+
+        Parameters
+        ----------
+        key : object
+            a hashable key that uniquely describes the item
+        create : callable
+            a function that accepts no arguments and returns the item
+
+        Returns
+        -------
+        object
+            the cached (or newly created) item
+        """
+        if key in self.items:
+            self.hits += 1
+            self.items.move_to_end(key)
+
+            return self.items[key]
+        
+        self.misses += 1
+
+        item = create()
+        self.items[key] = item
+
+        if self.get_item_size != None:
+            self.num_bytes += self.get_item_size(item)
+
+        self.evict()
+
+        return item
+    
+    def over_limits(self) -> bool:
+        """Return whether the cache has more items, or uses more bytes, than its limits allow."""
+        if len(self.items) > self.max_size:
+            return True
+
+        return self.max_bytes != None and self.num_bytes > self.max_bytes
+
+    def evict(self) -> None:
+        """
+        Remove least recently used items until the cache is within its limits.
+
+        An item that is larger than max_bytes on its own is removed as well, so it is returned by get() but not cached.
+        """
+        while self.over_limits():
+            _, item = self.items.popitem(last=False)
+            self.evictions += 1
+
+            if self.get_item_size != None:
+                self.num_bytes -= self.get_item_size(item)
+
+    def clear(self) -> None:
+        """Remove every item and reset the counters."""
+        self.items.clear()
+        self.num_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_stats(self) -> dict[str, int | None]:
+        """Return a dict of the cache counters."""
+        return {
+            "size" : len(self.items),
+            "max_size" : self.max_size,
+            "bytes" : self.num_bytes,
+            "max_bytes" : self.max_bytes,
+            "hits" : self.hits,
+            "misses" : self.misses,
+            "evictions" : self.evictions
+        }
+
+
+def get_surface_size(surface: object) -> int:
+    """Return the number of bytes used by the pixels of a pygame surface, to limit caches of surfaces by max_bytes."""
+    return surface.get_pitch() * surface.get_height()
@@ -1,6 +1,9 @@
 __all__ = ["button",
+           "button_array",
            "dropdown",
            "input",
+           "manager",
            "slider",
            "text",
+           "text_area",
            "toggle"]
\ No newline at end of file
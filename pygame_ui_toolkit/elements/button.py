@@ -1,5 +1,15 @@
 from pygame_ui_toolkit import pygame
 from pygame_ui_toolkit import utils
+from pygame_ui_toolkit import fonts
+from pygame_ui_toolkit import text_surfaces
+from pygame_ui_toolkit import render_queue
+from pygame_ui_toolkit import images
+from pygame_ui_toolkit import assets
+from pygame_ui_toolkit import atlas
+from pygame_ui_toolkit import shapes
+from pygame_ui_toolkit import polygons
+from pygame_ui_toolkit import hit_test
+from pygame_ui_toolkit import input_state
 
 
 class Button:
@@ -25,23 +35,52 @@ class Button:
         the function that is called when the button is neither clicked or hovered over. If the function accepts 1 argument, self is passed into it (defaults to None)
     click_once : bool, optional
         if True, the on_click and on_hover functions will be called once per click or hover event, otherwise they will be called every ferame the button is clicked or hovered (defaults to True)
+    spatial_index : spatial.SpatialGrid | None
+        the spatial index the button has been inserted into (None if it is not in one)
+    preset_variables : dict[str, dict] | None
+        the variables stored on the button by presets, keyed by the preset name (None if no preset has been applied)
+    hit_rect : pygame.Rect | None
+        the cached bounding rect that points are tested against before the exact shape (None until it is next needed, after the geometry changes)
+    hit_rect_is_exact : bool
+        whether the hit rect is exactly the button region, so no exact test is needed (a class attribute)
     
     Methods
     -------
+    geometry_changed()
+        update anything that depends on the position or size of the button. This should be called after changing the points of a polygon
+    get_hit_rect()
+        return the rect that points are tested against before the exact shape
+    hit_test(x: int, y: int)
+        return whether a point is within the button, testing the hit rect before the exact shape
+    mouse_over()
+        return whether the mouse is within the region of the button
     update_clicked(currently_clicked: bool)
         update the clicked attribute.
     update_hovered(currently_hovered: bool)
         update the hovered attribute.
     call_func(func: callable)
         call utils.call_func(func, self).
-    check_click()
+    check_click(mouse_over: bool | None = None)
         return whether the button is ciurrently being clicked.
-    check_hover()
+    check_hover(mouse_over: bool | None = None)
         return whether the button is being hovered over.
+    update_state(mouse_over: bool | None = None)
+        call the on_click, on_hover and on_normal functions where appropriate, without drawing the button.
     update()
         draw the button and call the on_click, on_hover and on_normal functions where appropriate.
     """
 
+    __slots__ = ("surface", "_x", "_y", "_on_click", "_on_click_bound", "_on_hover", "_on_hover_bound", "_on_normal", "_on_normal_bound", "click_once", "clicked", "hovered", "spatial_index", "preset_variables", "hit_rect", "__weakref__")
+
+    hit_rect_is_exact = False
+
+    x = utils.geometry_attribute("x")
+    y = utils.geometry_attribute("y")
+
+    on_click = utils.CallbackAttribute()
+    on_hover = utils.CallbackAttribute()
+    on_normal = utils.CallbackAttribute()
+
     def __init__(self, surface: pygame.Surface, x: int, y: int, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, click_once: bool = True) -> None:
         """Construct the necessary attributes for the Button object"""
         self.surface = surface
@@ -58,6 +97,38 @@ class Button:
         self.clicked = False
         self.hovered = False
 
+        self.spatial_index = None
+
+        self.preset_variables = None
+
+        self.hit_rect = None
+
+    def geometry_changed(self) -> None:
+        """
+        Update anything that depends on the position or size of the button.
+
+        The hit rect and spatial index are updated when x, y, width, height or radius are assigned to, but this should be called after changing the points of a polygon,
+        or the size of an image button (to scale its image).
+        """
+        self.hit_rect = None
+
+        if self.spatial_index != None:
+            self.spatial_index.mark_moved(self)
+
+    def get_hit_rect(self) -> pygame.Rect:
+        """Return the rect that points are tested against before the exact shape."""
+        return self.get_bounding_rect()
+
+    def hit_test(self, x: int, y: int) -> bool:
+        """Return whether a point is within the button, testing the hit rect before the exact shape (see hit_test.check_point())."""
+        return hit_test.check_point(self, x, y)
+
+    def mouse_over(self) -> bool:
+        """Return whether the mouse is within the region of the button."""
+        x, y = input_state.get_mouse_pos()
+
+        return hit_test.check_point(self, x, y)
+
     def update_clicked(self, currently_clicked: bool) -> bool:
         """
         Update the clicked attribute.
@@ -125,40 +196,61 @@ class Button:
         else:
             utils.call_func(func, self)
         
-    def check_click(self) -> bool:
-        """Return whether the button is ciurrently being clicked."""
-        mouse_over = self.mouse_over()
-        mouse_down = pygame.mouse.get_pressed(3)[0]
+    def check_click(self, mouse_over: bool | None = None) -> bool:
+        """
+        Return whether the button is ciurrently being clicked.
+
+        If mouse_over is None, self.mouse_over() is called to find it.
+        """
+        if mouse_over == None:
+            mouse_over = self.mouse_over()
+
+        mouse_down = input_state.get_mouse_buttons()[0]
 
         click = mouse_over and mouse_down
 
         return self.update_clicked(click)
     
-    def check_hover(self) -> bool:
-        """Return whether the button is currently being hovered over."""
-        mouse_over = self.mouse_over()
+    def check_hover(self, mouse_over: bool | None = None) -> bool:
+        """
+        Return whether the button is currently being hovered over.
+
+        If mouse_over is None, self.mouse_over() is called to find it.
+        """
+        if mouse_over == None:
+            mouse_over = self.mouse_over()
 
         return self.update_hovered(mouse_over)
     
-    def update(self) -> None:
+    def update_state(self, mouse_over: bool | None = None) -> None:
         """
-        Draw the button and call the on_click, on_hover and on_normal functions where appropriate.
+        Call the on_click, on_hover and on_normal functions where appropriate, without drawing the button.
 
-        This should be called once per frame.
+        If mouse_over is None, self.mouse_over() is called to find it. Otherwise, it should be whether the mouse is within the button (e.g. the result of a spatial index query).
 
         An exception is raised if the button object does not contain the nessesary methods.
         """
         
-        if not hasattr(self, "check_click") or not hasattr(self, "check_hover"):
+        if not hasattr(self, "contains_point"):
             raise Exception("Base Button class should not be used by itself. Use another class like RectButton instead")
 
-        if self.check_click():
-            self.call_func(self.on_click)
-        elif self.check_hover():
-            self.call_func(self.on_hover)
+        if mouse_over == None:
+            mouse_over = self.mouse_over()
+
+        if self.check_click(mouse_over):
+            self._on_click_bound(self)
+        elif self.check_hover(mouse_over):
+            self._on_hover_bound(self)
         else:
-            self.call_func(self.on_normal)
+            self._on_normal_bound(self)
+
+    def update(self) -> None:
+        """
+        Draw the button and call the on_click, on_hover and on_normal functions where appropriate.
 
+        This should be called once per frame.
+        """
+        self.update_state()
         self.draw()
 
 
@@ -183,12 +275,23 @@ class RectButton(Button):
     -------
     This class inherits from Button, so contains all the metehods that Button does.
     It also contains these additional methods:
-    mouse_over()
-        return whether the mouse is colliding with, or within the region of, the button rectangle
+    get_bounding_rect()
+        return the smallest rect that contains every point within the button
+    contains_point(x: int, y: int)
+        return whether a point is colliding with, or within the region of, the button rectangle
+    get_visual_state()
+        return everything that affects how the button is drawn
     draw()
         draw a rectangle with the appropriate width, height, position and colour
     """
 
+    __slots__ = ("_width", "_height", "background_colour", "corner_radius")
+
+    hit_rect_is_exact = True
+
+    width = utils.geometry_attribute("width")
+    height = utils.geometry_attribute("height")
+
     def __init__(self, surface: pygame.Surface, x: int, y: int, background_colour: tuple[int], width: int, height: int, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, corner_radius: int = -1, click_once: bool = True) -> None:
         """Construct the necessary attributes for the RectButton object"""
         super().__init__(surface, x, y, on_click, on_hover, on_normal, click_once)
@@ -200,10 +303,15 @@ class RectButton(Button):
 
         self.corner_radius = corner_radius
 
-    def mouse_over(self) -> bool:
-        """Return whether the mouse is colliding with, or within the region of, the button rectangle"""
-        x, y = pygame.mouse.get_pos()
+    def get_bounding_rect(self) -> pygame.Rect:
+        """Return the smallest rect that contains every point within the button."""
+        half_width = self.width // 2
+        half_height = self.height // 2
+
+        return pygame.Rect(self.x - half_width, self.y - half_height, 2 * half_width + 1, 2 * half_height + 1)
 
+    def contains_point(self, x: int, y: int) -> bool:
+        """Return whether a point is colliding with, or within the region of, the button rectangle"""
         min_x = self.x - self.width // 2
         max_x = self.x + self.width // 2
         min_y = self.y - self.height // 2
@@ -211,10 +319,22 @@ class RectButton(Button):
 
         return min_x <= x <= max_x and min_y <= y <= max_y
     
+    def get_visual_state(self) -> tuple:
+        """Return everything that affects how the button is drawn."""
+        return self.x, self.y, self.width, self.height, self.background_colour, self.corner_radius
+
     def draw(self) -> None:
-        """Draw a rectangle with the appropriate width, height, position and colour"""
-        rect = pygame.Rect(self.x - self.width // 2, self.y - self.height // 2, self.width, self.height)
-        pygame.draw.rect(self.surface, self.background_colour, rect, border_radius=self.corner_radius)
+        """
+        Draw a rectangle with the appropriate width, height, position and colour.
+
+        Rounded rectangles are drawn once to a cached surface (see the shapes module) and blitted. Sharp rectangles are just filled, since that is as fast as a blit.
+        """
+        if self.corner_radius > 0:
+            shape_surface = shapes.get_rect(self.width, self.height, self.background_colour, self.corner_radius)
+            render_queue.blit(self.surface, shape_surface, (self.x - self.width // 2, self.y - self.height // 2))
+        else:
+            rect = pygame.Rect(self.x - self.width // 2, self.y - self.height // 2, self.width, self.height)
+            render_queue.fill(self.surface, self.background_colour, rect)
 
     get_width = lambda self: self.width
 
@@ -238,12 +358,20 @@ class CircleButton(Button):
     -------
     This class inherits from Button, so contains all the metehods that Button does.
     It also contains these additional methods:
-    mouse_over()
-        return whether the mouse position is within the circle
+    get_bounding_rect()
+        return the smallest rect that contains every point within the button
+    contains_point(x: int, y: int)
+        return whether a point is within the circle
+    get_visual_state()
+        return everything that affects how the button is drawn
     draw()
         draw a circle with the appropriate radius, position and colour
     """
 
+    __slots__ = ("background_colour", "_radius")
+
+    radius = utils.geometry_attribute("radius")
+
     def __init__(self, surface: pygame.Surface, x: int, y: int, background_colour: tuple[int], radius: int, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, click_once: bool = True) -> None:
         """Construct the nessesary attributes for the CircleButton object"""
         super().__init__(surface, x, y, on_click, on_hover, on_normal, click_once)
@@ -251,20 +379,25 @@ class CircleButton(Button):
         self.background_colour = background_colour
 
         self.radius = radius
-        self.radius_sq = radius**2
 
-    def mouse_over(self) -> bool:
-        """Return whether the mouse position is within the circle"""
-        x, y = pygame.mouse.get_pos()
+    def get_bounding_rect(self) -> pygame.Rect:
+        """Return the smallest rect that contains every point within the button."""
+        return pygame.Rect(self.x - self.radius, self.y - self.radius, 2 * self.radius + 1, 2 * self.radius + 1)
 
+    def contains_point(self, x: int, y: int) -> bool:
+        """Return whether a point is within the circle"""
         dist_sq = (x - self.x)**2 + (y - self.y)**2
 
-        return dist_sq < self.radius_sq
+        return dist_sq < self.radius**2
     
+    def get_visual_state(self) -> tuple:
+        """Return everything that affects how the button is drawn."""
+        return self.x, self.y, self.radius, self.background_colour
+
     def draw(self) -> None:
-        """Draw a circle with the appropriate radius, position and colour"""
-        center = self.get_pos()
-        pygame.draw.circle(self.surface, self.background_colour, center, self.radius)
+        """Draw a circle with the appropriate radius, position and colour, using a cached surface from the shapes module."""
+        shape_surface = shapes.get_circle(self.radius, self.background_colour)
+        render_queue.blit(self.surface, shape_surface, (self.x - self.radius, self.y - self.radius))
 
     get_width = lambda self: self.radius * 2
 
@@ -272,7 +405,7 @@ class CircleButton(Button):
 class PolygonButton(Button):
     """
     A button in the shape of any convex polygon.
-    Convex polygons are **not** supported and will result in unexpected behaviour.
+    Concave polygons are **not** supported and will result in unexpected behaviour.
 
     This inherits from the Button class.
 
@@ -284,6 +417,8 @@ class PolygonButton(Button):
         the colour of the button
     points : list[tuple[int]]
         a list of x, y coordinates that correspond to each point on the polygon
+    polygon : polygons.Polygon
+        the precomputed edges and bounding box of the points, used to test whether points are within the button
         
     Methods
     -------
@@ -291,14 +426,20 @@ class PolygonButton(Button):
     It also contains these additional methods:
     get_center(points: list[tuple[int]])
         return the center of the polygon by averaging the position of each point
-    get_inequalities(points: list[tuple[int]], center_x: int, center_y: int)
-        return a list of inequalities that describe the button region
-    mouse_over()
-        return whether the mouse position is within the polygon using inequalities
+    geometry_changed()
+        update the center, polygon and spatial index after the points are changed
+    get_bounding_rect()
+        return the smallest rect that contains every point within the button
+    contains_point(x: int, y: int)
+        return whether a point is within (or on an edge of) the polygon
+    get_visual_state()
+        return everything that affects how the button is drawn
     draw()
         draw a polygon with the appropriate points and colour
     """
 
+    __slots__ = ("points", "background_colour", "polygon")
+
     def __init__(self, surface: pygame.Surface, points: list[tuple[int]], background_colour: tuple[int], on_click: callable = None, on_hover: callable = None, on_normal: callable = None, click_once: bool = True) -> None:
         """Construct the necessary attributes for the PolygonButton object"""
         x, y = self.get_center(points)
@@ -308,7 +449,7 @@ class PolygonButton(Button):
         self.points = points
         self.background_colour = background_colour
 
-        self.inequalities = self.get_inequalities(points, x, y)
+        self.polygon = polygons.Polygon(points)
 
     def get_center(self, points: list[tuple[int]]) -> tuple[int]:
         """
@@ -332,54 +473,29 @@ class PolygonButton(Button):
 
         return x, y
     
-    def get_inequalities(self, points: list[tuple[int]], center_x: int, center_y: int) -> list[tuple[float, float, bool]]:
-        """
-        Return a list of inequalities that describe the button region.
-
-        Parameters
-        ----------
-        points : list[tuple[int]]
-            a list of x, y coordinates that correspond to each point on the polygon
-        center_x : int
-            the x coordinate of the center of the polygon
-        center_y : int
-            the y coordinate of the center of the polygon
+    def geometry_changed(self) -> None:
+        """Update the center, polygon and spatial index after the points are changed."""
+        self.x, self.y = self.get_center(self.points)
+        self.polygon = polygons.Polygon(self.points)
 
-        Returns
-        -------
-        list[tuple[float, float, bool]]
-            a list of linear inequalities in the form: line_gradient, y_intercept, greater_than (each line is interpreted as having the equation y=mx + c)
-        """
-        inequalities = []
-        for i, x in enumerate(points):
-            try:
-                m = (x[1] - points[i - 1][1]) / (x[0] - points[i - 1][0])
-            except ZeroDivisionError:
-                m = 1e10
-
-            c = x[1] - m * x[0]
-            greater_than = (m * center_x + c) < center_y
+        super().geometry_changed()
 
-            inequalities.append((m, c, greater_than))
+    def get_bounding_rect(self) -> pygame.Rect:
+        """Return the smallest rect that contains every point within the button."""
+        return self.polygon.get_bounding_rect()
 
-        return inequalities
-
-    def mouse_over(self) -> None:
-        """Return whether the mouse position is within the polygon using inequalities."""
-        x, y = pygame.mouse.get_pos()
-
-        for m, c, greater_than in self.inequalities:
-            intersect_y = m * x + c
-            actual_greater_than = intersect_y < y
-
-            if actual_greater_than != greater_than:
-                return False
-            
-        return True
+    def contains_point(self, x: int, y: int) -> bool:
+        """Return whether a point is within (or on an edge of) the polygon (see polygons.Polygon)."""
+        return self.polygon.contains_point(x, y)
     
+    def get_visual_state(self) -> tuple:
+        """Return everything that affects how the button is drawn."""
+        return tuple(self.points), self.background_colour
+
     def draw(self) -> None:
-        """Draw a polygon with the appropriate points and colour."""
-        pygame.draw.polygon(self.surface, self.background_colour, self.points)
+        """Draw a polygon with the appropriate points and colour, using a cached surface from the shapes module."""
+        shape_surface, pos = shapes.get_polygon(self.points, self.background_colour)
+        render_queue.blit(self.surface, shape_surface, pos)
 
 
 class ImageButton(RectButton):
@@ -396,6 +512,20 @@ class ImageButton(RectButton):
         the file path to the desired image
     image : pygame.Surface
         the image of the button in a form useable for pygame
+    normal_image_path : str
+        the file path to the image shown when the button is not hovered over or clicked on (only used if hover_image_path or click_image_path is given)
+    hover_image_path : str | None, optional
+        the file path to the image shown when the button is hovered over, or None to not change the image when hovered over (defaults to None)
+    click_image_path : str | None, optional
+        the file path to the image shown when the button is clicked on, or None to not change the image when clicked on (defaults to None)
+    smooth : bool, optional
+        whether the images are scaled with pygame.transform.smoothscale() rather than pygame.transform.scale() (defaults to False)
+    loader : assets.AssetLoader | None, optional
+        the loader used to load images that are not cached in the background, showing a placeholder until they are loaded. If None, images are loaded straight away (defaults to None)
+    atlas : atlas.TextureAtlas | None, optional
+        the texture atlas the images are packed into, so buttons sharing it are all drawn from the same few surfaces. If None, each image is a surface of its own (defaults to None)
+    atlas_region : tuple[pygame.Surface, pygame.Rect] | None
+        the page and area of the atlas the image is in, or None if the image is not in an atlas
 
     Methods
     -------
@@ -403,31 +533,154 @@ class ImageButton(RectButton):
     It also contains these additional methods:
     update_image()
         update the image attribute of the object
+    show_image(image: pygame.Surface)
+        show an image, packing it into the atlas if the button has one
+    image_loaded(image_path: str, size: tuple[int, int], image: pygame.Surface)
+        show an image that has been loaded in the background, if it is still needed
+    get_state_image_path()
+        return the path of the image for the current state of the button
+    get_blit()
+        return the arguments of the Surface.blit() call that draws the button
 
     The following methods are overwritten:
+    geometry_changed()
+        update anything that depends on the position or size of the button, including the scaled image
+    get_visual_state()
+        return everything that affects how the button is drawn
+    update_state()
+        call the on_click, on_hover and on_normal functions, then show the image for the new state
     draw()
         blit the image to the screen
     """
 
-    def __init__(self, surface: pygame.Surface, x: int, y: int, width: int, height: int, image_path: str, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, click_once: bool = True) -> None:
-        """Construct the necessary attributes for the ImageButton object"""
+    __slots__ = ("image_path", "image", "normal_image_path", "hover_image_path", "click_image_path", "smooth", "loader", "atlas", "atlas_region")
+
+    def __init__(self, surface: pygame.Surface, x: int, y: int, width: int, height: int, image_path: str, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, click_once: bool = True, hover_image_path: str | None = None, click_image_path: str | None = None, smooth: bool = False, loader: assets.AssetLoader | None = None, atlas: atlas.TextureAtlas | None = None) -> None:
+        """
+        Construct the necessary attributes for the ImageButton object.
+
+        The hover and click images are loaded and scaled straight away (or in the background if a loader is given), so changing between them is only a cache lookup.
+        If an atlas is given, they are also packed into it straight away (unless they are loaded in the background).
+        """
         super().__init__(surface, x, y, None, width, height, on_click, on_hover, on_normal, -1, click_once)
 
+        self.normal_image_path = image_path
+        self.hover_image_path = hover_image_path
+        self.click_image_path = click_image_path
+
+        self.smooth = smooth
+        self.loader = loader
+        self.atlas = atlas
+
         self.update_image(image_path)
 
+        for path in (hover_image_path, click_image_path):
+            if path == None:
+                continue
+
+            if loader == None and atlas != None:
+                atlas.preload([path], (width, height), smooth)
+            elif loader == None:
+                images.get_image(path, (width, height), smooth)
+            else:
+                loader.load_image(path, (width, height), smooth)
+
     def update_image(self, new_image_path: str) -> None:
-        """Update the image attribute of the object."""
-        image = pygame.image.load(new_image_path)
-        scaled_image = pygame.transform.scale(image, (self.width, self.height))
+        """
+        Update the image attribute of the object.
 
-        self.image = scaled_image
+        Images are loaded through the shared image cache, so an image file is only loaded and scaled once for each size (see images.get_image()).
+        If the button has a loader and the image is not cached, a placeholder is shown until the loader has loaded it.
+        If the button has an atlas, images that are already packed into it are used without going through the image cache.
+        """
+        self.image_path = new_image_path
+        size = (self.width, self.height)
 
-    def draw(self) -> None:
-        """Blit the image to the screen."""
-        image_x = self.x - self.width // 2
-        image_y = self.y - self.height // 2
+        if self.atlas != None and images.get_key(new_image_path, size, self.smooth) in self.atlas:
+            self.show_image(None)
+        elif self.loader == None or images.is_cached(new_image_path, size, self.smooth):
+            self.show_image(images.get_image(new_image_path, size, self.smooth))
+        else:
+            self.image = shapes.get_rect(self.width, self.height, images.PLACEHOLDER_COLOUR)
+            self.atlas_region = None
+
+            self.loader.load_image(new_image_path, size, self.smooth, lambda image: self.image_loaded(new_image_path, size, image))
+
+    def show_image(self, image: pygame.Surface | None) -> None:
+        """
+        Show the image for image_path at the current size.
+
+        If the button has an atlas, the image is packed into it (image can be None if it already has been) and the button shows the subsurface of the atlas instead.
+        """
+        if self.atlas == None:
+            self.image = image
+            self.atlas_region = None
+            return
+
+        key = images.get_key(self.image_path, (self.width, self.height), self.smooth)
+
+        self.image = self.atlas.add(key, image)
+        self.atlas_region = self.atlas.get_region(key)
+
+    def image_loaded(self, image_path: str, size: tuple[int, int], image: pygame.Surface) -> None:
+        """Show an image that has been loaded in the background, unless the button has changed to a different image or size since it was requested."""
+        if image_path == self.image_path and size == (self.width, self.height):
+            self.show_image(image)
+
+    def geometry_changed(self) -> None:
+        """Update anything that depends on the position or size of the button, scaling the image to the new size."""
+        super().geometry_changed()
+
+        if self.image.get_size() != (self.width, self.height):
+            self.update_image(self.image_path)
+
+    def get_state_image_path(self) -> str:
+        """Return the path of the image for the current state of the button (clicked, hovered over or neither)."""
+        if self.clicked and self.click_image_path != None:
+            return self.click_image_path
+        elif self.hovered and self.hover_image_path != None:
+            return self.hover_image_path
+        else:
+            return self.normal_image_path
+
+    def update_state(self, mouse_over: bool | None = None) -> None:
+        """
+        Call the on_click, on_hover and on_normal functions where appropriate, without drawing the button.
+
+        If hover_image_path or click_image_path was given, the image for the new state of the button is then shown.
+        """
+        super().update_state(mouse_over)
+
+        if self.hover_image_path == None and self.click_image_path == None:
+            return
+
+        image_path = self.get_state_image_path()
+
+        if image_path != self.image_path:
+            self.update_image(image_path)
 
-        self.surface.blit(self.image, (image_x, image_y))
+    def get_visual_state(self) -> tuple:
+        """Return everything that affects how the button is drawn."""
+        return self.x, self.y, self.width, self.height, self.image
+
+    def get_blit(self) -> tuple:
+        """
+        Return the arguments of the Surface.blit() call that draws the button: the image and its position, or the atlas page, position and area of the page if the image is in an atlas.
+
+        This lets many image buttons be drawn with a single Surface.blits() call (see atlas.draw_image_buttons()).
+        """
+        dest = (self.x - self.width // 2, self.y - self.height // 2)
+
+        if self.atlas_region == None:
+            return self.image, dest
+
+        page, area = self.atlas_region
+
+        return page, dest, area
+
+    def draw(self) -> None:
+        """Blit the image to the screen (from the atlas page, if the image is in an atlas)."""
+        render_queue.blit(self.surface, *self.get_blit())
 
 
 class BorderedRectButton(RectButton):
@@ -449,10 +702,14 @@ class BorderedRectButton(RectButton):
     -------
     This class inherits from RectButton, so contains all the methods that RectButton does.
     The following methods are overwritten:
+    get_visual_state()
+        return everything that affects how the button is drawn
     draw()
         draw a rectangle and border
     """
 
+    __slots__ = ("border_colour", "border_width")
+
     def __init__(self, surface: pygame.Surface, x: int, y: int, background_colour: tuple[int], border_colour: tuple[int], width: int, height: int, border_width: int, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, corner_radius: int = -1, click_once: bool = True) -> None:
         """Construct the necessary attributes for the BorderedRectButton object."""
         super().__init__(surface, x, y, background_colour, width, height, on_click, on_hover, on_normal, corner_radius, click_once)
@@ -460,12 +717,14 @@ class BorderedRectButton(RectButton):
         self.border_colour = border_colour
         self.border_width = border_width
 
-    def draw(self) -> None:
-        """Draw a rectangle and border."""
-        rect = pygame.Rect(self.x - self.width // 2, self.y - self.height // 2, self.width, self.height)
+    def get_visual_state(self) -> tuple:
+        """Return everything that affects how the button is drawn."""
+        return super().get_visual_state() + (self.border_colour, self.border_width)
 
-        pygame.draw.rect(self.surface, self.background_colour, rect, border_radius=self.corner_radius)
-        pygame.draw.rect(self.surface, self.border_colour, rect, self.border_width, self.corner_radius)
+    def draw(self) -> None:
+        """Draw a rectangle and border, using a cached surface from the shapes module."""
+        shape_surface = shapes.get_rect(self.width, self.height, self.background_colour, self.corner_radius, self.border_colour, self.border_width)
+        render_queue.blit(self.surface, shape_surface, (self.x - self.width // 2, self.y - self.height // 2))
 
 
 class BorderedCircleButton(CircleButton):
@@ -487,10 +746,14 @@ class BorderedCircleButton(CircleButton):
     -------
     This class inherits from CircleButton, so contains all the methods that CircleButton does.
     The following methods are overwritten:
+    get_visual_state()
+        return everything that affects how the button is drawn
     draw()
         draw a circle and border
     """
 
+    __slots__ = ("border_colour", "border_width")
+
     def __init__(self, surface: pygame.Surface, x: int, y: int, background_colour: tuple[int], border_colour: tuple[int], radius: int, border_width: int, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, click_once: bool = True) -> None:
         """Construct the necessary attributes for the BorderedCircleButton object."""
         super().__init__(surface, x, y, background_colour, radius, on_click, on_hover, on_normal, click_once)
@@ -498,10 +761,14 @@ class BorderedCircleButton(CircleButton):
         self.border_colour = border_colour
         self.border_width = border_width
 
+    def get_visual_state(self) -> tuple:
+        """Return everything that affects how the button is drawn."""
+        return super().get_visual_state() + (self.border_colour, self.border_width)
+
     def draw(self) -> None:
-        """Draw a circle and border."""
-        pygame.draw.circle(self.surface, self.background_colour, self.get_pos(), self.radius)
-        pygame.draw.circle(self.surface, self.border_colour, self.get_pos(), self.radius, self.border_width)
+        """Draw a circle and border, using a cached surface from the shapes module."""
+        shape_surface = shapes.get_circle(self.radius, self.background_colour, self.border_colour, self.border_width)
+        render_queue.blit(self.surface, shape_surface, (self.x - self.radius, self.y - self.radius))
 
 
 class BorderedPolygonButton(PolygonButton):
@@ -523,9 +790,15 @@ class BorderedPolygonButton(PolygonButton):
     -------
     This class inherits from PolygonButton, so contains all the methods that PolygonButton does.
     The following methods are overwritten:
+    get_bounding_rect()
+        return the smallest rect that contains the polygon and its border
+    get_visual_state()
+        return everything that affects how the button is drawn
     draw()
         draw a polygon and border
     """
+
+    __slots__ = ("border_colour", "border_width")
     def __init__(self, surface: pygame.Surface, points: list[tuple[int]], background_colour: tuple[int], border_colour: tuple[int], border_width: int, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, click_once: bool = True) -> None:
         """Construct the necessary attributes for the BorderedPolygonButton object."""
         super().__init__(surface, points, background_colour, on_click, on_hover, on_normal, click_once)
@@ -533,10 +806,18 @@ class BorderedPolygonButton(PolygonButton):
         self.border_colour = border_colour
         self.border_width = border_width
 
+    def get_bounding_rect(self) -> pygame.Rect:
+        """Return the smallest rect that contains the polygon and its border (which can extend past the points)."""
+        return super().get_bounding_rect().inflate(2 * self.border_width, 2 * self.border_width)
+
+    def get_visual_state(self) -> tuple:
+        """Return everything that affects how the button is drawn."""
+        return super().get_visual_state() + (self.border_colour, self.border_width)
+
     def draw(self) -> None:
-        """Draw a polygon and border."""
-        pygame.draw.polygon(self.surface, self.background_colour, self.points)
-        pygame.draw.polygon(self.surface, self.border_colour, self.points, self.border_width)
+        """Draw a polygon and border, using a cached surface from the shapes module."""
+        shape_surface, pos = shapes.get_polygon(self.points, self.background_colour, self.border_colour, self.border_width)
+        render_queue.blit(self.surface, shape_surface, pos)
 
 
 class TextWrapper:
@@ -563,53 +844,105 @@ class TextWrapper:
         the surface used to render text
     text_rect : pygame.Rect
         the rect position that the text is drawn to
+    rendered_state : tuple | None
+        the text, font colour, font, antialias, background colour and position the text was last rendered with (None if the text needs rendering)
 
     Methods
     -------
     get_text()
         return a text surface and rect object to blit text
+    get_render_state()
+        return everything that affects how the text is rendered
     blit_text()
         draw text to the screen
     update_text(new_text: str | None = None, new_font_colour: tuple[int] | None = None, new_font_size: int | None = None, new_font_name: str | None = None)
         change the text, font_colour, font attributes of the object
+    get_bounding_rect()
+        return the smallest rect that contains the button and text
+    hit_test(x: int, y: int)
+        return whether a point is within the button
+    get_visual_state()
+        return everything that affects how the button and text are drawn
+    update_state()
+        update the button object without drawing it
+    render()
+        draw the button object and blit text on top, without updating the button
+    draw()
+        update the button object, then draw it and blit text on top
     update()
         update the TextWrapper object
     """
 
+    __slots__ = ("button_object", "text", "font_colour", "font", "antialias", "text_surface", "text_rect", "rendered_state", "__weakref__")
+
     def __init__(self, button_object: RectButton | CircleButton | BorderedCircleButton | BorderedRectButton, text: str, font_colour: tuple[int], font_size: int, font_name: str | None = None, antialias: bool = False) -> None:
         """Construct necessary attributes for TextWrapper object."""
         self.button_object = button_object
         
         self.text = text
         self.font_colour = font_colour
-        self.font = pygame.font.Font(font_name, font_size)
+        self.font = fonts.get_font(font_name, font_size)
 
         self.antialias = antialias
 
-        self.text_surface, self.text_rect = self.get_text()
+        self.rendered_state = None
+        utils.update_rendered_text(self)
 
     def get_text(self) -> tuple[pygame.Surface, pygame.Rect]:
         """Return a text surface and rect object to blit text."""
-        text_surf = self.font.render(self.text, self.antialias, self.font_colour, self.button_object.background_colour)
+        text_surf = text_surfaces.render(self.font, self.text, self.antialias, self.font_colour, self.button_object.background_colour)
         text_rect = text_surf.get_rect()
         text_rect.center = self.button_object.get_pos()
 
         return text_surf, text_rect
+
+    def get_render_state(self) -> tuple:
+        """Return everything that affects how the text is rendered."""
+        return self.text, self.font_colour, self.font, self.antialias, self.button_object.background_colour, self.button_object.get_pos()
     
     def blit_text(self) -> None:
         """Draw text to the screen."""
-        self.button_object.surface.blit(self.text_surface, self.text_rect)
+        render_queue.blit(self.button_object.surface, self.text_surface, self.text_rect)
 
     def update_text(self, new_text: str, new_font_colour: tuple[int], new_font_size: int, new_font_name: str | None) -> None:
-        """Change the text, font_colour, font attributes of the object."""
+        """
+        Change the text, font_colour, font attributes of the object.
+
+        The text is only rendered again if it would look different, e.g. the text or the button colour has changed.
+        """
         utils.update_font_attrs(self, new_text, new_font_colour, new_font_name, new_font_size)
 
-        self.text_surface, self.text_rect = self.get_text()
+        utils.update_rendered_text(self)
 
-    def draw(self) -> None:
-        """Draw button object and blit text on top."""
-        self.button_object.update()
+    def get_bounding_rect(self) -> pygame.Rect:
+        """Return the smallest rect that contains the button and text."""
+        return self.button_object.get_bounding_rect().union(self.text_rect)
+
+    def hit_test(self, x: int, y: int) -> bool:
+        """Return whether a point is within the button (the text is not included)."""
+        return self.button_object.hit_test(x, y)
+
+    def get_visual_state(self) -> tuple:
+        """Return everything that affects how the button and text are drawn."""
+        return self.button_object.get_visual_state() + (self.text_surface, self.text_rect.topleft)
+
+    def update_state(self) -> None:
+        """Update the button object without drawing it."""
+        self.button_object.update_state()
+
+    def render(self) -> None:
+        """Draw button object and blit text on top, without updating the button. UIManager draws text wrappers with this, since it updates them separately."""
+        self.button_object.draw()
         self.blit_text()
+
+    def draw(self) -> None:
+        """
+        Update the button object, then draw it and blit text on top.
+
+        This is the same as update(), so code that only calls draw() still handles hovers and clicks. Use render() to draw without updating.
+        """
+        self.update_state()
+        self.render()
         
     def update(self) -> None:
         """
@@ -618,4 +951,5 @@ class TextWrapper:
         This should be called once per frame.
         """
 
-        self.draw()
\ No newline at end of file
+        self.update_state()
+        self.render()
\ No newline at end of file
@@ -0,0 +1,309 @@
+from pygame_ui_toolkit import pygame
+from pygame_ui_toolkit import utils
+from pygame_ui_toolkit import shapes
+from pygame_ui_toolkit import input_state
+from pygame_ui_toolkit import render_queue
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# The callback that is called for a button (indices into ButtonArray.get_callbacks())
+NORMAL = 0
+HOVER = 1
+CLICK = 2
+
+
+class ButtonArray:
+    """
+    A large group of rectangular buttons, stored as NumPy arrays instead of individual RectButton objects.
+
+    Every button is hit tested and has its clicked and hovered state updated in one vectorised call, so thousands of buttons (e.g. a level selector or a grid of cells) can be updated each frame.
+    The buttons behave the same as RectButtons, and the same callbacks are called for each button that would be called for a RectButton.
+
+    NumPy is required to use this class (pip install pygame-ui-toolkit[numpy]).
+
+    Attributes
+    ----------
+    surface : pygame.Surface
+        the surface that the buttons are drawn onto
+    num_buttons : int
+        the number of buttons in the array
+    positions : np.ndarray
+        an (num_buttons, 2) array of the x, y position of the center of each button
+    sizes : np.ndarray
+        an (num_buttons, 2) array of the width and height of each button
+    background_colours : np.ndarray
+        an (num_buttons, 3) array of the colour of each button. Colours can be changed in the callbacks, e.g. background_colours[index] = (255, 0, 0)
+    min_corners : np.ndarray
+        the smallest x, y coordinates within each button (recomputed by geometry_changed())
+    max_corners : np.ndarray
+        the largest x, y coordinates within each button (recomputed by geometry_changed())
+    on_click : callable | None, optional
+        the function that is called when a button is clicked. If it accepts 1 argument, the index of the button is passed in; if it accepts 2 arguments, the index and the ButtonArray object are passed in (defaults to None)
+    on_hover : callable | None, optional
+        the function that is called when a button is hovered over. It is passed the same arguments as on_click (defaults to None)
+    on_normal : callable | None, optional
+        the function that is called when a button is neither clicked or hovered over. It is passed the same arguments as on_click (defaults to None)
+    corner_radius : int, optional
+        the radius of the rounded corners of every button, where -1 means sharp corners (defaults to -1)
+    click_once : bool, optional
+        if True, on_click and on_hover will be called once per click or hover event, otherwise they will be called every frame a button is clicked or hovered (defaults to True)
+    clicked : np.ndarray
+        whether each button is clicked
+    hovered : np.ndarray
+        whether each button is hovered over
+
+    Methods
+    -------
+    geometry_changed()
+        recompute min_corners and max_corners. This should be called after changing positions or sizes
+    contains_point(x: int, y: int)
+        return an array of whether a point is within each button
+    mouse_over()
+        return an array of whether the mouse is within each button
+    update_clicked(currently_clicked: np.ndarray)
+        update the clicked array
+    update_hovered(currently_hovered: np.ndarray, checked: np.ndarray)
+        update the hovered array for the checked buttons
+    get_actions(mouse_over: np.ndarray | None = None)
+        update the clicked and hovered arrays and return which callback should be called for each button
+    get_callbacks()
+        return the bound on_normal, on_hover and on_click callables, indexed by NORMAL, HOVER and CLICK
+    get_bounding_rect()
+        return the smallest rect that contains every button
+    get_visual_state()
+        return everything that affects how the buttons are drawn
+    update_state(mouse_over: np.ndarray | None = None)
+        call the on_click, on_hover and on_normal functions where appropriate, without drawing the buttons
+    draw()
+        draw every button
+    update()
+        draw the buttons and call the on_click, on_hover and on_normal functions where appropriate
+    """
+
+    __slots__ = ("surface", "num_buttons", "positions", "sizes", "background_colours", "min_corners", "max_corners", "_on_click", "_on_click_bound", "_on_hover", "_on_hover_bound", "_on_normal", "_on_normal_bound", "corner_radius", "click_once", "clicked", "hovered", "__weakref__")
+
+    on_click = utils.CallbackAttribute()
+    on_hover = utils.CallbackAttribute()
+    on_normal = utils.CallbackAttribute()
+
+    def __init__(self, surface: pygame.Surface, positions: list[tuple[int, int]], sizes: list[tuple[int, int]] | tuple[int, int], background_colours: list[tuple[int]] | tuple[int], on_click: callable = None, on_hover: callable = None, on_normal: callable = None, corner_radius: int = -1, click_once: bool = True) -> None:
+        """
+        Construct the necessary attributes for the ButtonArray object.
+
+        sizes and background_colours can either be given for each button, or as a single size or colour that is used for every button.
+        """
+        if np == None:
+            raise Exception("ButtonArray requires NumPy. Install it with: pip install pygame-ui-toolkit[numpy]")
+
+        self.surface = surface
+
+        self.positions = np.array(positions, dtype=int).reshape(-1, 2)
+        self.num_buttons = len(self.positions)
+
+        self.sizes = np.broadcast_to(np.array(sizes, dtype=int), (self.num_buttons, 2)).copy()
+        self.background_colours = np.broadcast_to(np.array(background_colours, dtype=int), (self.num_buttons, 3)).copy()
+
+        self.on_click = on_click
+        self.on_hover = on_hover
+        self.on_normal = on_normal
+
+        self.corner_radius = corner_radius
+        self.click_once = click_once
+
+        self.clicked = np.zeros(self.num_buttons, dtype=bool)
+        self.hovered = np.zeros(self.num_buttons, dtype=bool)
+
+        self.geometry_changed()
+
+    def __len__(self) -> int:
+        """Return the number of buttons in the array."""
+        return self.num_buttons
+
+    def geometry_changed(self) -> None:
+        """
+        Recompute min_corners and max_corners.
+
+        This should be called after changing positions or sizes.
+        """
+        half_sizes = self.sizes // 2
+
+        self.min_corners = self.positions - half_sizes
+        self.max_corners = self.positions + half_sizes
+
+    def contains_point(self, x: int, y: int) -> "np.ndarray":
+        """Return an array of whether a point is colliding with, or within the region of, each button (the same test as RectButton.contains_point)."""
+        return (self.min_corners[:, 0] <= x) & (x <= self.max_corners[:, 0]) & (self.min_corners[:, 1] <= y) & (y <= self.max_corners[:, 1])
+
+    def mouse_over(self) -> "np.ndarray":
+        """Return an array of whether the mouse is within each button."""
+        x, y = input_state.get_mouse_pos()
+
+        return self.contains_point(x, y)
+
+    def update_clicked(self, currently_clicked: "np.ndarray") -> "np.ndarray":
+        """
+        Update the clicked array.
+
+        Parameters
+        ----------
+
+        currently_clicked : np.ndarray
+            whether the mouse is currently over each button and the mouse button is pressed
+
+        Returns
+        -------
+        np.ndarray
+            whether on_click should be called for each button
+        """
+        if self.click_once:
+            call_on_click = currently_clicked & ~self.clicked
+        else:
+            call_on_click = currently_clicked
+
+        self.clicked = currently_clicked
+
+        return call_on_click
+
+    def update_hovered(self, currently_hovered: "np.ndarray", checked: "np.ndarray") -> "np.ndarray":
+        """
+        Update the hovered array for the checked buttons.
+
+        Parameters
+        ----------
+
+        currently_hovered : np.ndarray
+            whether the mouse is currently over each button
+        checked : np.ndarray
+            which buttons to update. Like RectButton, buttons that have just been clicked are not checked for a hover
+
+        Returns
+        -------
+        np.ndarray
+            whether on_hover should be called for each button
+        """
+        call_on_hover = currently_hovered & checked
+
+        if self.click_once:
+            call_on_hover &= ~self.hovered
+
+        self.hovered = np.where(checked, currently_hovered, self.hovered)
+
+        return call_on_hover
+
+    def get_actions(self, mouse_over: "np.ndarray | None" = None) -> "np.ndarray":
+        """
+        Update the clicked and hovered arrays and return which callback should be called for each button (NORMAL, HOVER or CLICK).
+
+        If mouse_over is None, self.mouse_over() is called to find it.
+        """
+        if mouse_over is None:
+            mouse_over = self.mouse_over()
+
+        mouse_down = input_state.get_mouse_buttons()[0]
+
+        call_on_click = self.update_clicked(mouse_over & mouse_down)
+        call_on_hover = self.update_hovered(mouse_over, ~call_on_click)
+
+        return np.where(call_on_click, CLICK, np.where(call_on_hover, HOVER, NORMAL))
+
+    def get_callbacks(self) -> tuple[callable, callable, callable]:
+        """Return the bound on_normal, on_hover and on_click callables, indexed by NORMAL, HOVER and CLICK."""
+        return self._on_normal_bound, self._on_hover_bound, self._on_click_bound
+
+    def get_bounding_rect(self) -> pygame.Rect:
+        """Return the smallest rect that contains every button (an empty rect if there are no buttons)."""
+        if self.num_buttons == 0:
+            return pygame.Rect(0, 0, 0, 0)
+
+        min_x, min_y = self.min_corners.min(axis=0).tolist()
+        max_x, max_y = self.max_corners.max(axis=0).tolist()
+
+        return pygame.Rect(min_x, min_y, max_x - min_x + 1, max_y - min_y + 1)
+
+    def get_visual_state(self) -> tuple:
+        """Return everything that affects how the buttons are drawn."""
+        return self.positions.tobytes(), self.sizes.tobytes(), self.background_colours.tobytes(), self.corner_radius
+
+    def update_state(self, mouse_over: "np.ndarray | None" = None) -> None:
+        """
+        Call the on_click, on_hover and on_normal functions where appropriate, without drawing the buttons.
+
+        The callbacks are called in order of the button index. If there is no on_normal function, only the buttons that are clicked or hovered over are visited in Python.
+        If mouse_over is None, self.mouse_over() is called to find it. Nothing happens if there are no buttons.
+        """
+        if self.num_buttons == 0:
+            return
+
+        actions = self.get_actions(mouse_over)
+        callbacks = self.get_callbacks()
+
+        if self.on_normal == None:
+            indices = np.flatnonzero(actions).tolist()
+        else:
+            indices = range(self.num_buttons)
+
+        action_list = actions.tolist()
+        for i in indices:
+            callbacks[action_list[i]](i, self)
+
+    def draw(self) -> None:
+        """
+        Draw every button.
+
+        Like RectButton, rounded buttons are blitted from the shapes cache and sharp buttons are just filled.
+        Each different size and colour of rounded button is only looked up in the shapes cache once, and every button is blitted in one Surface.blits() call.
+        Nothing is drawn if there are no buttons.
+        """
+        if self.num_buttons == 0:
+            return
+
+        corners = self.min_corners.tolist()
+        sizes = self.sizes.tolist()
+        colours = self.background_colours.tolist()
+
+        if self.corner_radius > 0:
+            shape_surfaces = {}
+            blit_sequence = []
+
+            for corner, (width, height), colour in zip(corners, sizes, colours):
+                key = (width, height, *colour)
+
+                shape_surface = shape_surfaces.get(key)
+                if shape_surface == None:
+                    shape_surface = shapes.get_rect(width, height, colour, self.corner_radius)
+                    shape_surfaces[key] = shape_surface
+
+                blit_sequence.append((shape_surface, corner))
+
+            render_queue.blits(self.surface, blit_sequence)
+        else:
+            for (x, y), (width, height), colour in zip(corners, sizes, colours):
+                render_queue.fill(self.surface, colour, (x, y, width, height))
+
+    def update(self) -> None:
+        """
+        Draw the buttons and call the on_click, on_hover and on_normal functions where appropriate.
+
+        This should be called once per frame.
+        """
+        self.update_state()
+        self.draw()
+
+
+def create_grid(surface: pygame.Surface, x: int, y: int, num_columns: int, num_rows: int, width: int, height: int, background_colour: tuple[int], x_gap: int = 10, y_gap: int = 10, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, corner_radius: int = -1, click_once: bool = True) -> ButtonArray:
+    """
+    Return a ButtonArray of buttons laid out in a grid, where (x, y) is the center of the top left button.
+
+    The buttons are indexed row by row, so the button in column c and row r has the index r * num_columns + c.
+    """
+    if np == None:
+        raise Exception("ButtonArray requires NumPy. Install it with: pip install pygame-ui-toolkit[numpy]")
+
+    rows, columns = np.divmod(np.arange(num_columns * num_rows), num_columns)
+    positions = np.column_stack((x + columns * (width + x_gap), y + rows * (height + y_gap)))
+
+    return ButtonArray(surface, positions, (width, height), background_colour, on_click, on_hover, on_normal, corner_radius, click_once)
@@ -27,10 +27,22 @@ class Option:
         prepare the text_wrapper attribute
     on_button_click()
         call normal_button_on_click and select this option
+    hit_test(x: int, y: int)
+        return whether a point is within the option button (always False if the option is not active)
+    get_visual_state()
+        return everything that affects how the option is drawn
+    update_state()
+        update the option button without drawing it
+    render()
+        draw the option (if it is active), without updating it
+    draw()
+        update the option button, then draw the option (if it is active)
     update()
         update the object
     """
 
+    __slots__ = ("parent_dropdown", "text_wrapper", "normal_button_on_click", "active", "name", "__weakref__")
+
     def __init__(self, parent_dropdown: object, text_wrapper: button.TextWrapper, start_active: bool = False) -> None:
         """Construct the necessary attributes for the Option object."""
         self.parent_dropdown = parent_dropdown
@@ -54,6 +66,32 @@ class Option:
 
         self.parent_dropdown.option_selected(self)
 
+    def hit_test(self, x: int, y: int) -> bool:
+        """Return whether a point is within the option button, testing its hit rect before its exact shape (always False if the option is not active)."""
+        return self.active and self.text_wrapper.hit_test(x, y)
+
+    def get_visual_state(self) -> tuple:
+        """Return everything that affects how the option is drawn."""
+        if self.active:
+            return self.text_wrapper.get_visual_state()
+        else:
+            return ()
+
+    def update_state(self) -> None:
+        """Update the option button without drawing it."""
+        if self.active:
+            self.text_wrapper.update_state()
+
+    def render(self) -> None:
+        """Draw the option (if it is active), without updating it."""
+        if self.active:
+            self.text_wrapper.render()
+
+    def draw(self) -> None:
+        """Update the option button, then draw the option (if it is active). Use render() to draw without updating."""
+        self.update_state()
+        self.render()
+
     def update(self) -> None:
         """
         Update the object.
@@ -98,14 +136,26 @@ class Dropdown(toggle.Toggle):
     all methods from toggle.Toggle
     create_options(option_buttons: list[object], option_names: list[str], start_active: bool)
         return a list of Option objects when given a list of their names and button objects
-    on_value_changed(value: bool)
-        update the active attribute of each option
+    set_options_active(value: bool)
+        update the active attribute of each option (this is the toggle's on_value_changed function)
     option_selected(option: Option)
         change selected option and update text
+    get_bounding_rect()
+        return the smallest rect that contains the dropdown button and active options
+    get_visual_state()
+        return everything that affects how the dropdown button and options are drawn
+    update_state()
+        update the dropdown button and options without drawing them
+    render() - overwritten from Toggle
+        draw the dropdown button and active options to the screen, without updating them
     update()
         update the dropdown object
     """
 
+    __slots__ = ("font_colour", "font_size", "font_name", "_on_option_changed", "_on_option_changed_bound", "antialias", "options", "selected_option", "text_wrapper")
+
+    on_option_changed = utils.CallbackAttribute()
+
     def __init__(self, button_object: object, option_buttons: list[object], option_names: list[str], font_colour: tuple[int], font_size: int, font_name: str | None = None, on_option_changed: callable = None, initial_option: int = 0, start_active: bool = False, antialias: bool = False) -> None:
         """Construct the necessary attributes for the Dropdown object."""
         self.font_colour = font_colour
@@ -122,7 +172,7 @@ class Dropdown(toggle.Toggle):
 
         self.text_wrapper = button.TextWrapper(button_object, self.selected_option.text_wrapper.text, font_colour, font_size, font_name, antialias)
 
-        super().__init__(button_object, self.on_value_changed, False)
+        super().__init__(button_object, self.set_options_active, False)
 
     def create_options(self, option_buttons: list[object], option_names: list[str], start_active: bool) -> list[Option]:
         """Return a list of Option objects when given a list of their names and button objects."""
@@ -137,7 +187,7 @@ class Dropdown(toggle.Toggle):
 
         return options
 
-    def on_value_changed(self, value: bool) -> None:
+    def set_options_active(self, value: bool) -> None:
         """Update the active attribute of each option."""
         for i in self.options:
             i.active = value
@@ -149,22 +199,50 @@ class Dropdown(toggle.Toggle):
 
         self.text_wrapper.update_text(option.text_wrapper.text, self.font_colour, self.font_size, self.font_name)
 
-        utils.call_func(self.on_option_changed, option, self)
+        self._on_option_changed_bound(option, self)
 
-    def update(self) -> None:
+    def get_bounding_rect(self) -> pygame.Rect:
+        """Return the smallest rect that contains the dropdown button and active options."""
+        option_rects = [i.text_wrapper.get_bounding_rect() for i in self.options if i.active]
+
+        return self.text_wrapper.get_bounding_rect().unionall(option_rects)
+
+    def get_visual_state(self) -> tuple:
+        """Return everything that affects how the dropdown button and options are drawn."""
+        option_states = tuple(i.get_visual_state() for i in self.options)
+
+        return self.text_wrapper.get_visual_state() + option_states
+
+    def update_state(self) -> None:
         """
-        Update the dropdown object.
+        Update the dropdown button and options without drawing them.
 
-        This should be called once per frame.
+        The buttons are updated first, so the options are opened or closed in the same frame that they are clicked.
         """
+        self.text_wrapper.update_state()
+
+        for i in self.options:
+            i.update_state()
+
         if self.selected != self.prev_selected:
-            utils.call_func(self.on_value_changed, self.selected)
+            self._on_value_changed_bound(self.selected, self)
             self.prev_selected = self.selected
 
-        self.text_wrapper.update()
+    def render(self) -> None:
+        """Draw the dropdown button and active options to the screen, without updating them."""
+        self.text_wrapper.render()
 
         for i in self.options:
-            i.update()
+            i.render()
+
+    def update(self) -> None:
+        """
+        Update the dropdown object.
+
+        This should be called once per frame.
+        """
+        self.update_state()
+        self.render()
 
 
 class RectDropdown(Dropdown):
@@ -188,6 +266,8 @@ class RectDropdown(Dropdown):
         create the button objects for each of the options in the dropdown menu
     """
 
+    __slots__ = ()
+
     def __init__(self, surface: pygame.Surface, option_names: list[str], x: int, y: int, background_colour: tuple[int], width: int, height: int, font_colour: tuple[int], font_size: int, font_name: str | None = None, y_offset: int = 10, on_option_changed: callable = None, initial_option: int = 0, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, corner_radius: int = -1, start_active: bool = False, antialias: bool = False) -> None:
         """Construct the necessary attributes for the RectDropdown object."""
         button_object = button.RectButton(surface, x, y, background_colour, width, height, on_click, on_hover, on_normal, corner_radius)
@@ -228,6 +308,8 @@ class CircleDropdown(Dropdown):
         create the button objects for each of the options in the dropdown menu
     """
 
+    __slots__ = ()
+
     def __init__(self, surface: pygame.Surface, option_names: list[str], x: int, y: int, background_colour: tuple[int], radius: int, font_colour: tuple[int], font_size: int, font_name: str | None = None, y_offset: int = 10, on_option_changed: callable = None, initial_option: int = 0, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, start_active: bool = False, antialias: bool = False) -> None:
         """Construct the necessary attributes for the CircleDropdown object."""
         button_object = button.CircleButton(surface, x, y, background_colour, radius, on_click, on_hover, on_normal)
@@ -268,6 +350,8 @@ class BorderedRectDropdown(Dropdown):
         create the button objects for each of the options in the dropdown menu
     """
 
+    __slots__ = ()
+
     def __init__(self, surface: pygame.Surface, option_names: list[str], x: int, y: int, background_colour: tuple[int], border_colour: tuple[int], width: int, height: int, border_width: int, font_colour: tuple[int], font_size: int, font_name: str | None = None, y_offset: int = 10, on_option_changed: callable = None, initial_option: int = 0, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, corner_radius: int = -1, start_active: bool = False, antialias: bool = False) -> None:
         """Construct the necessary attributes for the BorderedRectDropdown object."""
         button_object = button.BorderedRectButton(surface, x, y, background_colour, border_colour, width, height, border_width, on_click, on_hover, on_normal, corner_radius)
@@ -308,6 +392,8 @@ class BorderedCircleDropdown(Dropdown):
         create the button objects for each of the options in the dropdown menu
     """
 
+    __slots__ = ()
+
     def __init__(self, surface: pygame.Surface, option_names: list[str], x: int, y: int, background_colour: tuple[int], border_colour: tuple[int], radius: int, border_width: int, font_colour: tuple[int], font_size: int, font_name: str | None = None, y_offset: int = 10, on_option_changed: callable = None, initial_option: int = 0, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, start_active: bool = False, antialias: bool = False) -> None:
         """Construct the necessary attributes for the BorderedCircleDropdown object."""
         button_object = button.BorderedCircleButton(surface, x, y, background_colour, border_colour, radius, border_width, on_click, on_hover, on_normal)
@@ -1,14 +1,37 @@
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
 from pygame_ui_toolkit.elements import button
 from pygame_ui_toolkit import utils
+from pygame_ui_toolkit import fonts
+from pygame_ui_toolkit import text_surfaces
+from pygame_ui_toolkit import text_buffer
+from pygame_ui_toolkit import render_queue
+from pygame_ui_toolkit import cache
+from pygame_ui_toolkit import input_state
 from pygame_ui_toolkit import pygame
 
 
+FONT_SIZE_CACHE_SIZE = 32
+
+# The run widths measured with more fonts than this are forgotten (see get_run_widths())
+MAX_MEASURED_FONTS = 8
+
+CURSOR_WIDTH = 2
+
+
 class TextInput:
     """
     The base class for all text inputs.
 
     This class can be used on its own, although the input_button object must be made manually.
 
+    The text is kept in a text_buffer.TextBuffer, which is edited at the cursor: the left and right arrow keys, home and end move the cursor (selecting text while shift is held), ctrl+a selects all of the text,
+    backspace and delete remove text, and other key presses insert their character (replacing the selected text). If show_cursor is True, clicking on the input also moves the cursor to the mouse.
+
+    Displayed text longer than text_buffer.MAX_RUN_LENGTH characters is rendered in the runs of the buffer, so an edit only renders the run it changed again, and runs outside the surface are not rendered or drawn at all.
+    Shorter text is rendered in one piece by the input button.
+
     Attributes
     ----------
     font_colour : tuple[int]
@@ -27,20 +50,42 @@ class TextInput:
         the function called every frame when the input is not selected, self is passed in as the first argument (defaults to None)
     on_text_input : callable | None, optional
         the fucntion called when text is inputted into the input. The inputted text is passed into the first argument and self is passed into the second argument (defaults to None)
+    buffer : text_buffer.TextBuffer
+        the text that has been inputted into the input, with the cursor and selection
     text : str
-        the text that has been inputted into the input
+        the text that has been inputted into the input (setting it replaces the text in the buffer)
     prefix_text : str, optional
         text displayed before the inputted text on the input (defaults to "")
     antialias : bool, optional
         whether the text is drawn with antialias (defaults to False)
     change_font_size : bool, optional
         whether the font size is automatically updated when text gets too wide (defaults to True)
+    show_cursor : bool, optional
+        whether the cursor and selected text are drawn while the input is selected (defaults to False)
     input_button : button.TextWrapper
         the button text wrapper object that handles detecting events such as clicks
     normal_button_on_click : callable | None
         the input_button on_click attribute before it is changed
     selected : bool
         whether the text input is currently selected
+    rendered_state : tuple | None
+        the prefix text, buffer version, font, background colour, position, cursor and selection the text was last rendered with (None if the text needs rendering)
+    render_count : int
+        the number of times the text has been rendered
+    font_size_cache : cache.LRUCache
+        the font sizes that fit the input button, keyed by the prefix text, buffer version, button width, font name and font size limits
+    run_widths : dict[pygame.font.Font, dict[str, int]]
+        the width of each run that has been measured, for each font it was measured with
+    layout : tuple | None
+        the font, runs, x position of each run, range of visible runs, y position and height of the displayed text when it was last rendered (None if it has not been rendered)
+    text_blits : tuple[tuple[pygame.Surface, tuple[int, int]]] | None
+        the surface and position of each visible run, or None if the text is drawn by the input button in one piece
+    selection_blits : tuple[tuple[pygame.Surface, tuple[int, int]]]
+        the surface and position of each visible piece of the selected text, drawn with the font and background colours swapped
+    cursor_rect : pygame.Rect | None
+        the rect the cursor is drawn in, or None if it is not drawn
+    preset_variables : dict[str, dict] | None
+        the variables stored on the input by presets, keyed by the preset name (None if no preset has been applied)
 
     Methods
     -------
@@ -49,22 +94,64 @@ class TextInput:
     setup_button()
         change the input button on_click attribute
     on_click()
-        set selected to True and call necessary functions
+        set selected to True, move the cursor to the mouse (if it is shown) and call necessary functions
     check_deselect()
         check whether mouse is outside of button and is clicking
+    edit_text(event: pygame.event.Event)
+        edit the text or move the cursor for a key press
     take_input(pygame_event_loop: pygame.event.Event)
-        loop through event loop and append any key presses to self.text
-    text_too_large()
-        return whether the text overfits the input button
+        loop through event loop and edit the text for any key presses
+    get_display_runs()
+        return the displayed text, split into the runs it is rendered in
+    get_run_widths(font: pygame.font.Font, runs: list[str])
+        return the width of each run, only measuring runs that have not been measured before
+    text_too_large(text_runs: list[str], btn_width: int, font_size: int)
+        return whether the text overfits the input button when drawn with the given font size
+    find_font_size(text_runs: list[str], btn_width: int)
+        return the largest font size (between min_font_size and og_font_size) that fits the text on the input button
     update_font_size()
         shrink text until it fits the input button
+    get_render_state()
+        return everything that affects how the text is rendered
+    get_layout(font: pygame.font.Font, runs: list[str])
+        return the position of each run of the displayed text, and which runs are visible
+    find_display_run(index: int)
+        return the index and start of the run that contains an index of the displayed text
+    get_index_x(index: int)
+        return the x position of an index of the displayed text
+    get_index_at_x(x: int)
+        return the index of the text closest to an x position
+    get_visible_blits(runs: list[str], run_xs: list[int], y: int, font_colour: tuple[int], background_colour: tuple[int] | None)
+        render the pieces of text that are on the surface and return their blits
+    get_selection_blits()
+        render the visible pieces of the selected text and return their blits
+    get_cursor_rect()
+        return the rect the cursor is drawn in
+    update_rendered_text()
+        render the text again if the render state has changed since it was last rendered
+    get_bounding_rect()
+        return the smallest rect that contains the input button, text and cursor
+    hit_test(x: int, y: int)
+        return whether a point is within the input button
+    get_visual_state()
+        return everything that affects how the text input is drawn
+    update_state(pygame_event_loop: list[pygame.event.Event])
+        take input and update the input button without drawing it
+    render()
+        draw the input button, text and cursor to the screen, without updating the input
     draw()
-        draw the input button and text to the screen
-    update()
+        update the input button (without taking any key input), then draw the input button, text and cursor to the screen
+    update(pygame_event_loop: list[pygame.event.Event])
         update the TextInput object
     """
 
-    def __init__(self, input_button: object, font_colour: tuple[int], font_size: int, font_name: str | None = None, on_selected: callable = None, on_deselect: callable = None, on_text_input: callable = None, start_text: str = "", prefix_text: str = "", min_font_size: int = 10, change_font_size: bool = True, antialias: bool = False) -> None:
+    __slots__ = ("font_colour", "font_name", "font_size", "og_font_size", "min_font_size", "_on_selected", "_on_selected_bound", "_on_deselect", "_on_deselect_bound", "_on_text_input", "_on_text_input_bound", "buffer", "prefix_text", "antialias", "change_font_size", "show_cursor", "input_button", "normal_button_on_click", "selected", "rendered_state", "render_count", "font_size_cache", "run_widths", "layout", "text_blits", "selection_blits", "cursor_rect", "preset_variables", "__weakref__")
+
+    on_selected = utils.CallbackAttribute()
+    on_deselect = utils.CallbackAttribute()
+    on_text_input = utils.CallbackAttribute()
+
+    def __init__(self, input_button: object, font_colour: tuple[int], font_size: int, font_name: str | None = None, on_selected: callable = None, on_deselect: callable = None, on_text_input: callable = None, start_text: str = "", prefix_text: str = "", min_font_size: int = 10, change_font_size: bool = True, antialias: bool = False, show_cursor: bool = False) -> None:
         """Construct the necessary attributes for the TextWrapper object."""
         self.font_colour = font_colour
         self.font_name = font_name
@@ -77,11 +164,12 @@ class TextInput:
         self.on_deselect = on_deselect
         self.on_text_input = on_text_input
 
-        self.text = start_text
+        self.buffer = text_buffer.TextBuffer(start_text)
         self.prefix_text = prefix_text
 
         self.antialias = antialias
         self.change_font_size = change_font_size
+        self.show_cursor = show_cursor
 
         self.input_button = self.create_text_wrapper(input_button)
         self.normal_button_on_click = self.input_button.button_object.on_click
@@ -90,6 +178,29 @@ class TextInput:
 
         self.selected = False
 
+        self.rendered_state = None
+        self.render_count = 0
+
+        self.font_size_cache = cache.LRUCache(FONT_SIZE_CACHE_SIZE)
+
+        self.run_widths = {}
+        self.layout = None
+        self.text_blits = None
+        self.selection_blits = ()
+        self.cursor_rect = None
+
+        self.preset_variables = None
+
+    @property
+    def text(self) -> str:
+        """Return the text that has been inputted into the input."""
+        return self.buffer.get_text()
+
+    @text.setter
+    def text(self, new_text: str) -> None:
+        """Replace the text in the buffer, moving the cursor to the end of it."""
+        self.buffer.set_text(new_text)
+
     def create_text_wrapper(self, input_button: object) -> button.TextWrapper:
         """Return a button.TextWrapper object."""
         if type(input_button) == button.TextWrapper:
@@ -104,65 +215,403 @@ class TextInput:
         self.input_button.button_object.on_click = self.on_click
         
     def on_click(self) -> None:
-        """Set selected to True and call necessary functions."""
+        """Set selected to True, move the cursor to the mouse (if show_cursor is True and the text has been rendered) and call necessary functions."""
         self.input_button.button_object.call_func(self.normal_button_on_click)
         self.selected = True
-        utils.call_func(self.on_selected, self)
+
+        if self.show_cursor and self.layout != None:
+            self.buffer.move_cursor(self.get_index_at_x(input_state.get_mouse_pos()[0]))
+
+        self._on_selected_bound(self)
 
     def check_deselect(self) -> None:
         """Check whether mouse is outside of button and is clicking."""
-        if pygame.mouse.get_pressed()[0] and not self.input_button.button_object.mouse_over():
+        if input_state.get_mouse_buttons()[0] and not self.input_button.button_object.mouse_over():
             self.selected = False
-            utils.call_func(self.on_deselect, self)
+            self._on_deselect_bound(self)
+
+    def edit_text(self, event: pygame.event.Event) -> None:
+        """Edit the text at the cursor, or move the cursor, for a KEYDOWN event."""
+        buffer = self.buffer
+
+        # Events posted by the program (rather than by pygame) may not have a mod attribute
+        mod = getattr(event, "mod", 0)
+        select = bool(mod & pygame.KMOD_SHIFT)
+
+        if event.key == pygame.K_BACKSPACE:
+            buffer.backspace()
+        elif event.key == pygame.K_DELETE:
+            buffer.delete_forward()
+        elif event.key == pygame.K_LEFT:
+            buffer.move_cursor(buffer.cursor - 1, select)
+        elif event.key == pygame.K_RIGHT:
+            buffer.move_cursor(buffer.cursor + 1, select)
+        elif event.key == pygame.K_HOME:
+            buffer.move_cursor(0, select)
+        elif event.key == pygame.K_END:
+            buffer.move_cursor(len(buffer), select)
+        elif event.key == pygame.K_a and mod & pygame.KMOD_CTRL:
+            buffer.select_all()
+        else:
+            buffer.insert(event.unicode)
 
     def take_input(self, pygame_event_loop: list[pygame.event.Event]) -> None:
-        """Loop through event loop and append any key presses to self.text."""     
+        """Loop through event loop and edit the text (see edit_text()) for any key presses."""
         for event in pygame_event_loop:
             if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_BACKSPACE:
-                    self.text = self.text[:-1]
-                else:
-                    self.text += event.unicode
+                self.edit_text(event)
 
-                utils.call_func(self.on_text_input, self.text, self)
+                # The text is only joined into a string if there is a function to pass it to
+                if self.on_text_input != None:
+                    self._on_text_input_bound(self.text, self)
 
-    def text_too_large(self) -> bool:
-        """Return whether the text overfits the input button."""
-        text_rect = self.input_button.get_text()[1]
-        text_width = text_rect.width
-        btn_width = self.input_button.button_object.get_width()
+    def get_display_runs(self) -> list[str]:
+        """
+        Return the displayed text (prefix_text followed by the text) split into the runs it is rendered in.
+
+        If the displayed text is no longer than text_buffer.MAX_RUN_LENGTH characters, it is rendered in one piece. Otherwise, the prefix text and each run of the buffer are rendered separately.
+        """
+        if len(self.prefix_text) + len(self.buffer) <= text_buffer.MAX_RUN_LENGTH:
+            return [f"{self.prefix_text}{self.text}"]
+        elif self.prefix_text == "":
+            return self.buffer.runs
+        else:
+            return [self.prefix_text] + self.buffer.runs
+
+    def get_run_widths(self, font: pygame.font.Font, runs: list[str]) -> list[int]:
+        """
+        Return the width of each run when it is rendered with font.
+
+        Runs are measured once and stored by their text, so after an edit only the run that changed is measured again.
+        The widths are looked up with map() rather than through the shared size cache, since every run is looked up each time the text changes.
+        """
+        widths = self.run_widths.get(font)
+
+        if widths == None:
+            if len(self.run_widths) >= MAX_MEASURED_FONTS:
+                self.run_widths.clear()
+
+            widths = {}
+            self.run_widths[font] = widths
+
+        try:
+            return list(map(widths.__getitem__, runs))
+        except KeyError:
+            pass
+
+        # Forget the widths of runs that are no longer in the text, so the dict does not grow with every edit
+        if len(widths) > 2 * len(runs):
+            old_widths = widths
+            widths = {run: old_widths[run] for run in runs if run in old_widths}
+            self.run_widths[font] = widths
+
+        for run in set(runs).difference(widths):
+            widths[run] = font.size(run)[0]
+
+        return list(map(widths.__getitem__, runs))
+
+    def text_too_large(self, text_runs: list[str], btn_width: int, font_size: int) -> bool:
+        """Return whether the text overfits the input button when drawn with the given font size."""
+        font = fonts.get_font(self.font_name, font_size)
+
+        return sum(self.get_run_widths(font, text_runs)) > btn_width
+    
+    def find_font_size(self, text_runs: list[str], btn_width: int) -> int:
+        """
+        Return the largest font size (between min_font_size and og_font_size) that fits the text on the input button.
+
+        The text is measured (rather than rendered) from the width of each run (see get_run_widths()), and the font sizes are binary searched, so only a few sizes are tried.
+        If the text does not fit at any size, min_font_size is returned.
+        """
+        low = self.min_font_size
+        high = self.og_font_size
 
-        return text_width > btn_width
+        if high <= low or not self.text_too_large(text_runs, btn_width, high):
+            return high
+
+        if self.text_too_large(text_runs, btn_width, low):
+            return low
+        
+        while low < high:
+            mid = (low + high + 1) // 2
+
+            if self.text_too_large(text_runs, btn_width, mid):
+                high = mid - 1
+            else:
+                low = mid
+
+        return low
 
     def update_font_size(self) -> None:
-        """Shrink text until it fits the input button."""
-        self.font_size = self.og_font_size
-        self.input_button.font = pygame.font.Font(self.font_name, self.font_size)
+        """
+        Shrink text until it fits the input button.
+
+        The font size is only searched for again when the text, button width or font changes.
+        The version of the buffer stands for the text, so the runs do not need joining into a string after every edit.
+        """
+        btn_width = self.input_button.button_object.get_width()
+
+        key = (self.prefix_text, self.buffer.version, btn_width, self.font_name, self.og_font_size, self.min_font_size)
+
+        self.font_size = self.font_size_cache.get(key, lambda: self.find_font_size(self.get_display_runs(), btn_width))
+
+    def get_render_state(self) -> tuple:
+        """
+        Return everything that affects how the text is rendered.
+
+        The version of the buffer stands for the text, so the text does not need comparing every frame.
+        """
+        btn = self.input_button.button_object
+        render_state = (self.prefix_text, self.buffer.version, self.font_colour, self.font_size, self.font_name, btn.background_colour, btn.get_pos())
+
+        if self.show_cursor and self.selected:
+            render_state += (self.buffer.cursor, self.buffer.get_selection())
+
+        return render_state
+
+    def get_layout(self, font: pygame.font.Font, runs: list[str]) -> tuple:
+        """
+        Return the font, runs, x position of each run, first and last (exclusive) index of the runs within the clip area of the surface, y position and height of the displayed text when it is centred on the input button.
+
+        The height is the tallest of the visible runs, since the height of rendered text depends on its characters.
+        """
+        run_widths = self.get_run_widths(font, runs)
+        centre_x, centre_y = self.input_button.button_object.get_pos()
+
+        run_xs = list(accumulate(run_widths, initial=centre_x - sum(run_widths) // 2))
+
+        if len(runs) == 1:
+            first_visible, last_visible = 0, 1
+        else:
+            clip = self.input_button.button_object.surface.get_clip()
+
+            first_visible = max(bisect_right(run_xs, clip.left) - 1, 0)
+            last_visible = max(bisect_left(run_xs, clip.right, hi=len(runs)), first_visible + 1)
+
+        height = max(text_surfaces.get_size(font, run)[1] for run in runs[first_visible:last_visible])
+
+        return font, runs, run_xs[:-1], first_visible, last_visible, centre_y - height // 2, height
+
+    def find_display_run(self, index: int) -> tuple[int, int]:
+        """Return the index and start of the run (in the layout) that contains an index of the displayed text."""
+        runs = self.layout[1]
+        prefix_length = len(self.prefix_text)
+
+        if len(runs) == 1 or index <= prefix_length or len(self.buffer) == 0:
+            return 0, 0
+
+        run_index, run_start = self.buffer.find_run(index - prefix_length)
+
+        if prefix_length > 0:
+            return run_index + 1, run_start + prefix_length
+
+        return run_index, run_start
+
+    def get_index_x(self, index: int) -> int:
+        """Return the x position of an index of the displayed text (the left of the character at index)."""
+        font, runs, run_xs = self.layout[:3]
+        run_index, run_start = self.find_display_run(index)
+
+        return run_xs[run_index] + text_surfaces.get_size(font, runs[run_index][:index - run_start])[0]
+
+    def get_index_at_x(self, x: int) -> int:
+        """
+        Return the index of the text (not including prefix_text) closest to an x position.
+
+        Each character of the run containing x is measured on its own (and cached), so positions near kerned pairs may be out by a pixel or two.
+        """
+        font, runs, run_xs = self.layout[:3]
+
+        run_index = max(bisect_right(run_xs, x) - 1, 0)
+        index = sum(len(run) for run in runs[:run_index])
 
-        while self.text_too_large() and self.font_size > self.min_font_size:
-            self.font_size -= 1
-            self.input_button.font = pygame.font.Font(self.font_name, self.font_size)
+        char_x = run_xs[run_index]
+        for char in runs[run_index]:
+            char_width = text_surfaces.get_size(font, char)[0]
+
+            if char_x + char_width // 2 >= x:
+                break
+
+            char_x += char_width
+            index += 1
+
+        return max(index - len(self.prefix_text), 0)
+
+    def get_visible_blits(self, pieces: list[str], piece_xs: list[int], y: int, font_colour: tuple[int], background_colour: tuple[int] | None) -> tuple[tuple[pygame.Surface, tuple[int, int]]]:
+        """Render the pieces of text that are (at least partly) within the clip area of the surface, and return the surface and position of each of them."""
+        font = self.layout[0]
+        clip = self.input_button.button_object.surface.get_clip()
+
+        blits = []
+        for piece, x in zip(pieces, piece_xs):
+            if x >= clip.right:
+                break
+
+            if x + text_surfaces.get_size(font, piece)[0] > clip.left:
+                blits.append((text_surfaces.render(font, piece, self.antialias, font_colour, background_colour), (x, y)))
+
+        return tuple(blits)
+
+    def get_selection_blits(self) -> tuple[tuple[pygame.Surface, tuple[int, int]]]:
+        """Render the visible pieces of the selected text (one for each run it covers) with the font and background colours swapped, and return their surfaces and positions."""
+        selection = self.buffer.get_selection()
+        background_colour = self.input_button.button_object.background_colour
+
+        if selection == None or background_colour == None:
+            return ()
+
+        runs = self.layout[1]
+        y = self.layout[5]
+        start, end = [i + len(self.prefix_text) for i in selection]
+
+        first_run, run_start = self.find_display_run(start)
+
+        pieces = []
+        piece_xs = []
+
+        for run_index in range(first_run, len(runs)):
+            run = runs[run_index]
+            piece = run[max(start - run_start, 0) : end - run_start]
+
+            if len(piece) > 0:
+                pieces.append(piece)
+                piece_xs.append(self.get_index_x(max(start, run_start)))
+
+            run_start += len(run)
+
+            if run_start >= end:
+                break
+
+        return self.get_visible_blits(pieces, piece_xs, y, background_colour, self.font_colour)
+
+    def get_cursor_rect(self) -> pygame.Rect | None:
+        """Return the rect the cursor is drawn in, or None if it is not drawn (the input is not selected, show_cursor is False or text is selected)."""
+        if not self.show_cursor or not self.selected or self.buffer.get_selection() != None:
+            return None
+
+        y, height = self.layout[5:]
+        x = self.get_index_x(self.buffer.cursor + len(self.prefix_text))
+
+        return pygame.Rect(x - CURSOR_WIDTH // 2, y, CURSOR_WIDTH, height)
+
+    def update_rendered_text(self) -> None:
+        """
+        Render the text again if the render state has changed since it was last rendered.
+
+        Text that is rendered in runs only renders the runs that changed (the others are in the shared text surface cache) and are within the surface.
+        """
+        render_state = self.get_render_state()
+
+        if render_state == self.rendered_state:
+            return
+
+        font = fonts.get_font(self.font_name, self.font_size)
+        runs = self.get_display_runs()
+
+        self.layout = self.get_layout(font, runs)
+
+        if len(runs) == 1:
+            self.input_button.update_text(runs[0], self.font_colour, self.font_size, self.font_name)
+            self.text_blits = None
+        else:
+            _, _, run_xs, first_visible, last_visible, y, _ = self.layout
+            background_colour = self.input_button.button_object.background_colour
+
+            self.text_blits = self.get_visible_blits(runs[first_visible:last_visible], run_xs[first_visible:last_visible], y, self.font_colour, background_colour)
+
+        if self.show_cursor and self.selected:
+            self.selection_blits = self.get_selection_blits()
+            self.cursor_rect = self.get_cursor_rect()
+        else:
+            self.selection_blits = ()
+            self.cursor_rect = None
+
+        self.rendered_state = render_state
+        self.render_count += 1
+
+    def get_bounding_rect(self) -> pygame.Rect:
+        """Return the smallest rect that contains the input button, text and cursor."""
+        rect = self.input_button.get_bounding_rect()
+
+        if self.text_blits != None:
+            rect = rect.unionall([pygame.Rect(pos, surf.get_size()) for surf, pos in self.text_blits])
+
+        if self.cursor_rect is not None:
+            rect = rect.union(self.cursor_rect)
+
+        return rect
+
+    def hit_test(self, x: int, y: int) -> bool:
+        """Return whether a point is within the input button, testing its hit rect before its exact shape."""
+        return self.input_button.hit_test(x, y)
+
+    def get_visual_state(self) -> tuple:
+        """
+        Return everything that affects how the text input is drawn.
+
+        The text is rendered at the end of update_state(), so the text surfaces in the state are up to date.
+        """
+        cursor_rect = None if self.cursor_rect is None else tuple(self.cursor_rect)
+
+        return self.input_button.get_visual_state() + (self.text_blits, self.selection_blits, cursor_rect)
+
+    def render(self) -> None:
+        """
+        Draw the input button, text and cursor to the screen, without updating the input. UIManager draws text inputs with this, since it updates them separately.
+
+        The text is only rendered again if the render state has changed since it was last rendered.
+        """
+        self.update_rendered_text()
+
+        surface = self.input_button.button_object.surface
+
+        if self.text_blits == None:
+            self.input_button.render()
+        else:
+            self.input_button.button_object.draw()
+            render_queue.blits(surface, self.text_blits)
+
+        if len(self.selection_blits) > 0:
+            render_queue.blits(surface, self.selection_blits)
+
+        if self.cursor_rect is not None:
+            render_queue.fill(surface, self.font_colour, self.cursor_rect)
 
     def draw(self) -> None:
-        """Draw the input button and text to the screen."""
-        self.input_button.update_text(f"{self.prefix_text}{self.text}", self.font_colour, self.font_size, self.font_name)
-        self.input_button.update()
+        """
+        Update the input button (without taking any key input), then draw the input button, text and cursor to the screen.
 
-    def update(self, pygame_event_loop: list[pygame.event.Event]) -> None:
+        This keeps code that only calls draw() handling clicks on the input. Use render() to draw without updating.
         """
-        Update the TextInput object.
+        self.update_state([])
+        self.render()
 
-        This should be called once per frame.
+    def update_state(self, pygame_event_loop: list[pygame.event.Event]) -> None:
+        """
+        Take input and update the input button without drawing it.
+
+        The font size is updated after the input is taken and the button is updated (which may resize it), so it always fits the current text.
         """
         self.check_deselect()
 
+        if self.selected:
+            self.take_input(pygame_event_loop)
+
+        self.input_button.update_state()
+
         if self.change_font_size:
             self.update_font_size()
 
-        if self.selected:
-            self.take_input(pygame_event_loop)
+        self.update_rendered_text()
 
-        self.draw()
+    def update(self, pygame_event_loop: list[pygame.event.Event]) -> None:
+        """
+        Update the TextInput object.
+
+        This should be called once per frame.
+        """
+        self.update_state(pygame_event_loop)
+        self.render()
 
 
 class RectTextInput(TextInput):
@@ -182,11 +631,13 @@ class RectTextInput(TextInput):
         return a button object with the appropriate shape
     """
 
-    def __init__(self, surface: pygame.Surface, x: int, y: int, background_colour: tuple[int],  width: int, height: int, font_colour: tuple[int], font_size: int, font_name: str | None = None, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, on_selected: callable = None, on_deselect: callable = None, on_text_input: callable = None, corner_radius: int = -1, click_once: bool = True, text: str = "", prefix_text: str = "", min_font_size: int = 10, change_font_size: bool = True, antialias: bool = False) -> None:
+    __slots__ = ()
+
+    def __init__(self, surface: pygame.Surface, x: int, y: int, background_colour: tuple[int],  width: int, height: int, font_colour: tuple[int], font_size: int, font_name: str | None = None, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, on_selected: callable = None, on_deselect: callable = None, on_text_input: callable = None, corner_radius: int = -1, click_once: bool = True, text: str = "", prefix_text: str = "", min_font_size: int = 10, change_font_size: bool = True, antialias: bool = False, show_cursor: bool = False) -> None:
         """Construct the necessary attributes for the RectTextInput object."""
         input_button = self.create_button(surface, x, y, background_colour, width, height, on_click, on_hover, on_normal, corner_radius, click_once)
         
-        super().__init__(input_button, font_colour, font_size, font_name, on_selected, on_deselect, on_text_input, text, prefix_text, min_font_size, change_font_size, antialias)
+        super().__init__(input_button, font_colour, font_size, font_name, on_selected, on_deselect, on_text_input, text, prefix_text, min_font_size, change_font_size, antialias, show_cursor)
 
     def create_button(self, surface: pygame.Surface, x: int, y: int, background_colour: tuple[int], width: int, height: int, on_click: callable, on_hover: callable, on_normal: callable, corner_radius: int, click_once: bool) -> button.RectButton:
         """Return a button object with the appropriate shape."""
@@ -211,12 +662,14 @@ class CircleTextInput(TextInput):
     create_button(surface: pygame.Surface, x: int, y: int, background_colour: tuple[int], width: int, height: int, on_click: callable, on_hover: callable, on_normal: callable, corner_radius: int, click_once: bool)
         return a button object with the appropriate shape
     """
+
+    __slots__ = ()
     
-    def __init__(self, surface: pygame.Surface, x: int, y: int, background_colour: tuple[int],  radius: int, font_colour: tuple[int], font_size: int, font_name: str | None = None, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, on_selected: callable = None, on_deselect: callable = None, on_text_input: callable = None, click_once: bool = True, text: str = "", prefix_text: str = "", min_font_size: int = 10, change_font_size: bool = True, antialias: bool = False) -> None:
+    def __init__(self, surface: pygame.Surface, x: int, y: int, background_colour: tuple[int],  radius: int, font_colour: tuple[int], font_size: int, font_name: str | None = None, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, on_selected: callable = None, on_deselect: callable = None, on_text_input: callable = None, click_once: bool = True, text: str = "", prefix_text: str = "", min_font_size: int = 10, change_font_size: bool = True, antialias: bool = False, show_cursor: bool = False) -> None:
         """Construct the necessary attributes for the CircleTextInput object."""
         input_button = self.create_button(surface, x, y, background_colour, radius, on_click, on_hover, on_normal, click_once)
         
-        super().__init__(input_button, font_colour, font_size, font_name, on_selected, on_deselect, on_text_input, text, prefix_text, min_font_size, change_font_size, antialias)
+        super().__init__(input_button, font_colour, font_size, font_name, on_selected, on_deselect, on_text_input, text, prefix_text, min_font_size, change_font_size, antialias, show_cursor)
 
     def create_button(self, surface: pygame.Surface, x: int, y: int, background_colour: tuple[int], radius: int, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, click_once: bool = True) -> button.CircleButton:
         """Return a button object with the appropriate shape."""
@@ -230,6 +683,8 @@ class PolygonTextInput(TextInput):
     A text input in the shape of any convex polygon.
     Concave polygons are not supported and will result in unexpected behaviour.
 
+    The input button is a button.PolygonButton, so the mouse is tested against the polygon using polygons.Polygon.
+
     Inherits from TextInput.
 
     Attributes
@@ -242,12 +697,14 @@ class PolygonTextInput(TextInput):
     create_button(surface: pygame.Surface, x: int, y: int, background_colour: tuple[int], width: int, height: int, on_click: callable, on_hover: callable, on_normal: callable, corner_radius: int, click_once: bool)
         return a button object with the appropriate shape
     """
+
+    __slots__ = ()
     
-    def __init__(self, surface: pygame.Surface, points: list[tuple[int]], background_colour: tuple[int], font_colour: tuple[int], font_size: int, font_name: str | None = None, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, on_selected: callable = None, on_deselect: callable = None, on_text_input: callable = None, click_once: bool = True, text: str = "", prefix_text: str = "", min_font_size: int = 10, antialias: bool = False) -> None:
+    def __init__(self, surface: pygame.Surface, points: list[tuple[int]], background_colour: tuple[int], font_colour: tuple[int], font_size: int, font_name: str | None = None, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, on_selected: callable = None, on_deselect: callable = None, on_text_input: callable = None, click_once: bool = True, text: str = "", prefix_text: str = "", min_font_size: int = 10, antialias: bool = False, show_cursor: bool = False) -> None:
         """Construct the necessary attributes for the PolygonTextInput object."""
         input_button = self.create_button(surface, points, background_colour, on_click, on_hover, on_normal, click_once)
         
-        super().__init__(input_button, font_colour, font_size, font_name, on_selected, on_deselect, on_text_input, text, prefix_text, min_font_size, False, antialias)
+        super().__init__(input_button, font_colour, font_size, font_name, on_selected, on_deselect, on_text_input, text, prefix_text, min_font_size, False, antialias, show_cursor)
 
     def create_button(self, surface: pygame.Surface, points: list[tuple[int]], background_colour: tuple[int], on_click: callable = None, on_hover: callable = None, on_normal: callable = None, click_once: bool = True) -> button.PolygonButton:
         """Return a button object with the appropriate shape."""
@@ -273,11 +730,13 @@ class BorderedRectTextInput(TextInput):
         return a button object with the appropriate shape
     """
 
-    def __init__(self, surface: pygame.Surface, x: int, y: int, background_colour: tuple[int], border_colour: tuple[int], width: int, height: int, border_width: int, font_colour: tuple[int], font_size: int, font_name: str | None = None, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, on_selected: callable = None, on_deselect: callable = None, on_text_input: callable = None, corner_radius: int = -1, click_once: bool = True, text: str = "", prefix_text: str = "", min_font_size: int = 10, change_font_size: bool = True, antialias: bool = False) -> None:
+    __slots__ = ()
+
+    def __init__(self, surface: pygame.Surface, x: int, y: int, background_colour: tuple[int], border_colour: tuple[int], width: int, height: int, border_width: int, font_colour: tuple[int], font_size: int, font_name: str | None = None, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, on_selected: callable = None, on_deselect: callable = None, on_text_input: callable = None, corner_radius: int = -1, click_once: bool = True, text: str = "", prefix_text: str = "", min_font_size: int = 10, change_font_size: bool = True, antialias: bool = False, show_cursor: bool = False) -> None:
         """Construct the necessary attributes for the BorderedRectTextInput object."""
         input_button = self.create_button(surface, x, y, background_colour, border_colour, width, height, border_width, on_click, on_hover, on_normal, corner_radius, click_once)
         
-        super().__init__(input_button, font_colour, font_size, font_name, on_selected, on_deselect, on_text_input, text, prefix_text, min_font_size, change_font_size, antialias)
+        super().__init__(input_button, font_colour, font_size, font_name, on_selected, on_deselect, on_text_input, text, prefix_text, min_font_size, change_font_size, antialias, show_cursor)
 
     def create_button(self, surface: pygame.Surface, x: int, y: int, background_colour: tuple[int], border_colour: tuple[int], width: int, height: int, border_width: int, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, corner_radius: int = -1, click_once: bool = True) -> button.BorderedRectButton:
         """Return a button object with the appropriate shape."""
@@ -303,11 +762,13 @@ class BorderedCircleTextInput(TextInput):
         return a button object with the appropriate shape
     """
 
-    def __init__(self, surface: pygame.Surface, x: int, y: int, background_colour: tuple[int],  border_colour: tuple[int], radius: int, border_width: int, font_colour: tuple[int], font_size: int, font_name: str | None = None, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, on_selected: callable = None, on_deselect: callable = None, on_text_input: callable = None, click_once: bool = True, text: str = "", prefix_text: str = "", min_font_size: int = 10, change_font_size: bool = True, antialias: bool = False) -> None:
+    __slots__ = ()
+
+    def __init__(self, surface: pygame.Surface, x: int, y: int, background_colour: tuple[int],  border_colour: tuple[int], radius: int, border_width: int, font_colour: tuple[int], font_size: int, font_name: str | None = None, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, on_selected: callable = None, on_deselect: callable = None, on_text_input: callable = None, click_once: bool = True, text: str = "", prefix_text: str = "", min_font_size: int = 10, change_font_size: bool = True, antialias: bool = False, show_cursor: bool = False) -> None:
         """Construct the necessary attributes for the BorderedCircleTextInput object."""
         input_button = self.create_button(surface, x, y, background_colour, border_colour, radius, border_width, on_click, on_hover, on_normal, click_once)
         
-        super().__init__(input_button, font_colour, font_size, font_name, on_selected, on_deselect, on_text_input, text, prefix_text, min_font_size, change_font_size, antialias)
+        super().__init__(input_button, font_colour, font_size, font_name, on_selected, on_deselect, on_text_input, text, prefix_text, min_font_size, change_font_size, antialias, show_cursor)
 
     def create_button(self, surface: pygame.Surface, x: int, y: int, background_colour: tuple[int], border_colour: tuple[int], radius: int, border_width: int, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, click_once: bool = True) -> button.BorderedCircleButton:
         """Return a button object with the appropriate shape."""
@@ -334,11 +795,13 @@ class BorderedPolygonTextInput(TextInput):
         return a button object with the appropriate shape
     """
 
-    def __init__(self, surface: pygame.Surface, points: list[tuple[int]], background_colour: tuple[int], border_colour: tuple[int], border_width: int, font_colour: tuple[int], font_size: int, font_name: str | None = None, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, on_selected: callable = None, on_deselect: callable = None, on_text_input: callable = None, click_once: bool = True, text: str = "", prefix_text: str = "", min_font_size: int = 10, antialias: bool = False) -> None:
+    __slots__ = ()
+
+    def __init__(self, surface: pygame.Surface, points: list[tuple[int]], background_colour: tuple[int], border_colour: tuple[int], border_width: int, font_colour: tuple[int], font_size: int, font_name: str | None = None, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, on_selected: callable = None, on_deselect: callable = None, on_text_input: callable = None, click_once: bool = True, text: str = "", prefix_text: str = "", min_font_size: int = 10, antialias: bool = False, show_cursor: bool = False) -> None:
         """Construct the necessary attributes for the BorderedPolygonTextInput object."""
         input_button = self.create_button(surface, points, background_colour, border_colour, border_width, on_click, on_hover, on_normal, click_once)
         
-        super().__init__(input_button, font_colour, font_size, font_name, on_selected, on_deselect, on_text_input, text, prefix_text, min_font_size, False, antialias)
+        super().__init__(input_button, font_colour, font_size, font_name, on_selected, on_deselect, on_text_input, text, prefix_text, min_font_size, False, antialias, show_cursor)
 
     def create_button(self, surface: pygame.Surface, points: list[tuple[int]], background_colour: tuple[int], border_colour: tuple[int], border_width: int, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, click_once: bool = True) -> button.BorderedPolygonButton:
         """Return a button object with the appropriate shape."""
@@ -0,0 +1,567 @@
+from time import perf_counter
+from bisect import insort
+
+from pygame_ui_toolkit.elements import button
+from pygame_ui_toolkit.elements import input
+from pygame_ui_toolkit.elements import text_area
+from pygame_ui_toolkit import input_state
+from pygame_ui_toolkit import spatial
+from pygame_ui_toolkit import render_queue
+from pygame_ui_toolkit import profiling
+from pygame_ui_toolkit import pygame
+
+
+MAX_SETTLE_PASSES = 4
+
+
+class UIManager:
+    """
+    A container that updates and draws a collection of UI elements with a single call per frame.
+
+    Any element with update_state() and draw() methods can be added (buttons, text wrappers, sliders, toggles, dropdowns, text inputs and text areas).
+    Elements with only a draw() method, such as text boxes, are drawn but not updated.
+    Elements with a render() method (whose draw() method also updates them) are drawn with render(), so they are not updated twice.
+    Elements are updated and drawn in order of their z order (given when they are added), then the order they were added, so later elements are drawn on top.
+
+    If use_spatial_index is True, buttons are hit tested with a spatial.SpatialGrid, so only the buttons near the mouse are tested each frame.
+    Buttons are moved in the spatial index when their x, y, width, height or radius are assigned to, but polygon buttons must have their geometry_changed() method called after their points are changed.
+
+    If background is given, the manager uses dirty rectangle rendering. Each frame, the visual state of every element is compared to the last frame,
+    and only the areas of the elements that changed are redrawn (the background is restored first, then every element in the area is drawn again in order).
+    draw_elements() and update() then return the changed rects, which should be passed to pygame.display.update() instead of updating the whole screen.
+    In this mode, every element must have get_visual_state() and get_bounding_rect() methods and be drawn to the manager's surface,
+    and the surface should not be filled each frame. Call invalidate() if anything else is drawn to the surface.
+
+    If event_driven is True, the elements are only updated on frames with mouse or keyboard events (or when the mouse has changed since the last frame).
+    Other frames skip the update pass, and with dirty rectangle rendering nothing is redrawn, so update() returns an empty list.
+    This allows the main loop to block on pygame.event.wait() instead of running every frame. Call request_update() to update the elements on the next frame regardless.
+    After a frame with input, the elements that the mouse has moved onto or off of (because a callback moved or resized them) are updated again until that stops happening (see settle_elements()), since there may not be another frame soon.
+    Note that on_click functions of buttons with click_once set to False are only called on frames with input, rather than every frame the button is held.
+
+    If batch_draws is True, the elements submit their draw commands to a render_queue.RenderQueue instead of drawing straight away, and the queue is flushed once every element has been drawn.
+    Consecutive blits are then drawn with one Surface.blits() call, and anything completely covered by a later opaque blit or fill is skipped.
+    The commands of each element with a get_visual_state() method are recorded, and reused on later frames until its visual state changes, so unchanged elements are not drawn again.
+    Elements must draw through the render_queue functions (every element in this package does) - anything drawn to the surface directly is drawn before (underneath) the queued commands.
+
+    While a profiler is enabled (see profiling.enable()), the update and draw of each element are timed, and update() ends the profiler's frame.
+
+    Attributes
+    ----------
+    elements : list[object]
+        every element owned by the manager, in the order they are drawn
+    z_orders : dict[object, int]
+        the z order of each element. Elements with a higher z order are drawn on top
+    draw_funcs : dict[object, callable]
+        the function that draws each element without updating it (render() if it has one, otherwise draw())
+    updated_elements : list[object]
+        the elements that have an update_state() method (other than buttons in the spatial index)
+    spatial_index : spatial.SpatialGrid | None
+        the spatial index used to hit test buttons (None if use_spatial_index is False)
+    indexed_buttons : list[button.Button]
+        the buttons that are hit tested using the spatial index
+    text_inputs : list[input.TextInput]
+        the elements that take keyboard input
+    text_areas : list[text_area.TextArea]
+        the elements that scroll with the mouse wheel, which are given every event
+    background : tuple[int] | pygame.Surface | None
+        the colour or image drawn behind the elements when using dirty rectangle rendering (None if it is not used)
+    surface : pygame.Surface | None
+        the surface the elements are drawn to, used for dirty rectangle rendering (defaults to the display surface)
+    visual_states : dict[object, tuple | None]
+        the visual state of each element when it was last drawn
+    drawn_rects : dict[object, pygame.Rect]
+        the bounding rect of each element when it was last drawn
+    removed_rects : list[pygame.Rect]
+        the areas of removed elements that need to be redrawn
+    redraw_all : bool
+        whether the whole surface is redrawn on the next frame
+    event_driven : bool
+        whether the elements are only updated on frames with input
+    update_pending : bool
+        whether the elements are updated on the next frame even if there is no input
+    skipped_updates : int
+        the number of frames where the update pass was skipped because there was no input
+    draw_queue : render_queue.RenderQueue | None
+        the queue the elements submit draw commands to (None if batch_draws is False)
+    recorded_draws : dict[object, tuple]
+        the visual state of each element when its draw commands were last recorded, and the commands (only used if batch_draws is True)
+    update_time : float
+        the time (in seconds) the last update pass took
+    draw_time : float
+        the time (in seconds) the last draw pass took
+
+    Methods
+    -------
+    add(*elements: object, z: int = 0)
+        add elements to the manager
+    set_z_order(element: object, z: int)
+        change the z order of an element
+    remove(element: object)
+        remove an element from the manager
+    clear()
+        remove every element from the manager
+    invalidate()
+        redraw the whole surface on the next frame
+    request_update()
+        update the elements on the next frame, even if there is no input
+    input_changed(prev_state: input_state.InputState | None, state: input_state.InputState)
+        return whether there is anything for the elements to respond to in the new input state
+    get_hit_states()
+        return whether the mouse is within each updated element that can be hit tested
+    settle_element(element: object, mouse_over: bool)
+        update a single element again without events
+    settle_elements(prev_hit_states: dict[object, bool])
+        update the elements whose hit state has changed again without events, until none of them change
+    merge_rects(rects: list[pygame.Rect])
+        return the rects clipped to the surface, with overlapping rects joined together
+    find_dirty_rects()
+        return the areas of the surface that have changed since the last frame
+    draw_each(elements: list[object])
+        draw each element in order, through the draw queue if draws are batched
+    redraw_rects(dirty_rects: list[pygame.Rect])
+        restore the background and draw every element within each rect
+    update_elements(pygame_event_loop: list[pygame.event.Event])
+        update the state of every element without drawing them
+    profile_update_elements(profiler: profiling.Profiler, pygame_event_loop: list[pygame.event.Event])
+        update the state of every element, timing each one
+    draw_elements()
+        draw every element (or only the changed areas when using dirty rectangle rendering)
+    update(pygame_event_loop: list[pygame.event.Event] | None = None)
+        capture the input for this frame, then update and draw every element
+    """
+
+    def __init__(self, elements: list[object] | None = None, use_spatial_index: bool = False, cell_size: int = spatial.DEFAULT_CELL_SIZE, background: tuple[int] | pygame.Surface | None = None, surface: pygame.Surface | None = None, event_driven: bool = False, batch_draws: bool = False) -> None:
+        """Construct the necessary attributes for the UIManager object."""
+        self.elements = []
+        self.z_orders = {}
+        self.draw_funcs = {}
+        self.updated_elements = []
+        self.text_inputs = []
+        self.text_areas = []
+
+        if use_spatial_index:
+            self.spatial_index = spatial.SpatialGrid(cell_size)
+        else:
+            self.spatial_index = None
+
+        self.indexed_buttons = []
+
+        self.background = background
+        self.surface = surface
+
+        self.visual_states = {}
+        self.drawn_rects = {}
+        self.removed_rects = []
+        self.redraw_all = True
+
+        self.event_driven = event_driven
+        self.update_pending = True
+        self.skipped_updates = 0
+
+        if batch_draws:
+            self.draw_queue = render_queue.RenderQueue()
+        else:
+            self.draw_queue = None
+
+        self.recorded_draws = {}
+
+        self.update_time = 0
+        self.draw_time = 0
+
+        if elements != None:
+            self.add(*elements)
+
+    def add(self, *elements: object, z: int = 0) -> None:
+        """
+        Add elements to the manager.
+
+        The elements are drawn on top of every element with a lower z order, and every element with the same z order that was added before them.
+        """
+        for element in elements:
+            if self.background != None:
+                if not hasattr(element, "get_visual_state") or not hasattr(element, "get_bounding_rect"):
+                    raise Exception(f"{type(element).__name__} does not support dirty rectangle rendering")
+
+                self.visual_states[element] = None
+                self.drawn_rects[element] = element.get_bounding_rect()
+
+            self.z_orders[element] = z
+            insort(self.elements, element, key=self.z_orders.__getitem__)
+
+            if hasattr(element, "render"):
+                self.draw_funcs[element] = element.render
+            else:
+                self.draw_funcs[element] = element.draw
+
+            if self.draw_queue != None and hasattr(element, "get_visual_state"):
+                self.recorded_draws[element] = (None, [])
+
+            self.update_pending = True
+
+            if isinstance(element, input.TextInput):
+                self.text_inputs.append(element)
+            elif isinstance(element, text_area.TextArea):
+                self.text_areas.append(element)
+            elif self.spatial_index != None and isinstance(element, button.Button):
+                self.spatial_index.insert(element)
+                self.indexed_buttons.append(element)
+            elif hasattr(element, "update_state"):
+                self.updated_elements.append(element)
+
+    def remove(self, element: object) -> None:
+        """Remove an element from the manager."""
+        self.elements.remove(element)
+        del self.z_orders[element]
+        del self.draw_funcs[element]
+        self.recorded_draws.pop(element, None)
+
+        if element in self.drawn_rects:
+            self.removed_rects.append(self.drawn_rects.pop(element))
+            del self.visual_states[element]
+
+        if element in self.text_inputs:
+            self.text_inputs.remove(element)
+        elif element in self.text_areas:
+            self.text_areas.remove(element)
+        elif element in self.indexed_buttons:
+            self.spatial_index.remove(element)
+            self.indexed_buttons.remove(element)
+        elif element in self.updated_elements:
+            self.updated_elements.remove(element)
+
+    def clear(self) -> None:
+        """Remove every element from the manager."""
+        for element in self.indexed_buttons:
+            self.spatial_index.remove(element)
+
+        self.elements.clear()
+        self.z_orders.clear()
+        self.draw_funcs.clear()
+        self.recorded_draws.clear()
+        self.updated_elements.clear()
+        self.text_inputs.clear()
+        self.text_areas.clear()
+        self.indexed_buttons.clear()
+
+        self.visual_states.clear()
+        self.drawn_rects.clear()
+        self.invalidate()
+
+    def set_z_order(self, element: object, z: int) -> None:
+        """Change the z order of an element, moving it on top of every element with the same z order."""
+        self.elements.remove(element)
+
+        self.z_orders[element] = z
+        insort(self.elements, element, key=self.z_orders.__getitem__)
+
+        if element in self.visual_states:
+            self.visual_states[element] = None
+
+    def invalidate(self) -> None:
+        """
+        Redraw the whole surface on the next frame.
+
+        This only affects dirty rectangle rendering.
+        """
+        self.redraw_all = True
+
+    def request_update(self) -> None:
+        """
+        Update the elements on the next frame, even if there is no input.
+
+        This only affects event driven updates.
+        """
+        self.update_pending = True
+
+    def input_changed(self, prev_state: input_state.InputState | None, state: input_state.InputState) -> bool:
+        """Return whether there is anything for the elements to respond to in the new input state."""
+        if prev_state == None or state.has_input_events():
+            return True
+        
+        return state.mouse_pos != prev_state.mouse_pos or state.mouse_buttons != prev_state.mouse_buttons
+
+    def get_hit_states(self) -> dict[object, bool]:
+        """Return whether the mouse is within each updated element that has a hit_test() method, keyed by the element."""
+        x, y = input_state.get_mouse_pos()
+
+        return {element: element.hit_test(x, y) for element in self.indexed_buttons + self.updated_elements + self.text_inputs + self.text_areas if hasattr(element, "hit_test")}
+
+    def settle_element(self, element: object, mouse_over: bool) -> None:
+        """Update a single element again without events, in the same way as update_elements() (buttons are given whether the mouse is over them)."""
+        if isinstance(element, (input.TextInput, text_area.TextArea)):
+            args = ([],)
+        elif isinstance(element, button.Button):
+            args = (mouse_over,)
+        else:
+            args = ()
+
+        if profiling.active_profiler != None:
+            profiling.active_profiler.time_element(element, "update", element.update_state, *args)
+        else:
+            element.update_state(*args)
+
+    def settle_elements(self, prev_hit_states: dict[object, bool]) -> None:
+        """
+        Update the elements whose hit state has changed since the update pass again without events, until none of them change (up to MAX_SETTLE_PASSES times).
+
+        Callbacks can move or resize elements (e.g. the button_size_change preset), which changes what the mouse is over.
+        When updating every frame this is resolved over the next few frames, but when event driven those frames may not happen until the next input.
+        Elements the mouse is still over (or still not over) are not updated again, so their callbacks (e.g. on_click of buttons with click_once set to False) are only called once per frame.
+        """
+        for _ in range(MAX_SETTLE_PASSES):
+            hit_states = self.get_hit_states()
+            changed = [element for element, mouse_over in hit_states.items() if mouse_over != prev_hit_states.get(element)]
+
+            if len(changed) == 0:
+                return
+
+            for element in changed:
+                self.settle_element(element, hit_states[element])
+
+            prev_hit_states = hit_states
+
+    def update_elements(self, pygame_event_loop: list[pygame.event.Event]) -> None:
+        """
+        Update the state of every element without drawing them.
+
+        The event loop is passed to every text area (for mouse wheel events) and to text inputs that are selected - all other elements are given no events.
+        """
+        start = perf_counter()
+
+        if profiling.active_profiler != None:
+            self.profile_update_elements(profiling.active_profiler, pygame_event_loop)
+            self.update_time = perf_counter() - start
+
+            return
+
+        if self.spatial_index != None:
+            x, y = input_state.get_mouse_pos()
+            hits = set(self.spatial_index.elements_at(x, y))
+
+            for element in self.indexed_buttons:
+                element.update_state(element in hits)
+
+        for element in self.updated_elements:
+            element.update_state()
+
+        for text_input in self.text_inputs:
+            if text_input.selected:
+                text_input.update_state(pygame_event_loop)
+            else:
+                text_input.update_state([])
+
+        for element in self.text_areas:
+            element.update_state(pygame_event_loop)
+
+        self.update_time = perf_counter() - start
+
+    def profile_update_elements(self, profiler: profiling.Profiler, pygame_event_loop: list[pygame.event.Event]) -> None:
+        """Update the state of every element in the same way as update_elements(), adding the time each element takes to the profiler."""
+        if self.spatial_index != None:
+            # The hit tests done by the spatial index are added to the profiler by hit_test.check_point()
+            x, y = input_state.get_mouse_pos()
+            hits = set(self.spatial_index.elements_at(x, y))
+
+            for element in self.indexed_buttons:
+                profiler.time_element(element, "update", element.update_state, element in hits)
+
+        for element in self.updated_elements:
+            profiler.time_element(element, "update", element.update_state)
+
+        for text_input in self.text_inputs:
+            if text_input.selected:
+                profiler.time_element(text_input, "update", text_input.update_state, pygame_event_loop)
+            else:
+                profiler.time_element(text_input, "update", text_input.update_state, [])
+
+        for element in self.text_areas:
+            profiler.time_element(element, "update", element.update_state, pygame_event_loop)
+
+    def merge_rects(self, rects: list[pygame.Rect]) -> list[pygame.Rect]:
+        """Return the rects clipped to the surface, with overlapping rects joined together."""
+        surface_rect = self.surface.get_rect()
+
+        merged = []
+        for rect in rects:
+            rect = rect.clip(surface_rect)
+
+            if rect.width == 0 or rect.height == 0:
+                continue
+
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+
+            merged.append(rect)
+
+        return merged
+
+    def find_dirty_rects(self) -> list[pygame.Rect]:
+        """
+        Return the areas of the surface that have changed since the last frame.
+
+        For every element whose visual state has changed, both the area it was last drawn to and the area it now covers are dirty.
+        """
+        dirty_rects = self.removed_rects
+        self.removed_rects = []
+
+        for element in self.elements:
+            visual_state = element.get_visual_state()
+
+            if visual_state != self.visual_states[element]:
+                new_rect = element.get_bounding_rect()
+
+                dirty_rects.append(self.drawn_rects[element])
+                dirty_rects.append(new_rect)
+
+                self.visual_states[element] = visual_state
+                self.drawn_rects[element] = new_rect
+
+        if self.redraw_all:
+            self.redraw_all = False
+
+            return [self.surface.get_rect()]
+
+        return self.merge_rects(dirty_rects)
+    
+    def draw_each(self, elements: list[object]) -> None:
+        """
+        Draw each element in order.
+
+        If draws are batched, the elements add their draw commands to the draw queue (with their z order), which is then flushed.
+        Elements whose visual state is the same as when their commands were last recorded add those commands again without being drawn.
+        """
+        profiler = profiling.active_profiler
+
+        if self.draw_queue == None:
+            if profiler == None:
+                for element in elements:
+                    self.draw_funcs[element]()
+            else:
+                for element in elements:
+                    profiler.time_element(element, "draw", self.draw_funcs[element])
+
+            return
+
+        z = 0
+        render_queue.start_collecting(self.draw_queue, z)
+
+        try:
+            for element in elements:
+                if self.z_orders[element] != z:
+                    z = self.z_orders[element]
+                    render_queue.set_z_order(z)
+
+                recorded = self.recorded_draws.get(element)
+
+                if recorded == None:
+                    if profiler == None:
+                        self.draw_funcs[element]()
+                    else:
+                        profiler.time_element(element, "draw", self.draw_funcs[element])
+
+                    continue
+
+                visual_state = element.get_visual_state()
+
+                if visual_state != recorded[0]:
+                    if profiler == None:
+                        commands = render_queue.record(self.draw_funcs[element])
+                    else:
+                        commands = profiler.time_element(element, "draw", render_queue.record, self.draw_funcs[element])
+
+                    recorded = (visual_state, commands)
+                    self.recorded_draws[element] = recorded
+
+                render_queue.add_commands(recorded[1])
+        finally:
+            render_queue.stop_collecting()
+
+        if profiler == None:
+            self.draw_queue.flush()
+        else:
+            start = perf_counter()
+            self.draw_queue.flush()
+            profiler.add_time("flush", perf_counter() - start)
+
+    def redraw_rects(self, dirty_rects: list[pygame.Rect]) -> None:
+        """
+        Restore the background and draw every element within each rect.
+
+        Drawing is clipped to each rect, so elements partly inside it do not draw over anything outside it.
+        """
+        prev_clip = self.surface.get_clip()
+
+        for rect in dirty_rects:
+            self.surface.set_clip(rect)
+
+            if isinstance(self.background, pygame.Surface):
+                self.surface.blit(self.background, rect, rect)
+            else:
+                self.surface.fill(self.background, rect)
+
+            self.draw_each([i for i in self.elements if self.drawn_rects[i].colliderect(rect)])
+
+        self.surface.set_clip(prev_clip)
+
+    def draw_elements(self) -> list[pygame.Rect] | None:
+        """
+        Draw every element (or only the changed areas when using dirty rectangle rendering).
+
+        When using dirty rectangle rendering, the rects that were redrawn are returned. Otherwise, None is returned.
+        """
+        start = perf_counter()
+
+        if self.background == None:
+            self.draw_each(self.elements)
+
+            dirty_rects = None
+        else:
+            if self.surface == None:
+                self.surface = pygame.display.get_surface()
+
+            dirty_rects = self.find_dirty_rects()
+            self.redraw_rects(dirty_rects)
+
+        self.draw_time = perf_counter() - start
+
+        return dirty_rects
+
+    def update(self, pygame_event_loop: list[pygame.event.Event] | None = None) -> list[pygame.Rect] | None:
+        """
+        Capture the input for this frame, then update and draw every element.
+
+        This should be called once per frame with the result of pygame.event.get().
+        When using dirty rectangle rendering, the rects that were redrawn are returned (to be passed to pygame.display.update()). Otherwise, None is returned.
+
+        If the manager is event driven, the update pass is skipped when there is no input.
+        The input snapshot is only used while the elements are updated (see input_state.capture()).
+        """
+        if pygame_event_loop == None:
+            pygame_event_loop = []
+
+        prev_state = input_state.last_captured_state
+        state = input_state.capture(pygame_event_loop)
+
+        try:
+            if not self.event_driven:
+                self.update_elements(pygame_event_loop)
+            elif self.update_pending or self.input_changed(prev_state, state):
+                self.update_pending = False
+
+                hit_states = self.get_hit_states()
+                self.update_elements(pygame_event_loop)
+                self.settle_elements(hit_states)
+            else:
+                self.skipped_updates += 1
+        finally:
+            # The snapshot is only for this frame, so elements updated outside the manager do not keep reading it
+            input_state.set_state(None)
+
+        dirty_rects = self.draw_elements()
+
+        if profiling.active_profiler != None:
+            profiling.active_profiler.end_frame()
+
+        return dirty_rects
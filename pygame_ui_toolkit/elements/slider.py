@@ -1,5 +1,7 @@
 from pygame_ui_toolkit.elements import button
 from pygame_ui_toolkit import utils
+from pygame_ui_toolkit import input_state
+from pygame_ui_toolkit import render_queue
 from pygame_ui_toolkit import pygame
 
 
@@ -38,6 +40,8 @@ class Slider:
         an object from the button module that acts as the clickable button in the slider
     normal_button_on_click : callable | None
         the button object's on_click function before it was changed in setup_button()
+    preset_variables : dict[str, dict] | None
+        the variables stored on the slider by presets, keyed by the preset name (None if no preset has been applied)
 
     Methods
     -------
@@ -47,10 +51,20 @@ class Slider:
         prepare the slider button object for use
     on_slider_button_click()
         call the normal_button_on_click() and update button pos to mouse pos
+    get_bounding_rect()
+        return the smallest rect that contains the slider bar and slider button
+    get_visual_state()
+        return everything that affects how the slider is drawn
+    update_state()
+        update the slider button object and call on_value_changed if necessary, without drawing the slider
     update()
         draw slider to the screen, update the slider button object and call on_value_changed if necessary
     """
 
+    __slots__ = ("surface", "length", "width", "x", "y", "min_value", "max_value", "value", "prev_value", "slider_colour", "_on_value_changed", "_on_value_changed_bound", "normal_button_on_click", "preset_variables", "slider_button", "__weakref__")
+
+    on_value_changed = utils.CallbackAttribute()
+
     def __init__(self, surface: pygame.Surface, length: int, width: int, x: int, y: int, min_value: float, max_value: float, start_value: float, slider_colour: tuple[int], on_value_changed: callable = None, slider_button: object | None = None, button_colour: tuple[int] = (255, 255, 255), button_radius: int | None = None) -> None:
         """Construct the necessary attributes for the Slider object."""
         self.surface = surface
@@ -80,6 +94,8 @@ class Slider:
 
         self.normal_button_on_click = self.slider_button.on_click
 
+        self.preset_variables = None
+
         self.check_start_in_range(min_value, max_value, start_value)
         self.setup_button()
 
@@ -100,32 +116,51 @@ class Slider:
         self.slider_button.x = int(x)
         self.slider_button.y = int(y)
 
+        self.slider_button.geometry_changed()
+
     def on_slider_button_click(self) -> None:
         """Call the normal_button_on_click() and update button pos to mouse pos."""
         self.slider_button.call_func(self.normal_button_on_click)
 
-        x, y = pygame.mouse.get_pos()
+        x, y = input_state.get_mouse_pos()
 
         self.slider_button.x = x
         self.slider_button.y = y
 
         self.clamp_button_pos()
+        self.slider_button.geometry_changed()
 
         self.value = self.get_value()
 
-    def update(self) -> None:
+    def get_bounding_rect(self) -> pygame.Rect:
+        """Return the smallest rect that contains the slider bar and slider button."""
+        return self.get_bar_rect().union(self.slider_button.get_bounding_rect())
+
+    def get_visual_state(self) -> tuple:
+        """Return everything that affects how the slider is drawn."""
+        return (self.x, self.y, self.length, self.width, self.slider_colour) + self.slider_button.get_visual_state()
+
+    def update_state(self) -> None:
         """
-        Draw slider to the screen, update the slider button object and call on_value_changed if necessary.
+        Update the slider button object and call on_value_changed if necessary, without drawing the slider.
 
-        This should be called once per frame.
+        The button is updated first, so on_value_changed is called in the same frame that the value changes.
         """
+        self.slider_button.update_state()
+
         if self.value != self.prev_value:
-            utils.call_func(self.on_value_changed, self.value, self)
+            self._on_value_changed_bound(self.value, self)
 
             self.prev_value = self.value
 
+    def update(self) -> None:
+        """
+        Draw slider to the screen, update the slider button object and call on_value_changed if necessary.
+
+        This should be called once per frame.
+        """
+        self.update_state()
         self.draw()
-        self.slider_button.update()
 
     
 class HorizontalSlider(Slider):
@@ -148,10 +183,14 @@ class HorizontalSlider(Slider):
         change the button position so that it is within the slider region
     get_value()
         calculate the slider value based on the current button position
+    get_bar_rect()
+        return the rect of the slider bar
     draw()
-        draw the slider bar to the screen
+        draw the slider bar and slider button to the screen
     """
 
+    __slots__ = ()
+
     def __init__(self, surface: pygame.Surface, length: int, height: int, x: int, y: int, min_value: float, max_value: float, start_value: float, slider_colour: tuple[int], on_value_changed: callable = None, slider_button: object | None = None, button_colour: tuple[int] = (255, 255, 255), button_radius: int | None = None) -> None:
         """Call __init__ from parent Slider class."""
         super().__init__(surface, length, height, x, y, min_value, max_value, start_value, slider_colour, on_value_changed, slider_button, button_colour, button_radius)
@@ -186,10 +225,15 @@ class HorizontalSlider(Slider):
 
         return self.min_value + proportion * range
     
+    def get_bar_rect(self) -> pygame.Rect:
+        """Return the rect of the slider bar."""
+        return pygame.Rect(self.x - self.length // 2, self.y - self.width // 2, self.length, self.width)
+
     def draw(self) -> None:
-        """Draw the slider bar to the screen."""
-        rect = pygame.Rect(self.x - self.length // 2, self.y - self.width // 2, self.length, self.width)
-        pygame.draw.rect(self.surface, self.slider_colour, rect)
+        """Draw the slider bar and slider button to the screen."""
+        render_queue.fill(self.surface, self.slider_colour, self.get_bar_rect())
+
+        self.slider_button.draw()
 
 
 class VerticalSlider(Slider):
@@ -212,10 +256,14 @@ class VerticalSlider(Slider):
         change the button position so that it is within the slider region
     get_value()
         calculate the slider value based on the current button position
+    get_bar_rect()
+        return the rect of the slider bar
     draw()
-        draw the slider bar to the screen
+        draw the slider bar and slider button to the screen
     """
 
+    __slots__ = ()
+
     def __init__(self, surface: pygame.Surface, length: int, width: int, x: int, y: int, min_value: float, max_value: float, start_value: float, slider_colour: tuple[int], on_value_changed: callable = None, slider_button: object | None = None, button_colour: tuple[int] = (255, 255, 255), button_radius: int | None = None) -> None:
         """Call __init__ from parent Slider class."""
         super().__init__(surface, length, width, x, y, min_value, max_value, start_value, slider_colour, on_value_changed, slider_button, button_colour, button_radius)
@@ -251,7 +299,12 @@ class VerticalSlider(Slider):
 
         return self.max_value - value
     
+    def get_bar_rect(self) -> pygame.Rect:
+        """Return the rect of the slider bar."""
+        return pygame.Rect(self.x - self.width // 2, self.y - self.length // 2, self.width, self.length)
+
     def draw(self) -> None:
-        """Draw the slider bar to the screen."""
-        rect = pygame.Rect(self.x - self.width // 2, self.y - self.length // 2, self.width, self.length)
-        pygame.draw.rect(self.surface, self.slider_colour, rect)
\ No newline at end of file
+        """Draw the slider bar and slider button to the screen."""
+        render_queue.fill(self.surface, self.slider_colour, self.get_bar_rect())
+
+        self.slider_button.draw()
\ No newline at end of file
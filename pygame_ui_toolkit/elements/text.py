@@ -1,5 +1,11 @@
 from pygame_ui_toolkit import pygame
 from pygame_ui_toolkit import utils
+from pygame_ui_toolkit import fonts
+from pygame_ui_toolkit import text_surfaces
+from pygame_ui_toolkit import render_queue
+from pygame_ui_toolkit import polygons
+from pygame_ui_toolkit import hit_test
+from pygame_ui_toolkit import input_state
 
 
 class TextBox:
@@ -27,17 +33,41 @@ class TextBox:
         the surface used to render text
     text_rect : pygame.Rect
         the rect position that the text is drawn to
+    rendered_state : tuple | None
+        the text, font colour, font and antialias the text was last rendered with (None if the text needs rendering)
+    hit_rect : pygame.Rect | None
+        the cached shape rect that points are tested against before the exact shape (None until it is next needed, after the geometry changes)
+    hit_rect_is_exact : bool
+        whether the hit rect is exactly the text box region, so no exact test is needed (a class attribute)
 
     Methods
     -------
     get_text()
         return a text surface to draw and a rect object to draw it to
+    get_render_state()
+        return everything that affects how the text is rendered
     update_text()
         change the text, font colour, font size or font name of the displayed text
     blit_text()
         draw the text to the screen
+    get_bounding_rect()
+        return the smallest rect that contains the text box and text
+    get_visual_state()
+        return everything that affects how the text box is drawn
+    geometry_changed()
+        update the hit rect and text position after the position or size of the text box is changed
+    get_hit_rect()
+        return the rect that points are tested against before the exact shape
+    hit_test(x: int, y: int)
+        return whether a point is within the text box, testing the hit rect before the exact shape
+    mouse_over()
+        return whether the mouse is within the text box
     """
 
+    __slots__ = ("surface", "text", "background_colour", "font_colour", "font", "antialias", "text_surface", "text_rect", "rendered_state", "hit_rect", "__weakref__")
+
+    hit_rect_is_exact = False
+
     def __init__(self, surface: pygame.Surface, text: str, background_colour: tuple[int], font_colour: tuple[int], font_size: int, font_name: str | None = None, antialias: bool = False) -> None:
         """Construct the necessary attributes of the TextBox object."""
         self.surface = surface
@@ -47,15 +77,18 @@ class TextBox:
         self.background_colour = background_colour
         self.font_colour = font_colour
 
-        self.font = pygame.font.Font(font_name, font_size)
+        self.font = fonts.get_font(font_name, font_size)
 
         self.antialias = antialias
 
-        self.text_surface, self.text_rect = self.get_text()
+        self.rendered_state = None
+        utils.update_rendered_text(self)
+
+        self.hit_rect = None
 
     def get_text(self) -> tuple[pygame.Surface, pygame.Rect]:
         """Return a text surface to draw and a rect object to draw it to."""
-        text_surface = self.font.render(self.text, self.antialias, self.font_colour)
+        text_surface = text_surfaces.render(self.font, self.text, self.antialias, self.font_colour)
         
         text_rect = text_surface.get_rect()
 
@@ -66,20 +99,61 @@ class TextBox:
 
         return text_surface, text_rect
 
+    def get_render_state(self) -> tuple:
+        """Return everything that affects how the text is rendered."""
+        return self.text, self.font_colour, self.font, self.antialias
+
     def update_text(self, new_text: str, new_font_colour: tuple[int], new_font_size: int, new_font_name: str | None) -> None:
-        """Change the text, font colour, font size or font name of the displayed text."""
+        """
+        Change the text, font colour, font size or font name of the displayed text.
+
+        The text is only rendered again if something has changed, so this can be called every frame (e.g. for a counter) without rendering the same text each time.
+        """
         utils.update_font_attrs(self, new_text, new_font_colour, new_font_name, new_font_size)
 
-        self.text_surface, self.text_rect = self.get_text()
+        utils.update_rendered_text(self)
 
     def blit_text(self) -> None:
         """Draw the text to the screen."""
-        self.surface.blit(self.text_surface, self.text_rect)
+        render_queue.blit(self.surface, self.text_surface, self.text_rect)
+
+    def get_bounding_rect(self) -> pygame.Rect:
+        """Return the smallest rect that contains the text box and text."""
+        return self.get_shape_rect().union(self.text_rect)
+
+    def get_visual_state(self) -> tuple:
+        """Return everything that affects how the text box is drawn."""
+        return self.get_shape_state() + (self.background_colour, self.text_surface, self.text_rect.topleft)
+
+    def geometry_changed(self) -> None:
+        """
+        Update the hit rect and text position after the position or size of the text box is changed.
+
+        Subclasses update the center attribute before calling this.
+        """
+        self.hit_rect = None
+
+        self.text_rect.center = self.center
+
+    def get_hit_rect(self) -> pygame.Rect:
+        """Return the rect that points are tested against before the exact shape."""
+        return self.get_shape_rect()
+
+    def hit_test(self, x: int, y: int) -> bool:
+        """Return whether a point is within the text box, testing the hit rect before the exact shape (see hit_test.check_point())."""
+        return hit_test.check_point(self, x, y)
+
+    def mouse_over(self) -> bool:
+        """Return whether the mouse is within the text box."""
+        x, y = input_state.get_mouse_pos()
+
+        return hit_test.check_point(self, x, y)
 
 
 class PolygonTextBox(TextBox):
     """
-    A text box in the shape of any polygon.
+    A text box in the shape of any convex polygon.
+    Concave polygons can be drawn, but contains_point() will not work for them.
 
     This inherits from TextBox.
 
@@ -90,21 +164,35 @@ class PolygonTextBox(TextBox):
         a list of the coordinates of each point on the polygon
     center : tuple[int]
         the coordinates of the center of the text box shape
+    polygon : polygons.Polygon
+        the precomputed edges and bounding box of the points, used to test whether points are within the text box
 
     Methods
     -------
     This class contains all methods from the TextBox class, alongside these additional ones:
     get_center()
         return the center of the polygon by averaging all points
+    geometry_changed()
+        update the center, polygon and text position after the points are changed
+    contains_point(x: int, y: int)
+        return whether a point is within (or on an edge of) the polygon
+    get_shape_rect()
+        return the smallest rect that contains the polygon
+    get_shape_state()
+        return the points of the polygon
     draw() - overwritten from TextBox
         draw the text and text box to the screen
     """
 
+    __slots__ = ("points", "center", "polygon")
+
     def __init__(self, surface: pygame.Surface, points: list[tuple[int]], text: str, background_colour: tuple[int], font_colour: tuple[int], font_size: int, font_name: str | None = None, antialias: bool = False) -> None:
         """Construct the necessary attributes for the PolygonTextBox object."""
         self.points = points
         self.center = self.get_center()
 
+        self.polygon = polygons.Polygon(points)
+
         super().__init__(surface, text, background_colour, font_colour, font_size, font_name, antialias)
 
     def get_center(self) -> tuple[int]:
@@ -116,10 +204,33 @@ class PolygonTextBox(TextBox):
         y = sum(y_values) // len(y_values)
 
         return x, y
+
+    def geometry_changed(self) -> None:
+        """
+        Update the center, polygon and text position after the points are changed.
+
+        This should be called after changing the points attribute.
+        """
+        self.center = self.get_center()
+        self.polygon = polygons.Polygon(self.points)
+
+        super().geometry_changed()
+
+    def contains_point(self, x: int, y: int) -> bool:
+        """Return whether a point is within (or on an edge of) the polygon (see polygons.Polygon)."""
+        return self.polygon.contains_point(x, y)
     
+    def get_shape_rect(self) -> pygame.Rect:
+        """Return the smallest rect that contains the polygon."""
+        return self.polygon.get_bounding_rect()
+
+    def get_shape_state(self) -> tuple:
+        """Return the points of the polygon."""
+        return tuple(self.points),
+
     def draw(self) -> None:
         """Draw the text and text box to the screen."""
-        pygame.draw.polygon(self.surface, self.background_colour, self.points)
+        render_queue.draw(pygame.draw.polygon, self.surface, self.background_colour, self.points, rect=self.get_shape_rect())
         self.blit_text()
 
 
@@ -148,10 +259,29 @@ class RectTextBox(TextBox):
     Methods
     -------
     This class contains all methods from the TextBox class, alongside these additional ones:
+    geometry_changed()
+        update the center, hit rect and text position after x, y, width or height are changed
+    contains_point(x: int, y: int)
+        return whether a point is colliding with, or within the region of, the rectangle
+    get_shape_rect()
+        return the rect of the text box
+    get_hit_rect() - overwritten from TextBox
+        return the rect of every point that contains_point() accepts
+    get_shape_state()
+        return the position and size of the rectangle
     draw() - overwritten from TextBox
         draw the text and text box to the screen
     """
 
+    __slots__ = ("_x", "_y", "center", "_width", "_height", "corner_radius")
+
+    hit_rect_is_exact = True
+
+    x = utils.geometry_attribute("x")
+    y = utils.geometry_attribute("y")
+    width = utils.geometry_attribute("width")
+    height = utils.geometry_attribute("height")
+
     def __init__(self, surface: pygame.Surface, x: int, y: int, width: int, height: int, text: str, background_colour: tuple[int], font_colour: tuple[int], font_size: int, font_name: str | None = None, corner_radius: int = -1, antialias: bool = False) -> None:        
         """Construct the necessary attributes for the RectTextBox object."""
         self.x = x
@@ -165,10 +295,44 @@ class RectTextBox(TextBox):
         self.corner_radius = corner_radius
 
         super().__init__(surface, text, background_colour, font_colour, font_size, font_name, antialias)
+
+    def geometry_changed(self) -> None:
+        """
+        Update the center, hit rect and text position after x, y, width or height are changed.
+
+        The hit rect is updated when they are assigned to, but this should be called after changing x or y to move the text.
+        """
+        self.center = (self.x, self.y)
+
+        super().geometry_changed()
+
+    def contains_point(self, x: int, y: int) -> bool:
+        """Return whether a point is colliding with, or within the region of, the rectangle (the same test as RectButton.contains_point)."""
+        min_x = self.x - self.width // 2
+        max_x = self.x + self.width // 2
+        min_y = self.y - self.height // 2
+        max_y = self.y + self.height // 2
+
+        return min_x <= x <= max_x and min_y <= y <= max_y
         
+    def get_shape_rect(self) -> pygame.Rect:
+        """Return the rect of the text box."""
+        return pygame.Rect(self.x - self.width // 2, self.y - self.height // 2, self.width, self.height)
+
+    def get_hit_rect(self) -> pygame.Rect:
+        """Return the rect of every point that contains_point() accepts, which includes the right and bottom edges like RectButton."""
+        half_width = self.width // 2
+        half_height = self.height // 2
+
+        return pygame.Rect(self.x - half_width, self.y - half_height, 2 * half_width + 1, 2 * half_height + 1)
+
+    def get_shape_state(self) -> tuple:
+        """Return the position and size of the rectangle."""
+        return self.x, self.y, self.width, self.height
+
     def draw(self) -> None:
         """Draw the text and text box to the screen."""
-        pygame.draw.rect(self.surface, self.background_colour, (self.x - self.width // 2, self.y - self.height // 2, self.width, self.height))
+        render_queue.fill(self.surface, self.background_colour, self.get_shape_rect())
 
         self.blit_text()
 
@@ -194,10 +358,24 @@ class CircleTextBox(TextBox):
     Methods
     -------
     This class contains all methods from the TextBox class, alongside these additional ones:
+    geometry_changed()
+        update the center, hit rect and text position after x, y or radius are changed
+    contains_point(x: int, y: int)
+        return whether a point is within the circle
+    get_shape_rect()
+        return the smallest rect that contains the circle
+    get_shape_state()
+        return the position and radius of the circle
     draw() - overwritten from TextBox
         draw the text and text box to the screen
     """
 
+    __slots__ = ("_x", "_y", "center", "_radius")
+
+    x = utils.geometry_attribute("x")
+    y = utils.geometry_attribute("y")
+    radius = utils.geometry_attribute("radius")
+
     def __init__(self, surface: pygame.Surface, x: int, y: int, radius: int, text: str, background_colour: tuple[int], font_colour: tuple[int], font_size: int, font_name: str | None = None, antialias: bool = False) -> None:
         """Construct the necessary attributes for the CircleTextBox object."""
         self.x = x
@@ -208,10 +386,32 @@ class CircleTextBox(TextBox):
         self.radius = radius
         
         super().__init__(surface, text, background_colour, font_colour, font_size, font_name, antialias)
+
+    def geometry_changed(self) -> None:
+        """
+        Update the center, hit rect and text position after x, y or radius are changed.
+
+        The hit rect is updated when they are assigned to, but this should be called after changing x or y to move the text.
+        """
+        self.center = (self.x, self.y)
+
+        super().geometry_changed()
+
+    def contains_point(self, x: int, y: int) -> bool:
+        """Return whether a point is within the circle."""
+        return (x - self.center[0])**2 + (y - self.center[1])**2 < self.radius**2
     
+    def get_shape_rect(self) -> pygame.Rect:
+        """Return the smallest rect that contains the circle."""
+        return pygame.Rect(self.center[0] - self.radius, self.center[1] - self.radius, 2 * self.radius + 1, 2 * self.radius + 1)
+
+    def get_shape_state(self) -> tuple:
+        """Return the position and radius of the circle."""
+        return self.center, self.radius
+
     def draw(self) -> None:
         """Draw the text and text box to the screen."""
-        pygame.draw.circle(self.surface, self.background_colour, self.center, self.radius)
+        render_queue.draw(pygame.draw.circle, self.surface, self.background_colour, self.center, self.radius, rect=self.get_shape_rect())
         self.blit_text()
 
 
@@ -232,10 +432,16 @@ class BorderedPolygonTextBox(PolygonTextBox):
     Methods
     -------
     This class contains all methods from the PolygonTextBox class, alongside these overwritten ones:
+    get_shape_rect() - overwritten from PolygonTextBox
+        return the smallest rect that contains the polygon and its border
+    get_visual_state() - overwritten from PolygonTextBox
+        return everything that affects how the text box and border are drawn
     draw() - overwritten from PolygonTextBox
         draw the text and text box with border to the screen
     """
 
+    __slots__ = ("border_colour", "border_width")
+
     def __init__(self, surface: pygame.Surface, points: list[tuple[int, int]], text: str, background_colour: tuple[int], border_colour: tuple[int], border_width: int, font_colour: tuple[int], font_size: int, font_name: str | None = None, antialias: bool = False) -> None:
         """Construct the necessary attributes for the BorderedPolygonTextBox object."""
         super().__init__(surface, points, text, background_colour, font_colour, font_size, font_name, antialias)
@@ -243,10 +449,20 @@ class BorderedPolygonTextBox(PolygonTextBox):
         self.border_colour = border_colour
         self.border_width = border_width
 
+    def get_shape_rect(self) -> pygame.Rect:
+        """Return the smallest rect that contains the polygon and its border (which can extend past the points)."""
+        return super().get_shape_rect().inflate(2 * self.border_width, 2 * self.border_width)
+
+    def get_visual_state(self) -> tuple:
+        """Return everything that affects how the text box and border are drawn."""
+        return super().get_visual_state() + (self.border_colour, self.border_width)
+
     def draw(self) -> None:
         """Draw the text and text box with border to the screen."""
-        pygame.draw.polygon(self.surface, self.background_colour, self.points)
-        pygame.draw.polygon(self.surface, self.border_colour, self.points, self.border_width)
+        shape_rect = self.get_shape_rect()
+
+        render_queue.draw(pygame.draw.polygon, self.surface, self.background_colour, self.points, rect=shape_rect)
+        render_queue.draw(pygame.draw.polygon, self.surface, self.border_colour, self.points, self.border_width, rect=shape_rect)
 
         self.blit_text()
 
@@ -268,9 +484,13 @@ class BorderedRectTextBox(RectTextBox):
     Methods
     -------
     This class contains all methods from the RectTextBox class, alongside these overwritten ones:
+    get_visual_state() - overwritten from RectTextBox
+        return everything that affects how the text box and border are drawn
     draw() - overwritten from RectTextBox
         draw the text and text box with border to the screen
     """
+
+    __slots__ = ("border_colour", "border_width")
         
     def __init__(self, surface: pygame.Surface, x: int, y: int, width: int, height: int, text: str, background_colour: tuple[int], border_colour: tuple[int], border_width: int, font_colour: tuple[int], font_size: int, font_name: str | None = None, antialias: bool = False) -> None:
         """Construct the necessary attributes for the BorderedRectTextBox object."""
@@ -279,10 +499,16 @@ class BorderedRectTextBox(RectTextBox):
         self.border_colour = border_colour
         self.border_width = border_width
 
+    def get_visual_state(self) -> tuple:
+        """Return everything that affects how the text box and border are drawn."""
+        return super().get_visual_state() + (self.border_colour, self.border_width)
+
     def draw(self) -> None:
         """Draw the text and text box with border to the screen."""
-        pygame.draw.rect(self.surface, self.background_colour, (self.x - self.width // 2, self.y - self.height // 2, self.width, self.height))
-        pygame.draw.rect(self.surface, self.border_colour, (self.x - self.width // 2, self.y - self.height // 2, self.width, self.height), self.border_width)
+        shape_rect = self.get_shape_rect()
+
+        render_queue.fill(self.surface, self.background_colour, shape_rect)
+        render_queue.draw(pygame.draw.rect, self.surface, self.border_colour, shape_rect, self.border_width, rect=shape_rect)
 
         self.blit_text()
 
@@ -304,9 +530,13 @@ class BorderedCircleTextBox(CircleTextBox):
     Methods
     -------
     This class contains all methods from the CircleTextBox class, alongside these overwritten ones:
+    get_visual_state() - overwritten from CircleTextBox
+        return everything that affects how the text box and border are drawn
     draw() - overwritten from CircleTextBox
         draw the text and text box with border to the screen
     """
+
+    __slots__ = ("border_colour", "border_width")
         
     def __init__(self, surface: pygame.Surface, x: int, y: int, radius: int, text: str, background_colour: tuple[int], border_colour: tuple[int], border_width: int, font_colour: tuple[int], font_size: int, font_name: str | None = None, antialias: bool = False) -> None:
         """Construct the necessary attributes for the BorderedCircleTextBox object."""
@@ -315,9 +545,15 @@ class BorderedCircleTextBox(CircleTextBox):
         self.border_colour = border_colour
         self.border_width = border_width
 
+    def get_visual_state(self) -> tuple:
+        """Return everything that affects how the text box and border are drawn."""
+        return super().get_visual_state() + (self.border_colour, self.border_width)
+
     def draw(self) -> None:
         """Draw the text and text box with border to the screen."""
-        pygame.draw.circle(self.surface, self.background_colour, self.center, self.radius)
-        pygame.draw.circle(self.surface, self.border_colour, self.center, self.radius, self.border_width)
+        shape_rect = self.get_shape_rect()
+
+        render_queue.draw(pygame.draw.circle, self.surface, self.background_colour, self.center, self.radius, rect=shape_rect)
+        render_queue.draw(pygame.draw.circle, self.surface, self.border_colour, self.center, self.radius, self.border_width, rect=shape_rect)
 
         self.blit_text()
\ No newline at end of file
@@ -0,0 +1,695 @@
+from pygame_ui_toolkit import utils
+from pygame_ui_toolkit import fonts
+from pygame_ui_toolkit import shapes
+from pygame_ui_toolkit import render_queue
+from pygame_ui_toolkit import cache
+from pygame_ui_toolkit import hit_test
+from pygame_ui_toolkit import input_state
+from pygame_ui_toolkit import pygame
+
+
+DEFAULT_PADDING = 6
+
+# The number of rows scrolled for each step of the mouse wheel
+DEFAULT_SCROLL_SPEED = 3
+
+SCROLLBAR_WIDTH = 6
+MIN_THUMB_HEIGHT = 16
+
+# The rendered rows of a text area that are kept, so scrolling back over rows that were just shown does not render them again
+MAX_ROW_SURFACES = 256
+
+
+def find_split(font: pygame.font.Font, word: str, max_width: int) -> int:
+    """Return the number of characters at the start of a word that fit within max_width (at least 1, so the word always gets shorter)."""
+    low = 1
+    high = len(word)
+
+    while low < high:
+        middle = (low + high + 1) // 2
+
+        if font.size(word[:middle])[0] <= max_width:
+            low = middle
+        else:
+            high = middle - 1
+
+    return low
+
+
+def wrap_line(font: pygame.font.Font, line: str, max_width: int) -> tuple[str]:
+    """
+    Split a line of text into the rows it is drawn as, so that each row fits within max_width.
+
+    Rows are broken at spaces where possible. Words that are wider than max_width on their own are broken between characters.
+    """
+    if font.size(line)[0] <= max_width:
+        return (line,)
+
+    rows = []
+    row = None
+
+    for word in line.split(" "):
+        candidate = word if row == None else f"{row} {word}"
+
+        if font.size(candidate)[0] <= max_width:
+            row = candidate
+            continue
+
+        if row != None:
+            rows.append(row)
+
+        while len(word) > 1 and font.size(word)[0] > max_width:
+            split = find_split(font, word, max_width)
+
+            rows.append(word[:split])
+            word = word[split:]
+
+        row = word
+
+    rows.append(row)
+
+    return tuple(rows)
+
+
+class TextArea:
+    """
+    A rectangular area that shows many lines of text, which can be scrolled with the mouse wheel or the scrollbar.
+
+    Only the rows that are on screen are wrapped and rendered, so the cost of a frame does not depend on the number of lines (a text area can hold hundreds of thousands of lines, e.g. for a log).
+    Each line is wrapped the first time it is shown and the rows are kept until the line (or the width or font) changes, so editing or adding lines only wraps those lines again.
+    The scroll position is stored as a line and a row within it rather than as a pixel offset, so scrolling only needs the rows between the old and new position.
+
+    The scrollbar position is an estimate, since lines that have not been shown yet are counted as a single row.
+
+    Attributes
+    ----------
+    surface : pygame.Surface
+        the surface that the text area is drawn to
+    x : int
+        the x coordinate of the center of the text area
+    y : int
+        the y coordinate of the center of the text area
+    width : int
+        the width (parallel to the x axis) of the text area
+    height : int
+        the height (parallel to the y axis) of the text area
+    background_colour : tuple[int]
+        the colour of the text area
+    font_colour : tuple[int]
+        the colour of the text
+    font : pygame.font.Font
+        the font object used to render the text
+    wrap : bool, optional
+        whether lines that are too wide are wrapped onto more rows. If False, they are cut off at the edge of the text area (defaults to True)
+    padding : int, optional
+        the space between the edge of the text area and the text (defaults to DEFAULT_PADDING)
+    corner_radius : int, optional
+        the radius of the rounded corners of the text area, where -1 means no rounded corners (defaults to -1)
+    border_colour : tuple[int] | None, optional
+        the colour of the border, or None for no border (defaults to None)
+    border_width : int, optional
+        the width of the border (defaults to 0)
+    scrollbar_colour : tuple[int] | None, optional
+        the colour of the scrollbar, or None to not draw a scrollbar (defaults to None)
+    scroll_speed : int, optional
+        the number of rows scrolled for each step of the mouse wheel (defaults to DEFAULT_SCROLL_SPEED)
+    max_lines : int | None, optional
+        the maximum number of lines, where the oldest lines are removed once there are more (defaults to None, for no limit)
+    follow_end : bool, optional
+        whether the text area keeps showing the end of the text when lines are added while it is scrolled to the end, like a log (defaults to True)
+    antialias : bool, optional
+        whether the text is drawn with antialias (defaults to False)
+    lines : list[str]
+        the lines of text
+    wrapped_lines : list[tuple[str] | None]
+        the rows each line is drawn as, or None if the line has not been wrapped since it last changed
+    num_rows : int
+        the estimated number of rows (lines that have not been wrapped are counted as one row)
+    top_line : int
+        the index of the line at the top of the text area
+    top_row : int
+        the index of the row of top_line at the top of the text area
+    version : int
+        the number of times the text has changed
+    wrap_state : tuple | None
+        the font, width and wrap setting the wrapped lines were wrapped with
+    row_surfaces : cache.LRUCache
+        the rendered rows, keyed by their text
+    render_state : tuple | None
+        the font, colours and antialias the row surfaces were rendered with
+    layout_state : tuple | None
+        everything that affected the row blits and scrollbar when they were last worked out
+    row_blits : list[tuple]
+        the (surface, position, area) of each visible row that is drawn
+    thumb_rect : pygame.Rect | None
+        the rect of the scrollbar thumb, or None if there is no scrollbar
+    dragging : bool
+        whether the scrollbar is being dragged with the mouse
+    hit_rect : pygame.Rect | None
+        the cached rect that points are tested against (None until it is next needed, after the geometry changes)
+    hit_rect_is_exact : bool
+        whether the hit rect is exactly the text area region, so no exact test is needed (a class attribute)
+
+    Methods
+    -------
+    set_text(text: str)
+        replace all of the text and scroll to the top
+    get_text()
+        return all of the text as a single string
+    append_text(text: str)
+        add text to the end as new lines
+    set_line(index: int, text: str)
+        replace a single line
+    insert_lines(index: int, lines: list[str])
+        insert lines before the line at index
+    remove_lines(start: int, end: int)
+        remove the lines from start up to (but not including) end
+    text_changed()
+        record that the text has changed
+    get_inner_rect()
+        return the rect the text is drawn within
+    get_wrap_width()
+        return the width lines are wrapped to
+    check_wrap_state()
+        forget the wrapped lines if the font, width or wrap setting has changed
+    get_rows(index: int)
+        return the rows a line is drawn as, wrapping it if needed
+    get_num_visible_rows()
+        return the number of whole rows that fit in the text area
+    get_end_position()
+        return the line and row at the top of the text area when it is scrolled to the end
+    is_at_end()
+        return whether the text area is scrolled to the end
+    clamp_scroll()
+        keep the scroll position within the text
+    scroll(num_rows: int)
+        scroll down (or up, if num_rows is negative) by a number of rows
+    scroll_to_line(index: int)
+        scroll so a line is at the top of the text area
+    scroll_to_end()
+        scroll so the last row is at the bottom of the text area
+    get_scroll_fraction(position: tuple[int, int])
+        return the estimated number of lines before a scroll position
+    get_scrollbar_rect()
+        return the rect the scrollbar thumb moves within
+    drag_scrollbar()
+        scroll to the line under the mouse while the scrollbar is dragged
+    get_row_surface(row: str)
+        return a rendered row
+    get_layout_state()
+        return everything that affects the row blits and scrollbar
+    update_layout()
+        work out the visible rows and scrollbar, if anything has changed
+    geometry_changed()
+        update the hit rect after x, y, width or height are changed
+    contains_point(x: int, y: int)
+        return whether a point is colliding with, or within the region of, the text area
+    get_shape_rect()
+        return the rect of the text area
+    get_hit_rect()
+        return the rect of every point that contains_point() accepts
+    hit_test(x: int, y: int)
+        return whether a point is within the text area
+    mouse_over()
+        return whether the mouse is within the text area
+    get_bounding_rect()
+        return the smallest rect that contains the text area
+    get_visual_state()
+        return everything that affects how the text area is drawn
+    update_state(pygame_event_loop: list[pygame.event.Event])
+        scroll with the mouse wheel and scrollbar, without drawing the text area
+    draw()
+        draw the text area, the visible rows and the scrollbar
+    update(pygame_event_loop: list[pygame.event.Event])
+        update and draw the text area
+    """
+
+    __slots__ = ("surface", "_x", "_y", "_width", "_height", "background_colour", "font_colour", "font", "wrap", "padding", "corner_radius", "border_colour", "border_width", "scrollbar_colour", "scroll_speed", "max_lines", "follow_end", "antialias", "lines", "wrapped_lines", "num_rows", "top_line", "top_row", "version", "wrap_state", "row_surfaces", "render_state", "layout_state", "row_blits", "thumb_rect", "dragging", "hit_rect", "__weakref__")
+
+    hit_rect_is_exact = True
+
+    x = utils.geometry_attribute("x")
+    y = utils.geometry_attribute("y")
+    width = utils.geometry_attribute("width")
+    height = utils.geometry_attribute("height")
+
+    def __init__(self, surface: pygame.Surface, x: int, y: int, width: int, height: int, background_colour: tuple[int], font_colour: tuple[int], font_size: int, font_name: str | None = None, text: str = "", wrap: bool = True, padding: int = DEFAULT_PADDING, corner_radius: int = -1, border_colour: tuple[int] | None = None, border_width: int = 0, scrollbar_colour: tuple[int] | None = None, scroll_speed: int = DEFAULT_SCROLL_SPEED, max_lines: int | None = None, follow_end: bool = True, antialias: bool = False) -> None:
+        """Construct the necessary attributes for the TextArea object."""
+        self.surface = surface
+
+        self.x = x
+        self.y = y
+
+        self.width = width
+        self.height = height
+
+        self.background_colour = background_colour
+        self.font_colour = font_colour
+
+        self.font = fonts.get_font(font_name, font_size)
+
+        self.wrap = wrap
+        self.padding = padding
+
+        self.corner_radius = corner_radius
+        self.border_colour = border_colour
+        self.border_width = border_width
+
+        self.scrollbar_colour = scrollbar_colour
+        self.scroll_speed = scroll_speed
+
+        self.max_lines = max_lines
+        self.follow_end = follow_end
+
+        self.antialias = antialias
+
+        self.version = 0
+        self.wrap_state = None
+
+        self.row_surfaces = cache.LRUCache(MAX_ROW_SURFACES)
+        self.render_state = None
+
+        self.layout_state = None
+        self.row_blits = []
+        self.thumb_rect = None
+
+        self.dragging = False
+        self.hit_rect = None
+
+        self.set_text(text)
+
+    def set_text(self, text: str) -> None:
+        """Replace all of the text (lines are separated by "\\n") and scroll to the top."""
+        self.lines = text.split("\n")
+        self.wrapped_lines = [None] * len(self.lines)
+        self.num_rows = len(self.lines)
+
+        self.top_line = 0
+        self.top_row = 0
+
+        if self.max_lines != None and len(self.lines) > self.max_lines:
+            self.remove_lines(0, len(self.lines) - self.max_lines)
+
+        self.text_changed()
+
+    def get_text(self) -> str:
+        """Return all of the text as a single string, with the lines separated by "\\n"."""
+        return "\n".join(self.lines)
+
+    def append_text(self, text: str) -> None:
+        """
+        Add text to the end of the text area as new lines (separated by "\\n").
+
+        If follow_end is True and the text area was scrolled to the end, it is scrolled to the new end. If there are now more than max_lines lines, the oldest lines are removed.
+        """
+        follow = self.follow_end and self.is_at_end()
+
+        new_lines = text.split("\n")
+
+        self.lines += new_lines
+        self.wrapped_lines += [None] * len(new_lines)
+        self.num_rows += len(new_lines)
+
+        if self.max_lines != None and len(self.lines) > self.max_lines:
+            self.remove_lines(0, len(self.lines) - self.max_lines)
+
+        if follow:
+            self.scroll_to_end()
+
+        self.text_changed()
+
+    def set_line(self, index: int, text: str) -> None:
+        """Replace the line at index with text (which should not contain "\\n"). Only this line is wrapped again."""
+        wrapped = self.wrapped_lines[index]
+
+        if wrapped != None:
+            self.num_rows -= len(wrapped) - 1
+
+        self.lines[index] = text
+        self.wrapped_lines[index] = None
+
+        self.clamp_scroll()
+        self.text_changed()
+
+    def insert_lines(self, index: int, lines: list[str]) -> None:
+        """Insert lines before the line at index. The text area keeps showing the same lines if they are inserted above it."""
+        self.lines[index:index] = lines
+        self.wrapped_lines[index:index] = [None] * len(lines)
+        self.num_rows += len(lines)
+
+        if index <= self.top_line and (index < self.top_line or self.top_row > 0):
+            self.top_line += len(lines)
+
+        self.clamp_scroll()
+        self.text_changed()
+
+    def remove_lines(self, start: int, end: int) -> None:
+        """
+        Remove the lines from start up to (but not including) end.
+
+        The text area keeps showing the same lines if lines above it are removed. There is always at least one (possibly empty) line.
+        """
+        start = max(start, 0)
+        end = min(end, len(self.lines))
+
+        if start >= end:
+            return
+
+        for wrapped in self.wrapped_lines[start:end]:
+            self.num_rows -= 1 if wrapped == None else len(wrapped)
+
+        del self.lines[start:end]
+        del self.wrapped_lines[start:end]
+
+        if len(self.lines) == 0:
+            self.lines.append("")
+            self.wrapped_lines.append(None)
+            self.num_rows += 1
+
+        if self.top_line >= end:
+            self.top_line -= end - start
+        elif self.top_line >= start:
+            self.top_line = start
+            self.top_row = 0
+
+        self.clamp_scroll()
+        self.text_changed()
+
+    def text_changed(self) -> None:
+        """Record that the text has changed, so the visible rows are worked out again."""
+        self.version += 1
+
+    def get_inner_rect(self) -> pygame.Rect:
+        """Return the rect the text is drawn within (the text area without the padding and scrollbar)."""
+        scrollbar_width = 0 if self.scrollbar_colour == None else SCROLLBAR_WIDTH + self.padding
+
+        rect = self.get_shape_rect().inflate(-2 * self.padding, -2 * self.padding)
+        rect.width -= scrollbar_width
+
+        return rect
+
+    def get_wrap_width(self) -> int:
+        """Return the width lines are wrapped to (at least 1 pixel)."""
+        return max(self.get_inner_rect().width, 1)
+
+    def check_wrap_state(self) -> None:
+        """Forget every wrapped line if the font, width or wrap setting has changed since they were wrapped."""
+        wrap_state = (self.font, self.get_wrap_width(), self.wrap)
+
+        if wrap_state != self.wrap_state:
+            self.wrap_state = wrap_state
+
+            self.wrapped_lines = [None] * len(self.lines)
+            self.num_rows = len(self.lines)
+
+            self.top_row = 0
+
+    def get_rows(self, index: int) -> tuple[str]:
+        """Return the rows the line at index is drawn as, wrapping the line if it has not been wrapped since it changed."""
+        rows = self.wrapped_lines[index]
+
+        if rows == None:
+            if self.wrap:
+                rows = wrap_line(self.font, self.lines[index], self.wrap_state[1])
+            else:
+                rows = (self.lines[index],)
+
+            self.wrapped_lines[index] = rows
+            self.num_rows += len(rows) - 1
+
+        return rows
+
+    def get_num_visible_rows(self) -> int:
+        """Return the number of whole rows that fit in the text area (at least 1)."""
+        return max(self.get_inner_rect().height // self.font.get_linesize(), 1)
+
+    def get_end_position(self) -> tuple[int, int]:
+        """Return the line and row at the top of the text area when it is scrolled to the end, found by counting back the rows that fit from the last line."""
+        self.check_wrap_state()
+
+        rows_left = self.get_num_visible_rows()
+        index = len(self.lines) - 1
+
+        while True:
+            num_rows = len(self.get_rows(index))
+
+            if num_rows >= rows_left:
+                return index, num_rows - rows_left
+
+            if index == 0:
+                return 0, 0
+
+            rows_left -= num_rows
+            index -= 1
+
+    def is_at_end(self) -> bool:
+        """Return whether the text area is scrolled to the end (so the last row is visible)."""
+        return (self.top_line, self.top_row) >= self.get_end_position()
+
+    def clamp_scroll(self) -> None:
+        """Keep the scroll position within the text, so it never goes past the point where the last row is at the bottom of the text area."""
+        self.check_wrap_state()
+
+        self.top_line = min(max(self.top_line, 0), len(self.lines) - 1)
+        self.top_row = min(max(self.top_row, 0), len(self.get_rows(self.top_line)) - 1)
+
+        end_position = self.get_end_position()
+
+        if (self.top_line, self.top_row) > end_position:
+            self.top_line, self.top_row = end_position
+
+    def scroll(self, num_rows: int) -> None:
+        """Scroll down by a number of rows (or up, if num_rows is negative). Only the lines that are scrolled over are wrapped."""
+        self.check_wrap_state()
+
+        index = self.top_line
+        row = self.top_row + num_rows
+
+        while row < 0 and index > 0:
+            index -= 1
+            row += len(self.get_rows(index))
+
+        while index < len(self.lines) - 1 and row >= len(self.get_rows(index)):
+            row -= len(self.get_rows(index))
+            index += 1
+
+        self.top_line = index
+        self.top_row = row
+
+        self.clamp_scroll()
+
+    def scroll_to_line(self, index: int) -> None:
+        """Scroll so the line at index is at the top of the text area (or as close to the top as it can be)."""
+        self.top_line = index
+        self.top_row = 0
+
+        self.clamp_scroll()
+
+    def scroll_to_end(self) -> None:
+        """Scroll so the last row is at the bottom of the text area."""
+        self.top_line, self.top_row = self.get_end_position()
+
+    def get_scroll_fraction(self, position: tuple[int, int]) -> float:
+        """Return the estimated number of lines before a scroll position, counting the rows of the line as a fraction of it."""
+        index, row = position
+
+        return index + row / len(self.get_rows(index))
+
+    def get_scrollbar_rect(self) -> pygame.Rect:
+        """Return the rect the scrollbar thumb moves within, to the right of the text."""
+        inner_rect = self.get_inner_rect()
+
+        return pygame.Rect(inner_rect.right + self.padding, inner_rect.top, SCROLLBAR_WIDTH, inner_rect.height)
+
+    def drag_scrollbar(self) -> None:
+        """
+        Scroll to the line under the mouse while the scrollbar is held down with the left mouse button.
+
+        The thumb is centered on the mouse. Since the row count is an estimate, the position is found by line rather than by row.
+        """
+        mouse_down = input_state.get_mouse_buttons()[0]
+
+        if not mouse_down or self.scrollbar_colour == None:
+            self.dragging = False
+            return
+
+        x, y = input_state.get_mouse_pos()
+        scrollbar_rect = self.get_scrollbar_rect()
+
+        if not self.dragging:
+            self.dragging = scrollbar_rect.collidepoint(x, y) and self.thumb_rect is not None
+
+            if not self.dragging:
+                return
+
+        thumb_height = self.thumb_rect.height
+        track_height = scrollbar_rect.height - thumb_height
+
+        if track_height <= 0:
+            return
+
+        fraction = min(max((y - scrollbar_rect.top - thumb_height / 2) / track_height, 0), 1)
+        line_position = fraction * self.get_scroll_fraction(self.get_end_position())
+
+        self.top_line = int(line_position)
+        self.top_row = int((line_position - self.top_line) * len(self.get_rows(self.top_line)))
+
+        self.clamp_scroll()
+
+    def get_row_surface(self, row: str) -> pygame.Surface:
+        """
+        Return the surface of a rendered row.
+
+        Rows are cached by the text area itself rather than in the shared text cache (see text_surfaces), so a tall text area cannot push out the text of other elements.
+        """
+        return self.row_surfaces.get(row, lambda: self.font.render(row, self.antialias, self.font_colour, self.background_colour))
+
+    def get_layout_state(self) -> tuple:
+        """Return everything that affects the row blits and scrollbar."""
+        return (self.version, self.top_line, self.top_row, self.x, self.y, self.width, self.height, self.padding, self.font, self.wrap, self.font_colour, self.background_colour, self.antialias, self.scrollbar_colour)
+
+    def update_layout(self) -> None:
+        """
+        Work out the blits of the visible rows and the scrollbar thumb rect, if anything they depend on has changed.
+
+        Only the rows that are on screen are wrapped and rendered. The last row is cut off at the bottom of the text area if it does not fit completely.
+        """
+        layout_state = self.get_layout_state()
+
+        if layout_state == self.layout_state:
+            return
+
+        render_state = (self.font, self.font_colour, self.background_colour, self.antialias)
+
+        if render_state != self.render_state:
+            self.render_state = render_state
+            self.row_surfaces.clear()
+
+        self.clamp_scroll()
+
+        inner_rect = self.get_inner_rect()
+        line_height = self.font.get_linesize()
+
+        self.row_blits = []
+
+        index = self.top_line
+        first_row = self.top_row
+        y = inner_rect.top
+
+        while y < inner_rect.bottom and index < len(self.lines):
+            for row in self.get_rows(index)[first_row:]:
+                if y >= inner_rect.bottom:
+                    break
+
+                if len(row) > 0:
+                    self.row_blits.append((self.get_row_surface(row), (inner_rect.left, y), (0, 0, inner_rect.width, min(line_height, inner_rect.bottom - y))))
+
+                y += line_height
+
+            index += 1
+            first_row = 0
+
+        self.thumb_rect = None
+
+        if self.scrollbar_colour != None:
+            scrollbar_rect = self.get_scrollbar_rect()
+
+            num_visible_rows = self.get_num_visible_rows()
+            end_fraction = self.get_scroll_fraction(self.get_end_position())
+
+            thumb_height = max(scrollbar_rect.height * num_visible_rows // max(self.num_rows, num_visible_rows), MIN_THUMB_HEIGHT)
+            thumb_height = min(thumb_height, scrollbar_rect.height)
+
+            if end_fraction > 0:
+                thumb_y = scrollbar_rect.top + (scrollbar_rect.height - thumb_height) * self.get_scroll_fraction((self.top_line, self.top_row)) / end_fraction
+            else:
+                thumb_y = scrollbar_rect.top
+
+            self.thumb_rect = pygame.Rect(scrollbar_rect.left, round(thumb_y), SCROLLBAR_WIDTH, thumb_height)
+
+        # The layout state is taken again, since clamping may have changed the scroll position
+        self.layout_state = self.get_layout_state()
+
+    def geometry_changed(self) -> None:
+        """
+        Update the hit rect after x, y, width or height are changed.
+
+        The hit rect is already cleared when they are assigned to, so calling this is optional (it is kept so the text area can be used like the other elements).
+        If the width changed, the lines are wrapped again lazily the next time they are needed (see check_wrap_state()).
+        """
+        self.hit_rect = None
+
+    def contains_point(self, x: int, y: int) -> bool:
+        """Return whether a point is colliding with, or within the region of, the text area (the same test as RectButton.contains_point)."""
+        min_x = self.x - self.width // 2
+        max_x = self.x + self.width // 2
+        min_y = self.y - self.height // 2
+        max_y = self.y + self.height // 2
+
+        return min_x <= x <= max_x and min_y <= y <= max_y
+
+    def get_shape_rect(self) -> pygame.Rect:
+        """Return the rect of the text area."""
+        return pygame.Rect(self.x - self.width // 2, self.y - self.height // 2, self.width, self.height)
+
+    def get_hit_rect(self) -> pygame.Rect:
+        """Return the rect of every point that contains_point() accepts, which includes the right and bottom edges like RectButton."""
+        half_width = self.width // 2
+        half_height = self.height // 2
+
+        return pygame.Rect(self.x - half_width, self.y - half_height, 2 * half_width + 1, 2 * half_height + 1)
+
+    def hit_test(self, x: int, y: int) -> bool:
+        """Return whether a point is within the text area (see hit_test.check_point())."""
+        return hit_test.check_point(self, x, y)
+
+    def mouse_over(self) -> bool:
+        """Return whether the mouse is within the text area."""
+        x, y = input_state.get_mouse_pos()
+
+        return hit_test.check_point(self, x, y)
+
+    def get_bounding_rect(self) -> pygame.Rect:
+        """Return the smallest rect that contains the text area (the text and scrollbar are always drawn within it)."""
+        return self.get_shape_rect()
+
+    def get_visual_state(self) -> tuple:
+        """Return everything that affects how the text area is drawn."""
+        self.update_layout()
+
+        return self.layout_state + (self.corner_radius, self.border_colour, self.border_width, self.num_rows)
+
+    def update_state(self, pygame_event_loop: list[pygame.event.Event]) -> None:
+        """
+        Scroll with the mouse wheel (while the mouse is over the text area) and with the scrollbar, without drawing the text area.
+
+        The mouse wheel events are read from pygame_event_loop, which should be the result of pygame.event.get() for the frame.
+        """
+        for event in pygame_event_loop:
+            if event.type == pygame.MOUSEWHEEL and self.mouse_over():
+                self.scroll(-event.y * self.scroll_speed)
+
+        self.update_layout()
+        self.drag_scrollbar()
+
+    def draw(self) -> None:
+        """Draw the text area, the visible rows and the scrollbar to the screen."""
+        self.update_layout()
+
+        shape_rect = self.get_shape_rect()
+        shape_surface = shapes.get_rect(self.width, self.height, self.background_colour, self.corner_radius, self.border_colour, self.border_width)
+
+        render_queue.blit(self.surface, shape_surface, shape_rect)
+        render_queue.blits(self.surface, self.row_blits)
+
+        if self.thumb_rect is not None:
+            render_queue.fill(self.surface, self.scrollbar_colour, self.thumb_rect)
+
+    def update(self, pygame_event_loop: list[pygame.event.Event]) -> None:
+        """
+        Update and draw the text area.
+
+        This should be called once per frame with the result of pygame.event.get().
+        """
+        self.update_state(pygame_event_loop)
+        self.draw()
@@ -1,5 +1,8 @@
 from pygame_ui_toolkit.elements import button
 from pygame_ui_toolkit import utils
+from pygame_ui_toolkit import fonts
+from pygame_ui_toolkit import text_surfaces
+from pygame_ui_toolkit import render_queue
 from pygame_ui_toolkit import pygame
 
 
@@ -28,12 +31,24 @@ class Toggle:
         prepare the button_object attribute
     on_button_click()
         toggle the selected attribute and call on_click function
+    get_bounding_rect()
+        return the smallest rect that contains the toggle
+    get_visual_state()
+        return everything that affects how the toggle is drawn
+    update_state()
+        update the button object and call on_value_changed if necessary, without drawing the toggle
+    render()
+        draw the toggle to the screen, without updating it
     draw()
-        draw the toggle to the screen
+        update the toggle, then draw it to the screen
     update()
         update the Toggle object
     """
 
+    __slots__ = ("button_object", "normal_button_on_click", "_on_value_changed", "_on_value_changed_bound", "selected", "prev_selected", "__weakref__")
+
+    on_value_changed = utils.CallbackAttribute()
+
     def __init__(self, button_object: object, on_value_changed: callable = None, start_value: bool = False) -> None:
         """Construct the necessary attributes for the Toggle object."""
         self.button_object = button_object
@@ -56,9 +71,38 @@ class Toggle:
         self.button_object.call_func(self.normal_button_on_click)
         self.selected = not self.selected
 
+    def get_bounding_rect(self) -> pygame.Rect:
+        """Return the smallest rect that contains the toggle."""
+        return self.button_object.get_bounding_rect()
+
+    def get_visual_state(self) -> tuple:
+        """Return everything that affects how the toggle is drawn."""
+        return self.button_object.get_visual_state()
+
+    def update_state(self) -> None:
+        """
+        Update the button object and call on_value_changed if necessary, without drawing the toggle.
+
+        The button is updated first, so on_value_changed is called in the same frame that the toggle is clicked.
+        """
+        self.button_object.update_state()
+
+        if self.selected != self.prev_selected:
+            self._on_value_changed_bound(self.selected, self)
+            self.prev_selected = self.selected
+
+    def render(self) -> None:
+        """Draw the toggle to the screen, without updating it. UIManager draws toggles with this, since it updates them separately."""
+        self.button_object.draw()
+
     def draw(self) -> None:
-        """Draw the toggle to the screen."""
-        self.button_object.update()
+        """
+        Update the toggle, then draw it to the screen.
+
+        This is the same as update(), so code that only calls draw() still handles clicks. Use render() to draw without updating.
+        """
+        self.update_state()
+        self.render()
 
     def update(self) -> None:
         """
@@ -66,11 +110,8 @@ class Toggle:
 
         This should be called once per frame.
         """
-        if self.selected != self.prev_selected:
-            utils.call_func(self.on_value_changed, self.selected, self)
-            self.prev_selected = self.selected
-
-        self.draw()
+        self.update_state()
+        self.render()
 
 
 class TextToggle(Toggle):
@@ -94,19 +135,33 @@ class TextToggle(Toggle):
         the pygame surface object used to render text
     antialias : bool
         whether the text is displayed with antialias
+    text_surface : pygame.Surface
+        the surface used to render text
+    text_rect : pygame.Rect
+        the rect position that the text is drawn to
+    rendered_state : tuple | None
+        the text, font colour, font, antialias, background colour and position the text was last rendered with (None if the text needs rendering)
 
     Methods
     -------
     get_text()
         return a text surface and a rect object for text
+    get_render_state()
+        return everything that affects how the text is rendered
     update_text(new_text: str, new_font_colour: tuple[int], new_font_size: int, new_font_name: str | None, new_text_x: int | None = None, new_text_y: int | None = None)
         change the text, font colour, font size, font name or position of the displayed text
     blit_text()
         draw text to the screen
-    draw()
-        draw the text and toggle to the screen
+    get_bounding_rect()
+        return the smallest rect that contains the toggle and text
+    get_visual_state()
+        return everything that affects how the toggle and text are drawn
+    render() - overwritten from Toggle
+        draw the text and toggle to the screen, without updating the toggle
     """
 
+    __slots__ = ("text", "text_x", "text_y", "font_colour", "font", "antialias", "text_surface", "text_rect", "rendered_state")
+
     def __init__(self, button_object: object, text: str, text_x: int, text_y: int, font_colour: tuple[int], font_size: int, font_name: str | None = None, on_value_changed: callable = None, start_value: bool = False, antialias: bool = False) -> None:
         """Construct the necessary attributes for the TextToggle object."""
         super().__init__(button_object, on_value_changed, start_value)
@@ -117,17 +172,24 @@ class TextToggle(Toggle):
         self.text_y = text_y
 
         self.font_colour = font_colour
-        self.font = pygame.font.Font(font_name, font_size)
+        self.font = fonts.get_font(font_name, font_size)
 
         self.antialias = antialias
 
+        self.rendered_state = None
+        utils.update_rendered_text(self)
+
     def get_text(self) -> tuple[pygame.Surface, pygame.Rect]:
         """Return a text surface and a rect object for text."""
-        text_surf = self.font.render(self.text, self.antialias, self.font_colour, self.button_object.background_colour)
+        text_surf = text_surfaces.render(self.font, self.text, self.antialias, self.font_colour, self.button_object.background_colour)
         text_rect = text_surf.get_rect()
         text_rect.center = (self.text_x, self.text_y)
 
         return text_surf, text_rect
+
+    def get_render_state(self) -> tuple:
+        """Return everything that affects how the text is rendered."""
+        return self.text, self.font_colour, self.font, self.antialias, self.button_object.background_colour, self.text_x, self.text_y
     
     def update_text(self, new_text: str, new_font_colour: tuple[int], new_font_size: int, new_font_name: str | None, new_text_x: int | None = None, new_text_y: int | None = None) -> None:
         """Change the text, font colour, font size, font name or position of the displayed text."""
@@ -138,16 +200,32 @@ class TextToggle(Toggle):
         if new_text_y != None:
             self.text_y = new_text_y
 
-        self.text_surface, self.text_rect = self.get_text()
+        utils.update_rendered_text(self)
     
     def blit_text(self) -> None:
-        """Draw text to the screen."""
-        surf, rect = self.get_text()
-        self.button_object.surface.blit(surf, rect)
+        """
+        Draw text to the screen.
 
-    def draw(self) -> None:
-        """Draw the text and toggle to the screen."""
-        self.button_object.update()
+        The text background is the colour of the button, which presets can change every frame, so the text is rendered again here if (and only if) it would look different.
+        """
+        utils.update_rendered_text(self)
+
+        render_queue.blit(self.button_object.surface, self.text_surface, self.text_rect)
+
+    def get_bounding_rect(self) -> pygame.Rect:
+        """Return the smallest rect that contains the toggle and text."""
+        text_rect = pygame.Rect((0, 0), self.font.size(self.text))
+        text_rect.center = (self.text_x, self.text_y)
+
+        return self.button_object.get_bounding_rect().union(text_rect)
+
+    def get_visual_state(self) -> tuple:
+        """Return everything that affects how the toggle and text are drawn."""
+        return self.button_object.get_visual_state() + (self.text, self.text_x, self.text_y, self.font_colour, self.font, self.antialias)
+
+    def render(self) -> None:
+        """Draw the text and toggle to the screen, without updating the toggle."""
+        self.button_object.draw()
         self.blit_text()
 
 
@@ -172,10 +250,16 @@ class TickBox(Toggle):
     all methods from Toggle
     draw_tick()
         draw the tick to the screen
-    draw()
-        draw the tick box and - if appropriate - the tick to the screen
+    get_bounding_rect()
+        return the smallest rect that contains the tick box and tick
+    get_visual_state()
+        return everything that affects how the tick box is drawn
+    render() - overwritten from Toggle
+        draw the tick box and - if appropriate - the tick to the screen, without updating the tick box
     """
 
+    __slots__ = ("surface", "tick_thickness", "tick_colour")
+
     def __init__(self, surface: pygame.Surface, tick_thickness: int, tick_colour: tuple[int], x: int, y: int, background_colour: tuple[int], side_length: int, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, corner_radius: int = -1, on_value_changed: callable = None, start_value: bool = False) -> None:
         """Construct the necessary attributes for the TickBox object."""
         button_object = button.RectButton(surface, x, y, background_colour, side_length, side_length, on_click, on_hover, on_normal, corner_radius, True)
@@ -199,12 +283,22 @@ class TickBox(Toggle):
         middle = (x + int(width * 0.4), y + int(height * 0.9))
         right = (x + int(width * 0.9), y + int(height * 0.2))
 
-        pygame.draw.line(self.surface, self.tick_colour, left, middle, self.tick_thickness)
-        pygame.draw.line(self.surface, self.tick_colour, middle, right, self.tick_thickness)
+        tick_rect = self.get_bounding_rect()
 
-    def draw(self) -> None:
-        """Draw the tick box and - if appropriate - the tick to the screen."""
-        self.button_object.update()
+        render_queue.draw(pygame.draw.line, self.surface, self.tick_colour, left, middle, self.tick_thickness, rect=tick_rect)
+        render_queue.draw(pygame.draw.line, self.surface, self.tick_colour, middle, right, self.tick_thickness, rect=tick_rect)
+
+    def get_bounding_rect(self) -> pygame.Rect:
+        """Return the smallest rect that contains the tick box and tick (which can extend past the box when it is thick)."""
+        return self.button_object.get_bounding_rect().inflate(self.tick_thickness, self.tick_thickness)
+
+    def get_visual_state(self) -> tuple:
+        """Return everything that affects how the tick box is drawn."""
+        return self.button_object.get_visual_state() + (self.selected, self.tick_colour, self.tick_thickness)
+
+    def render(self) -> None:
+        """Draw the tick box and - if appropriate - the tick to the screen, without updating the tick box."""
+        self.button_object.draw()
 
         if self.selected:
             self.draw_tick()
@@ -244,6 +338,8 @@ class TickBoxToggle:
         the surface object used to render text
     text_rect : pygame.Rect
         the rect position that the text is drawn to
+    rendered_state : tuple | None
+        the text, font colour, font, antialias, outer box colour and position the text was last rendered with (None if the text needs rendering)
     selected : bool
         whether the toggle is currrently selected
 
@@ -255,14 +351,26 @@ class TickBoxToggle:
         return the x, y position of the text
     get_text()
         return the text surface and rect objects to draw text
+    get_render_state()
+        return everything that affects how the text is rendered
     update_text(new_text: str, new_font_colour: tuple[int], new_font_size: int, new_font_name: str | None)
         change the text, font colour, font size, or font name of the displayed text
+    get_bounding_rect()
+        return the smallest rect that contains the outer box, tick box and text
+    get_visual_state()
+        return everything that affects how the toggle is drawn
+    update_state()
+        update the tick box without drawing the toggle
+    render()
+        draw the outer box, tick box and text to the screen, without updating the tick box
     draw()
-        draw the outer box, tick box and text to the screen
+        update the tick box, then draw the outer box, tick box and text to the screen
     update()
         update the TickBoxToggle object
     """
 
+    __slots__ = ("surface", "x", "y", "width", "height", "outer_box_colour", "outer_corner_radius", "text_to_right", "text", "font_colour", "font", "antialias", "tick_box", "text_surface", "text_rect", "rendered_state", "selected", "__weakref__")
+
     def __init__(self, surface: pygame.Surface, tick_thickness: int, tick_colour: tuple[int], tick_box_colour: tuple[int], outer_box_colour: tuple[int], x: int, y: int, width: int, height: int, text: str, font_colour: tuple[int], font_size: int, font_name: str | None = None, dist_from_edge: int = 5, height_offset: int = 10, on_click: callable = None, on_hover: callable = None, on_normal: callable = None, on_value_changed: callable = None, inner_corner_radius: int = -1, outer_corner_radius: int = -1, start_value: bool = False, text_to_right: bool = True, antialias: bool = False) -> None:
         """Construct the necessary attributes for the TickBoxToggle object."""
         self.surface = surface
@@ -281,12 +389,14 @@ class TickBoxToggle:
         self.text = text
 
         self.font_colour = font_colour
-        self.font = pygame.font.Font(font_name, font_size)
+        self.font = fonts.get_font(font_name, font_size)
 
         self.antialias = antialias
 
         self.tick_box = self.create_tick_box(tick_thickness, tick_colour, tick_box_colour, dist_from_edge, height_offset, on_click, on_hover, on_normal, on_value_changed, inner_corner_radius, start_value)
-        self.text_surface, self.text_rect = self.get_text()
+
+        self.rendered_state = None
+        utils.update_rendered_text(self)
 
         self.selected = self.tick_box.selected
 
@@ -319,28 +429,61 @@ class TickBoxToggle:
     
     def get_text(self) -> tuple[pygame.Surface, pygame.Rect]:
         """Return the text surface and rect objects to draw text."""
-        text_surf = self.font.render(self.text, self.antialias, self.font_colour, self.outer_box_colour)
+        text_surf = text_surfaces.render(self.font, self.text, self.antialias, self.font_colour, self.outer_box_colour)
         text_rect = text_surf.get_rect()
 
         text_pos = self.find_text_pos()
         text_rect.center = text_pos
 
         return text_surf, text_rect
+
+    def get_render_state(self) -> tuple:
+        """Return everything that affects how the text is rendered."""
+        return self.text, self.font_colour, self.font, self.antialias, self.outer_box_colour, self.find_text_pos()
     
     def update_text(self, new_text: str, new_font_colour: tuple[int], new_font_size: int, new_font_name: str | None) -> None:
-        """Change the text, font colour, font size, or font name of the displayed text."""
+        """
+        Change the text, font colour, font size, or font name of the displayed text.
+
+        The text is only rendered again if it would look different.
+        """
         utils.update_font_attrs(self, new_text, new_font_colour, new_font_name, new_font_size)
 
-        self.text_surface, self.text_rect = self.get_text()
+        utils.update_rendered_text(self)
 
-    def draw(self) -> None:
-        """Draw the outer box, tick box and text to the screen."""
+    def get_bounding_rect(self) -> pygame.Rect:
+        """Return the smallest rect that contains the outer box, tick box and text."""
+        outer_rect = pygame.Rect(self.x - self.width // 2, self.y - self.height // 2, self.width, self.height)
+
+        return outer_rect.unionall([self.text_rect, self.tick_box.get_bounding_rect()])
+
+    def get_visual_state(self) -> tuple:
+        """Return everything that affects how the toggle is drawn."""
+        return (self.x, self.y, self.width, self.height, self.outer_box_colour, self.outer_corner_radius, self.text_surface) + self.tick_box.get_visual_state()
+
+    def render(self) -> None:
+        """Draw the outer box, tick box and text to the screen, without updating the tick box. UIManager draws tick box toggles with this, since it updates them separately."""
         outer_rect = pygame.Rect(self.x - self.width // 2, self.y - self.height // 2, self.width, self.height)
-        pygame.draw.rect(self.surface, self.outer_box_colour, outer_rect, border_radius=self.outer_corner_radius)
+        render_queue.draw(pygame.draw.rect, self.surface, self.outer_box_colour, outer_rect, 0, self.outer_corner_radius, rect=outer_rect)
 
-        self.surface.blit(self.text_surface, self.text_rect)
+        render_queue.blit(self.surface, self.text_surface, self.text_rect)
 
-        self.tick_box.draw()
+        self.tick_box.render()
+
+    def draw(self) -> None:
+        """
+        Update the tick box, then draw the outer box, tick box and text to the screen.
+
+        This is the same as update(), so code that only calls draw() still handles clicks. Use render() to draw without updating.
+        """
+        self.update_state()
+        self.render()
+
+    def update_state(self) -> None:
+        """Update the tick box without drawing the toggle."""
+        self.tick_box.update_state()
+
+        self.selected = self.tick_box.selected
 
     def update(self) -> None:
         """
@@ -349,7 +492,5 @@ class TickBoxToggle:
         This should be called once per frame.
         """
 
-        self.tick_box.update()
-        self.draw()
-
-        self.selected = self.tick_box.selected
\ No newline at end of file
+        self.update_state()
+        self.render()
\ No newline at end of file
@@ -0,0 +1,80 @@
+from io import BytesIO
+
+from pygame_ui_toolkit import cache
+from pygame_ui_toolkit import pygame
+
+
+MAX_FONTS = 64
+
+
+font_cache = cache.LRUCache(MAX_FONTS)
+
+
+def read_font_file(font_name: str | None) -> bytes | None:
+    """
+    Return the contents of a font file, or None for the default font (font_name is None), which pygame opens itself.
+
+    This does not use SDL_ttf, so it can be called on any thread (see assets.AssetLoader).
+    """
+    if font_name == None:
+        return None
+
+    with open(font_name, "rb") as file:
+        return file.read()
+
+
+def create_font(font_name: str | None, font_size: int, bold: bool, italic: bool, underline: bool, font_data: bytes | None = None) -> pygame.font.Font:
+    """
+    Open a new font file (or the contents of it, if font_data is given) and apply the style to it.
+
+    SDL_ttf is not thread safe, so this must only be called on the main thread.
+    """
+    if font_data == None:
+        font = pygame.font.Font(font_name, font_size)
+    else:
+        font = pygame.font.Font(BytesIO(font_data), font_size)
+
+    font.set_bold(bold)
+    font.set_italic(italic)
+    font.set_underline(underline)
+
+    return font
+
+
+def get_font(font_name: str | None, font_size: int, bold: bool = False, italic: bool = False, underline: bool = False) -> pygame.font.Font:
+    """
+    Return a font object with the given name, size and style.
+
+    The same font object is returned for every call with the same arguments, so the font file is only opened once.
+    Because font objects are shared, their style should not be changed after they are returned - request a font with a different style instead.
+    """
+
+    key = (font_name, font_size, bold, italic, underline)
+
+    return font_cache.get(key, lambda: create_font(font_name, font_size, bold, italic, underline))
+
+
+def add_font(font_name: str | None, font_size: int, bold: bool, italic: bool, underline: bool, font_data: bytes | None) -> pygame.font.Font:
+    """
+    Create a font from the contents of its file returned by read_font_file() (e.g. on another thread, see assets.AssetLoader) and add it to the cache, unless one has already been cached.
+
+    The cached font is returned.
+    """
+    key = (font_name, font_size, bold, italic, underline)
+
+    return font_cache.get(key, lambda: create_font(font_name, font_size, bold, italic, underline, font_data))
+
+
+def is_cached(font_name: str | None, font_size: int, bold: bool = False, italic: bool = False, underline: bool = False) -> bool:
+    """Return whether get_font() would return a cached font for the arguments, without opening the font file."""
+    return (font_name, font_size, bold, italic, underline) in font_cache
+
+
+def clear() -> None:
+    """Remove every cached font and reset the cache counters."""
+    font_cache.clear()
+
+
+def get_stats() -> dict[str, int]:
+    """Return a dict of the font cache counters (size, max_size, bytes, max_bytes, hits, misses and evictions)."""
+    return font_cache.get_stats()
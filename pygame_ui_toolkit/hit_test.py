@@ -0,0 +1,91 @@
+from pygame_ui_toolkit import pygame
+
+
+class HitTestCounter:
+    """
+    Counts the hit tests done by check_point(), to show how many exact shape tests were avoided.
+
+    Attributes
+    ----------
+    num_tests : int
+        the number of points tested
+    num_rejected : int
+        the number of points that were outside the element's hit rect, so did not need an exact test
+    num_exact_tests : int
+        the number of exact shape tests (contains_point() calls) that were done
+
+    Methods
+    -------
+    reset()
+        set every counter back to 0
+    get_stats()
+        return a dict of the counters
+    """
+
+    def __init__(self) -> None:
+        """Construct the necessary attributes for the HitTestCounter object."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Set every counter back to 0."""
+        self.num_tests = 0
+        self.num_rejected = 0
+        self.num_exact_tests = 0
+
+    def get_stats(self) -> dict[str, int]:
+        """Return a dict of the counters, including how many exact tests were avoided (either rejected by the hit rect or not needed because the hit rect is exact)."""
+        return {
+            "tests": self.num_tests,
+            "rejected": self.num_rejected,
+            "exact_tests": self.num_exact_tests,
+            "avoided": self.num_tests - self.num_exact_tests
+        }
+
+
+counter = HitTestCounter()
+
+
+def get_cached_hit_rect(element: object) -> pygame.Rect:
+    """
+    Return the cached hit rect of an element, calling its get_hit_rect() method if there is not one.
+
+    The hit rect is only recalculated after its hit_rect attribute is set to None, which happens when its x, y, width, height or radius are assigned to (see utils.geometry_attribute()) or its geometry_changed() method is called.
+    """
+    # "is" is used because comparing a pygame.Rect to None with == is slow
+    hit_rect = element.hit_rect
+    if hit_rect is None:
+        hit_rect = element.get_hit_rect()
+        element.hit_rect = hit_rect
+
+    return hit_rect
+
+
+def check_point(element: object, x: int, y: int) -> bool:
+    """
+    Return whether a point is within an element, testing its hit rect before its exact shape.
+
+    The element must have a hit_rect attribute (the cached rect, or None if it needs to be recalculated), a hit_rect_is_exact attribute, a get_hit_rect() method and a contains_point(x, y) method.
+    The hit rect is only recalculated after the element is moved or resized (see get_cached_hit_rect()). If hit_rect_is_exact is True (e.g. for rectangles), contains_point() is never needed.
+    """
+    counter.num_tests += 1
+
+    if not get_cached_hit_rect(element).collidepoint(x, y):
+        counter.num_rejected += 1
+        return False
+
+    if element.hit_rect_is_exact:
+        return True
+
+    counter.num_exact_tests += 1
+
+    return element.contains_point(x, y)
+
+
+def reset_stats() -> None:
+    """Set the hit test counters back to 0."""
+    counter.reset()
+
+
+def get_stats() -> dict[str, int]:
+    """Return a dict of the hit test counters (tests, rejected, exact_tests and avoided)."""
+    return counter.get_stats()
@@ -0,0 +1,99 @@
+from pygame_ui_toolkit import cache
+from pygame_ui_toolkit import pygame
+
+
+MAX_IMAGES = 256
+MAX_IMAGE_BYTES = 32 * 1024 * 1024
+
+# The colour shown in place of an image that is still being loaded
+PLACEHOLDER_COLOUR = (128, 128, 128)
+
+
+image_cache = cache.LRUCache(MAX_IMAGES, MAX_IMAGE_BYTES, cache.get_surface_size)
+
+
+def get_key(path: str, size: tuple[int, int] | None, smooth: bool) -> tuple:
+    """Return the key an image is cached with."""
+    if size != None:
+        size = tuple(size)
+
+    return path, size, size != None and smooth
+
+
+def convert_image(image: pygame.Surface) -> pygame.Surface:
+    """
+    Convert an image to the display's pixel format, so it can be blitted quickly.
+
+    Images with per-pixel transparency are converted with convert_alpha() to keep it. Images are only converted once the display has been created.
+    """
+    if pygame.display.get_surface() == None:
+        return image
+
+    if image.get_flags() & pygame.SRCALPHA:
+        return image.convert_alpha()
+
+    return image.convert()
+
+
+def scale_image(image: pygame.Surface, size: tuple[int, int], smooth: bool) -> pygame.Surface:
+    """Return a copy of an image scaled to size, with pygame.transform.smoothscale() if smooth is True or pygame.transform.scale() otherwise."""
+    if not smooth:
+        return pygame.transform.scale(image, size)
+
+    # smoothscale() only accepts 24 and 32 bit surfaces
+    if image.get_bitsize() not in (24, 32):
+        image = image.convert(32)
+
+    return pygame.transform.smoothscale(image, size)
+
+
+def create_image(path: str, size: tuple[int, int] | None, smooth: bool) -> pygame.Surface:
+    """Return a new image loaded from a file, or a new copy of the cached original image scaled to size (if size is not None)."""
+    if size == None:
+        return convert_image(pygame.image.load(path))
+
+    return scale_image(get_image(path), size, smooth)
+
+
+def add_image(path: str, size: tuple[int, int] | None, smooth: bool, image: pygame.Surface) -> pygame.Surface:
+    """Convert an image that was loaded and scaled without the cache (e.g. on another thread, see assets.AssetLoader) and add it to the cache, unless one has already been cached, and return the cached image."""
+    return image_cache.get(get_key(path, size, smooth), lambda: convert_image(image))
+
+
+def is_cached(path: str, size: tuple[int, int] | None = None, smooth: bool = False) -> bool:
+    """Return whether get_image() would return a cached image for the arguments, without loading it from the file."""
+    return get_key(path, size, smooth) in image_cache
+
+
+def get_image(path: str, size: tuple[int, int] | None = None, smooth: bool = False) -> pygame.Surface:
+    """
+    Return an image loaded from a file, scaled to size (or at its original size if size is None).
+
+    The same surface is returned for every call with the same arguments, so each image file is only loaded once and each size is only scaled once.
+    If smooth is True, the image is scaled with pygame.transform.smoothscale() rather than pygame.transform.scale().
+    Because surfaces are shared, they should not be drawn onto or changed after they are returned.
+    """
+    key = get_key(path, size, smooth)
+
+    return image_cache.get(key, lambda: create_image(*key))
+
+
+def preload(paths: list[str], size: tuple[int, int] | None = None, smooth: bool = False) -> list[pygame.Surface]:
+    """Load and scale each image so later calls to get_image() with the same arguments do not need to, and return the images."""
+    return [get_image(path, size, smooth) for path in paths]
+
+
+def set_max_bytes(max_bytes: int | None) -> None:
+    """Change the maximum total size (in bytes) of the cached images, removing images if the cache is now too large."""
+    image_cache.max_bytes = max_bytes
+    image_cache.evict()
+
+
+def clear() -> None:
+    """Remove every cached image and reset the cache counters."""
+    image_cache.clear()
+
+
+def get_stats() -> dict[str, int | None]:
+    """Return a dict of the image cache counters (size, max_size, bytes, max_bytes, hits, misses and evictions)."""
+    return image_cache.get_stats()
@@ -0,0 +1,121 @@
+from pygame_ui_toolkit import pygame
+
+
+NUM_MOUSE_BUTTONS = 3
+KEY_EVENT_TYPES = (pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT)
+INPUT_EVENT_TYPES = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL) + KEY_EVENT_TYPES
+
+
+class InputState:
+    """
+    A snapshot of the mouse and keyboard for a single frame.
+
+    Elements read the mouse from the current snapshot (see capture() and set_state()) instead of polling pygame themselves.
+    Snapshots can also be constructed directly to drive elements deterministically, e.g. in headless tests.
+
+    Attributes
+    ----------
+    mouse_pos : tuple[int, int]
+        the x, y position of the mouse
+    mouse_buttons : tuple[bool, bool, bool]
+        whether the left, middle and right mouse buttons are held down
+    prev_mouse_buttons : tuple[bool, bool, bool], optional
+        whether each mouse button was held down in the previous snapshot (defaults to no buttons held down)
+    pressed : tuple[bool, bool, bool]
+        whether each mouse button went down since the previous snapshot
+    released : tuple[bool, bool, bool]
+        whether each mouse button went up since the previous snapshot
+    events : list[pygame.event.Event], optional
+        the pygame events for the frame (defaults to no events)
+    key_events : list[pygame.event.Event]
+        the KEYDOWN, KEYUP and TEXTINPUT events for the frame
+
+    Methods
+    -------
+    has_input_events()
+        return whether there are any mouse or keyboard events for the frame
+    """
+
+    def __init__(self, mouse_pos: tuple[int, int], mouse_buttons: tuple[bool, bool, bool], events: list[pygame.event.Event] | None = None, prev_mouse_buttons: tuple[bool, bool, bool] = (False, False, False)) -> None:
+        """Construct the necessary attributes for the InputState object."""
+        self.mouse_pos = tuple(mouse_pos)
+        self.mouse_buttons = tuple(mouse_buttons)
+        self.prev_mouse_buttons = tuple(prev_mouse_buttons)
+
+        self.pressed = tuple(now and not before for now, before in zip(self.mouse_buttons, self.prev_mouse_buttons))
+        self.released = tuple(before and not now for now, before in zip(self.mouse_buttons, self.prev_mouse_buttons))
+
+        if events == None:
+            events = []
+
+        self.events = events
+        self.key_events = [i for i in events if i.type in KEY_EVENT_TYPES]
+
+    def has_input_events(self) -> bool:
+        """Return whether there are any mouse or keyboard events for the frame."""
+        for event in self.events:
+            if event.type in INPUT_EVENT_TYPES:
+                return True
+            
+        return False
+
+
+# The snapshot elements read the mouse and events from (None if they should poll pygame), and the last snapshot taken by capture()
+current_state = None
+last_captured_state = None
+
+
+def capture(events: list[pygame.event.Event] | None = None) -> InputState:
+    """
+    Poll pygame once, store the result as the current snapshot and return it.
+
+    This should be called once per frame, before any elements are updated. The events passed in should be the result of pygame.event.get() for the frame.
+    The snapshot is only for the current frame, so set_state(None) should be called once the elements have been updated (UIManager.update() does both).
+    Otherwise, elements updated on later frames would keep reading the same mouse position and events.
+    The mouse buttons of the last captured snapshot are used to find which buttons were pressed or released since then.
+    """
+
+    global current_state, last_captured_state
+
+    if last_captured_state == None:
+        prev_mouse_buttons = (False,) * NUM_MOUSE_BUTTONS
+    else:
+        prev_mouse_buttons = last_captured_state.mouse_buttons
+
+    state = InputState(pygame.mouse.get_pos(), pygame.mouse.get_pressed(NUM_MOUSE_BUTTONS), events, prev_mouse_buttons)
+
+    current_state = state
+    last_captured_state = state
+
+    return state
+
+
+def set_state(state: InputState | None) -> None:
+    """Use state as the current snapshot. If state is None, elements go back to polling pygame every time they need the mouse."""
+    global current_state
+
+    current_state = state
+
+
+def get_mouse_pos() -> tuple[int, int]:
+    """Return the mouse position from the current snapshot, or from pygame if there is no snapshot."""
+    if current_state == None:
+        return pygame.mouse.get_pos()
+    
+    return current_state.mouse_pos
+
+
+def get_mouse_buttons() -> tuple[bool, bool, bool]:
+    """Return which mouse buttons are held down from the current snapshot, or from pygame if there is no snapshot."""
+    if current_state == None:
+        return pygame.mouse.get_pressed(NUM_MOUSE_BUTTONS)
+    
+    return current_state.mouse_buttons
+
+
+def get_events() -> list[pygame.event.Event]:
+    """Return the events from the current snapshot, or an empty list if there is no snapshot."""
+    if current_state == None:
+        return []
+    
+    return current_state.events
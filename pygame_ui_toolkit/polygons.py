@@ -0,0 +1,166 @@
+from pygame_ui_toolkit import pygame
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class Polygon:
+    """
+    A convex polygon that can quickly test whether points are inside it.
+
+    The edge vectors and bounding box are worked out once, when the polygon is created. A point is first checked against the bounding box, then against each edge using the cross product of the edge vector and the vector from the start of the edge to the point.
+    The cross products only use integer arithmetic for integer points, so there are no rounding errors or special cases for vertical edges. Points on an edge are inside the polygon.
+
+    Attributes
+    ----------
+    points : tuple[tuple[int, int]]
+        the x, y coordinates of each point on the polygon
+    edges : list[tuple[int, int, int, int]]
+        the x, y coordinates of the start of each edge and the x, y components of the edge vector
+    orientation : int
+        1 or -1 depending on which way round the points go, or 0 if the polygon has no area (in which case no points are inside it)
+    min_x : int
+        the smallest x coordinate of the points
+    min_y : int
+        the smallest y coordinate of the points
+    max_x : int
+        the largest x coordinate of the points
+    max_y : int
+        the largest y coordinate of the points
+
+    Methods
+    -------
+    get_edges()
+        return the start and vector of each edge
+    get_orientation()
+        return the sign of the (doubled) area of the polygon
+    get_bounding_rect()
+        return the smallest rect that contains every point within the polygon
+    contains_point(x: int, y: int)
+        return whether a point is inside (or on an edge of) the polygon
+    """
+
+    def __init__(self, points: list[tuple[int, int]]) -> None:
+        """Construct the necessary attributes for the Polygon object."""
+        self.points = tuple(tuple(i) for i in points)
+
+        self.edges = self.get_edges()
+        self.orientation = self.get_orientation()
+
+        x_values = [i[0] for i in self.points]
+        y_values = [i[1] for i in self.points]
+
+        self.min_x = min(x_values)
+        self.min_y = min(y_values)
+        self.max_x = max(x_values)
+        self.max_y = max(y_values)
+
+    def get_edges(self) -> list[tuple[int, int, int, int]]:
+        """Return the x, y coordinates of the start of each edge and the x, y components of the edge vector."""
+        edges = []
+        for i, (x, y) in enumerate(self.points):
+            prev_x, prev_y = self.points[i - 1]
+
+            edges.append((prev_x, prev_y, x - prev_x, y - prev_y))
+
+        return edges
+
+    def get_orientation(self) -> int:
+        """Return the sign of the (doubled) area of the polygon, which says which way round the points go."""
+        area = sum(start_x * dy - start_y * dx for start_x, start_y, dx, dy in self.edges)
+
+        if area > 0:
+            return 1
+        elif area < 0:
+            return -1
+        else:
+            return 0
+
+    def get_bounding_rect(self) -> pygame.Rect:
+        """Return the smallest rect that contains every point within the polygon."""
+        return pygame.Rect(self.min_x, self.min_y, self.max_x - self.min_x + 1, self.max_y - self.min_y + 1)
+
+    def contains_point(self, x: int, y: int) -> bool:
+        """Return whether a point is inside (or on an edge of) the polygon."""
+        if not (self.min_x <= x <= self.max_x and self.min_y <= y <= self.max_y):
+            return False
+
+        orientation = self.orientation
+
+        for start_x, start_y, dx, dy in self.edges:
+            if (dx * (y - start_y) - dy * (x - start_x)) * orientation < 0:
+                return False
+
+        return orientation != 0
+
+
+class PolygonBatch:
+    """
+    A group of polygons stored in NumPy arrays, used to test many points against many polygons at once.
+
+    The edges of every polygon are padded (by repeating the last edge) to the length of the longest polygon, so they fit in one array.
+    Only the pairs of points and polygons that pass the bounding box test have their cross products calculated.
+
+    NumPy is required to use this class (pip install pygame-ui-toolkit[numpy]).
+
+    Attributes
+    ----------
+    polygons : list[Polygon]
+        the polygons in the batch
+    edges : np.ndarray
+        a (num_polygons, max_edges, 4) array of the edges of each polygon (see Polygon.edges)
+    orientations : np.ndarray
+        the orientation of each polygon
+    bounds : np.ndarray
+        a (num_polygons, 4) array of the min_x, min_y, max_x and max_y of each polygon
+
+    Methods
+    -------
+    contains_points(points: np.ndarray)
+        return a (num_points, num_polygons) array of whether each point is inside each polygon
+    """
+
+    def __init__(self, polygons: list[Polygon]) -> None:
+        """Construct the necessary attributes for the PolygonBatch object."""
+        if np == None:
+            raise Exception("PolygonBatch requires NumPy. Install it with: pip install pygame-ui-toolkit[numpy]")
+
+        self.polygons = list(polygons)
+
+        max_edges = max(len(i.edges) for i in self.polygons)
+
+        self.edges = np.array([i.edges + [i.edges[-1]] * (max_edges - len(i.edges)) for i in self.polygons], dtype=np.int64)
+        self.orientations = np.array([i.orientation for i in self.polygons], dtype=np.int64)
+        self.bounds = np.array([(i.min_x, i.min_y, i.max_x, i.max_y) for i in self.polygons], dtype=np.int64)
+
+    def contains_points(self, points: "np.ndarray") -> "np.ndarray":
+        """Return a (num_points, num_polygons) array of whether each point is inside (or on an edge of) each polygon."""
+        points = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+
+        x = points[:, 0, None]
+        y = points[:, 1, None]
+
+        in_bounds = (self.bounds[:, 0] <= x) & (x <= self.bounds[:, 2]) & (self.bounds[:, 1] <= y) & (y <= self.bounds[:, 3])
+        point_indices, polygon_indices = np.nonzero(in_bounds)
+
+        edges = self.edges[polygon_indices]
+        orientations = self.orientations[polygon_indices]
+
+        cross = edges[:, :, 2] * (points[point_indices, 1, None] - edges[:, :, 1]) - edges[:, :, 3] * (points[point_indices, 0, None] - edges[:, :, 0])
+        inside = np.all(cross * orientations[:, None] >= 0, axis=1) & (orientations != 0)
+
+        result = np.zeros(in_bounds.shape, dtype=bool)
+        result[point_indices[inside], polygon_indices[inside]] = True
+
+        return result
+
+
+def contains_points(polygons: list[Polygon], points: "np.ndarray") -> "np.ndarray":
+    """
+    Return a (num_points, num_polygons) array of whether each point is inside (or on an edge of) each polygon.
+
+    If the same polygons are tested every frame, create a PolygonBatch once and use its contains_points() method instead.
+    """
+    return PolygonBatch(polygons).contains_points(points)
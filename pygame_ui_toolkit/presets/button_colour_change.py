@@ -1,32 +1,33 @@
 from pygame_ui_toolkit.elements import button
+from pygame_ui_toolkit import utils
 from pygame_ui_toolkit import pygame
 
 
-stored_variables = {}
+PRESET_NAME = "button_colour_change"
 
 
 def assign_variables(button_object: button.Button, normal_colour: tuple[int], hover_colour: tuple[int], click_colour: tuple[int], on_normal: callable, on_hover: callable, on_click: callable) -> None:
-    """Assign variables that need to be used later to a global dict with the button object as the key."""
+    """Store variables that need to be used later on the button object."""
     
     current_variables = {
         "normal_colour" : normal_colour,
         "hover_colour" : hover_colour,
         "click_colour" : click_colour,
 
-        "on_normal" : on_normal,
-        "on_hover" : on_hover,
-        "on_click" : on_click
+        "on_normal" : utils.bind_func(on_normal),
+        "on_hover" : utils.bind_func(on_hover),
+        "on_click" : utils.bind_func(on_click)
     }
 
-    stored_variables[button_object] = current_variables
+    utils.set_preset_variables(button_object, PRESET_NAME, current_variables)
 
 
 def update_button_colour(button_object: button.Button, event_type: str) -> None:
     """Change the background colour of the button."""
 
-    variables = stored_variables[button_object]
+    variables = utils.get_preset_variables(button_object, PRESET_NAME)
 
-    button_object.call_func(variables[f"on_{event_type}"])
+    variables[f"on_{event_type}"](button_object)
 
     button_object.background_colour = variables[f"{event_type}_colour"]
 
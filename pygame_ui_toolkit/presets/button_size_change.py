@@ -1,24 +1,25 @@
 from pygame_ui_toolkit.elements import button
+from pygame_ui_toolkit import utils
 from pygame_ui_toolkit import pygame
 
 
-stored_variables = {}
+PRESET_NAME = "button_size_change"
 
 
 def assign_variables(button_object: button.Button, normal_size: tuple[int], hover_size: tuple[int], click_size: tuple[int], on_normal: callable, on_hover: callable, on_click: callable) -> None:
-    """Assign variables that need to be used later to a global dict with the button object as the key."""
+    """Store variables that need to be used later on the button object."""
     
     current_variables = {
         "normal_size" : normal_size,
         "hover_size" : hover_size,
         "click_size" : click_size,
 
-        "on_normal" : on_normal,
-        "on_hover" : on_hover,
-        "on_click" : on_click
+        "on_normal" : utils.bind_func(on_normal),
+        "on_hover" : utils.bind_func(on_hover),
+        "on_click" : utils.bind_func(on_click)
     }
 
-    stored_variables[button_object] = current_variables
+    utils.set_preset_variables(button_object, PRESET_NAME, current_variables)
 
 
 def update_button_size(button_object: button.Button, event_type: str) -> None:
@@ -28,9 +29,9 @@ def update_button_size(button_object: button.Button, event_type: str) -> None:
     An exception is raised if an unsupported button (e.g. PolygonButton is used).
     """
     
-    variables = stored_variables[button_object]
+    variables = utils.get_preset_variables(button_object, PRESET_NAME)
 
-    button_object.call_func(variables[f"on_{event_type}"])
+    variables[f"on_{event_type}"](button_object)
 
     size = variables[f"{event_type}_size"]
 
@@ -43,6 +44,8 @@ def update_button_size(button_object: button.Button, event_type: str) -> None:
         button_object.radius = size
     else:
         raise Exception("Unsupported button type for a size change. Use any rect or circle buttons only.")
+    
+    button_object.geometry_changed()
 
 
 def on_click_func(button_object: button.Button) -> None:
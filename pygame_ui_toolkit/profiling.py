@@ -0,0 +1,311 @@
+from time import perf_counter
+from collections import deque
+from weakref import WeakValueDictionary
+
+from pygame_ui_toolkit import hit_test
+from pygame_ui_toolkit import text_surfaces
+from pygame_ui_toolkit import shapes
+from pygame_ui_toolkit import fonts
+from pygame_ui_toolkit import pygame
+
+
+DEFAULT_NUM_FRAMES = 120
+
+# The phases that are timed. Hit tests, callbacks and text renders happen while elements are updated or drawn, so they are included in the update and draw times
+PHASES = ("update", "draw", "flush", "hit_test", "callbacks", "text_render")
+
+# The functions that are replaced with timed versions while profiling, and the phase their time is added to
+TIMED_FUNCTIONS = ((hit_test, "check_point", "hit_test"), (text_surfaces, "render", "text_render"))
+
+OVERLAY_FONT_SIZE = 18
+OVERLAY_COLOUR = (255, 255, 255)
+OVERLAY_BACKGROUND_COLOUR = (0, 0, 0)
+OVERLAY_NUM_ELEMENTS = 5
+
+
+class FrameProfile:
+    """
+    The timings and counters recorded for a single frame.
+
+    Attributes
+    ----------
+    phase_times : dict[str, float]
+        the total time (in seconds) spent in each phase
+    element_times : dict[int, float]
+        the total time (in seconds) spent updating and drawing each element, keyed by the id of the element
+    frame_time : float
+        the time (in seconds) from the end of the previous frame to the end of this one
+    font_loads : int
+        the number of font files opened
+    shape_renders : int
+        the number of button shapes rendered
+    text_renders : int
+        the number of text surfaces rendered
+    """
+
+    def __init__(self) -> None:
+        """Construct the necessary attributes for the FrameProfile object."""
+        self.phase_times = dict.fromkeys(PHASES, 0)
+        self.element_times = {}
+
+        self.frame_time = 0
+
+        self.font_loads = 0
+        self.shape_renders = 0
+        self.text_renders = 0
+
+
+class Profiler:
+    """
+    Records how long each element and phase takes each frame, keeping the last few frames in a ring buffer.
+
+    A profiler only records while it is enabled (see enable()). When no profiler is enabled, elements and managers are not timed at all.
+    UIManager.update() ends the frame automatically. If elements are updated in some other way, end_frame() should be called once per frame.
+
+    Attributes
+    ----------
+    num_frames : int, optional
+        the number of frames kept (defaults to DEFAULT_NUM_FRAMES)
+    frames : collections.deque[FrameProfile]
+        the recorded frames, from oldest to newest
+    current_frame : FrameProfile
+        the frame that is being recorded
+    frame_start : float
+        the time the current frame started
+    cache_misses : tuple[int, int, int]
+        the font, shape and text cache misses when the current frame started
+    elements : weakref.WeakValueDictionary[int, object]
+        the elements that have been timed, keyed by their id. The profiler only keeps weak references to them, so elements that are removed can still be freed
+
+    Methods
+    -------
+    add_time(phase: str, seconds: float)
+        add time to a phase of the current frame
+    time_element(element: object, phase: str, func: callable, *args: object)
+        call func(*args) and return the result, adding the time it takes to the element and the phase
+    get_cache_misses()
+        return the current font, shape and text cache misses
+    end_frame()
+        finish recording the current frame and start a new one
+    clear()
+        remove every recorded frame
+    get_slowest_elements(num_elements: int)
+        return the elements that took the longest on average, with their average time in milliseconds
+    get_summary()
+        return a dict of averages over the recorded frames
+    """
+
+    def __init__(self, num_frames: int = DEFAULT_NUM_FRAMES) -> None:
+        """Construct the necessary attributes for the Profiler object."""
+        self.num_frames = num_frames
+        self.frames = deque(maxlen=num_frames)
+
+        self.current_frame = FrameProfile()
+        self.frame_start = perf_counter()
+        self.cache_misses = self.get_cache_misses()
+
+        self.elements = WeakValueDictionary()
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        """Add time (in seconds) to a phase of the current frame."""
+        self.current_frame.phase_times[phase] += seconds
+
+    def time_element(self, element: object, phase: str, func: callable, *args: object) -> object:
+        """
+        Call func(*args) and return the result, adding the time it takes to the element and the phase.
+
+        Elements that cannot be weakly referenced (e.g. classes with __slots__ but no __weakref__ slot) are timed, but not returned by get_slowest_elements().
+        """
+        start = perf_counter()
+        result = func(*args)
+        seconds = perf_counter() - start
+
+        key = id(element)
+        element_times = self.current_frame.element_times
+
+        if key in element_times:
+            element_times[key] += seconds
+        else:
+            element_times[key] = seconds
+
+            if key not in self.elements:
+                try:
+                    self.elements[key] = element
+                except TypeError:
+                    pass
+
+        self.current_frame.phase_times[phase] += seconds
+
+        return result
+
+    def get_cache_misses(self) -> tuple[int, int, int]:
+        """Return the number of font, shape and text cache misses so far (each miss is a font load or a render)."""
+        return fonts.font_cache.misses, shapes.shape_cache.misses, text_surfaces.text_cache.misses
+
+    def end_frame(self) -> None:
+        """Finish recording the current frame, adding it to the ring buffer, and start a new one."""
+        now = perf_counter()
+        cache_misses = self.get_cache_misses()
+
+        frame = self.current_frame
+        frame.frame_time = now - self.frame_start
+        frame.font_loads, frame.shape_renders, frame.text_renders = [new - old for new, old in zip(cache_misses, self.cache_misses)]
+
+        self.frames.append(frame)
+
+        self.current_frame = FrameProfile()
+        self.frame_start = now
+        self.cache_misses = cache_misses
+
+    def clear(self) -> None:
+        """Remove every recorded frame."""
+        self.frames.clear()
+        self.elements.clear()
+
+    def get_slowest_elements(self, num_elements: int) -> list[tuple[object, float]]:
+        """
+        Return the num_elements elements that took the longest on average (over the recorded frames), with their average time in milliseconds.
+
+        Elements that have been freed since they were timed are left out.
+        """
+        totals = {}
+        for frame in self.frames:
+            for key, seconds in frame.element_times.items():
+                totals[key] = totals.get(key, 0) + seconds
+
+        elements = [(self.elements.get(key), seconds) for key, seconds in totals.items()]
+        slowest = sorted([i for i in elements if i[0] != None], key=lambda item: item[1], reverse=True)[:num_elements]
+
+        return [(element, seconds / len(self.frames) * 1e3) for element, seconds in slowest]
+
+    def get_summary(self) -> dict[str, object]:
+        """
+        Return a dict of averages over the recorded frames.
+
+        This contains the number of frames, the average and maximum frame time, the average time of each phase (all in milliseconds), and the average number of font loads, shape renders and text renders per frame.
+        """
+        num_frames = len(self.frames)
+
+        if num_frames == 0:
+            return {"frames": 0}
+
+        frame_times = [i.frame_time for i in self.frames]
+
+        return {
+            "frames": num_frames,
+            "frame_ms": sum(frame_times) / num_frames * 1e3,
+            "max_frame_ms": max(frame_times) * 1e3,
+            "phase_ms": {phase: sum(i.phase_times[phase] for i in self.frames) / num_frames * 1e3 for phase in PHASES},
+            "font_loads": sum(i.font_loads for i in self.frames) / num_frames,
+            "shape_renders": sum(i.shape_renders for i in self.frames) / num_frames,
+            "text_renders": sum(i.text_renders for i in self.frames) / num_frames
+        }
+
+
+# The profiler that is recording (None if profiling is disabled)
+active_profiler = None
+
+# The original versions of the functions in TIMED_FUNCTIONS, while they are replaced
+original_functions = {}
+
+
+def create_timed_function(func: callable, phase: str) -> callable:
+    """Return a function that calls func, adding the time it takes to a phase of the active profiler."""
+    def timed_function(*args: object, **kwargs: object) -> object:
+        start = perf_counter()
+        result = func(*args, **kwargs)
+        active_profiler.add_time(phase, perf_counter() - start)
+
+        return result
+
+    return timed_function
+
+
+def time_callback(func: callable, *args: object) -> None:
+    """Call a callback, adding the time it takes to the callbacks phase of the active profiler. This is used by utils.bind_func()."""
+    start = perf_counter()
+    func(*args)
+    active_profiler.add_time("callbacks", perf_counter() - start)
+
+
+def enable(profiler: Profiler | None = None) -> Profiler:
+    """
+    Start recording to a profiler (a new one if profiler is None) and return it.
+
+    The hit test and text render functions are replaced with timed versions until disable() is called, so nothing extra is done while profiling is disabled.
+    """
+    global active_profiler
+
+    if profiler == None:
+        profiler = Profiler()
+
+    if active_profiler == None:
+        for module, name, phase in TIMED_FUNCTIONS:
+            func = getattr(module, name)
+
+            original_functions[(module, name)] = func
+            setattr(module, name, create_timed_function(func, phase))
+
+    active_profiler = profiler
+
+    return profiler
+
+
+def disable() -> None:
+    """Stop recording, restoring the original hit test and text render functions."""
+    global active_profiler
+
+    for (module, name), func in original_functions.items():
+        setattr(module, name, func)
+
+    original_functions.clear()
+    active_profiler = None
+
+
+def describe_element(element: object) -> str:
+    """Return the type of an element and where it is, to show which element a time belongs to."""
+    if hasattr(element, "get_bounding_rect"):
+        return f"{type(element).__name__} at {element.get_bounding_rect().topleft}"
+
+    return type(element).__name__
+
+
+def get_overlay_lines(profiler: Profiler) -> list[str]:
+    """Return the lines of text shown by draw_overlay()."""
+    summary = profiler.get_summary()
+
+    if summary["frames"] == 0:
+        return ["no frames recorded"]
+
+    lines = [
+        f"frame {summary['frame_ms'] :.2f} ms (max {summary['max_frame_ms'] :.2f} ms)",
+        "  ".join(f"{phase} {ms :.2f}" for phase, ms in summary["phase_ms"].items()),
+        f"fonts {summary['font_loads'] :.1f}  shapes {summary['shape_renders'] :.1f}  texts {summary['text_renders'] :.1f} per frame"
+    ]
+
+    for element, ms in profiler.get_slowest_elements(OVERLAY_NUM_ELEMENTS):
+        lines.append(f"{describe_element(element)}: {ms :.3f} ms")
+
+    return lines
+
+
+def draw_overlay(surface: pygame.Surface, profiler: Profiler | None = None, x: int = 0, y: int = 0) -> pygame.Rect:
+    """
+    Draw a summary of a profiler (the active one if profiler is None) onto a surface, with its top left corner at x, y, and return the rect it covers.
+
+    The text changes every frame, so it is rendered directly instead of through the text surface cache.
+    """
+    if profiler == None:
+        profiler = active_profiler
+
+    font = fonts.get_font(None, OVERLAY_FONT_SIZE)
+    line_surfaces = [font.render(line, False, OVERLAY_COLOUR, OVERLAY_BACKGROUND_COLOUR) for line in get_overlay_lines(profiler)]
+
+    rect = pygame.Rect(x, y, 0, 0)
+    for text_surface in line_surfaces:
+        surface.blit(text_surface, (x, rect.bottom))
+
+        rect.width = max(rect.width, text_surface.get_width())
+        rect.height += text_surface.get_height()
+
+    return rect
@@ -0,0 +1,320 @@
+from pygame_ui_toolkit import pygame
+
+
+# The kinds of draw command
+BLIT = 0
+FILL = 1
+DRAW = 2
+
+# Only opaque commands that cover at least this many pixels are used to skip the commands underneath them
+MIN_OCCLUDER_AREA = 64 * 64
+
+
+class RenderQueue:
+    """
+    A queue of draw commands that are collected from elements and then drawn in one pass.
+
+    Elements draw through the blit(), blits(), fill() and draw() functions in this module. While a queue is collecting (see start_collecting()), those functions add a command to the queue instead of drawing straight away.
+    Each command is a tuple of its kind (BLIT, FILL or DRAW), target surface, arguments and the rect it covers (None for blits, whose rect is worked out from the source surface, or if it is not known).
+
+    Commands are stored in layers by z order. When the queue is flushed, the layers are drawn from the lowest to the highest z order (commands in the same layer keep the order they were added in),
+    commands that are completely covered by a later (large) opaque fill or blit to the same surface are skipped, and consecutive blits to the same surface are drawn with a single Surface.blits() call.
+
+    Attributes
+    ----------
+    skip_occluded : bool, optional
+        whether commands that would be completely covered by later commands are skipped (defaults to True)
+    layers : dict[int, list[tuple]]
+        the commands waiting to be drawn, keyed by z order
+    num_commands : int
+        the number of commands in the last flush
+    num_skipped : int
+        the number of commands that were skipped in the last flush because they were covered
+    num_blits_calls : int
+        the number of Surface.blits() calls made in the last flush
+
+    Methods
+    -------
+    get_layer(z: int)
+        return the list of commands with a z order
+    get_commands()
+        return every command in the order they are drawn, and empty the queue
+    get_command_rect(command: tuple)
+        return the area of the target surface a command covers
+    is_opaque(command: tuple)
+        return whether a command completely covers its rect
+    find_occluders(commands: list[tuple])
+        return the index, target surface and rect of every large opaque command
+    is_covered(index: int, target: pygame.Surface, rect: pygame.Rect, occluders: list[tuple])
+        return whether a rect drawn by the command at index is completely covered by a later occluder
+    remove_occluded(commands: list[tuple])
+        return the commands that are not completely covered by a later opaque command to the same surface
+    flush()
+        draw every command in the queue and empty it
+    get_stats()
+        return a dict of the counters from the last flush
+    """
+
+    def __init__(self, skip_occluded: bool = True) -> None:
+        """Construct the necessary attributes for the RenderQueue object."""
+        self.skip_occluded = skip_occluded
+
+        self.layers = {}
+
+        self.num_commands = 0
+        self.num_skipped = 0
+        self.num_blits_calls = 0
+
+    def __len__(self) -> int:
+        """Return the number of commands waiting to be drawn."""
+        return sum(len(i) for i in self.layers.values())
+
+    def get_layer(self, z: int) -> list[tuple]:
+        """Return the list of commands with a z order (commands are added to the end of it)."""
+        layer = self.layers.get(z)
+
+        if layer == None:
+            layer = []
+            self.layers[z] = layer
+
+        return layer
+
+    def get_commands(self) -> list[tuple]:
+        """Return every command in the order they are drawn (lowest z order first), and empty the queue."""
+        commands = []
+        for z in sorted(self.layers):
+            commands += self.layers[z]
+
+        self.layers = {}
+
+        return commands
+
+    def get_command_rect(self, command: tuple) -> pygame.Rect | None:
+        """Return the area of the target surface a command covers (None if it is not known)."""
+        kind, _, args, rect = command
+
+        if kind != BLIT:
+            return rect
+
+        source, dest = args[0], args[1]
+
+        if len(args) > 2:
+            width, height = pygame.Rect(args[2]).size
+        else:
+            width, height = source.get_size()
+
+        return pygame.Rect(dest[0], dest[1], width, height)
+
+    def is_opaque(self, command: tuple) -> bool:
+        """Return whether a command completely covers its rect (a fill with an opaque colour, or a blit of a surface without any transparency)."""
+        kind, _, args, _ = command
+
+        if kind == FILL:
+            colour = pygame.Color(args[0])
+            return colour.a == 255
+
+        if kind == BLIT:
+            source = args[0]
+            return source.get_colorkey() == None and source.get_alpha() == None and not source.get_flags() & pygame.SRCALPHA
+
+        return False
+
+    def find_occluders(self, commands: list[tuple]) -> list[tuple[int, pygame.Surface, pygame.Rect]]:
+        """Return the index, target surface and rect of every opaque command that covers at least MIN_OCCLUDER_AREA pixels."""
+        occluders = []
+
+        for index, command in enumerate(commands):
+            kind, target, args, rect = command
+
+            if kind == BLIT:
+                # Blits of an area of the source (e.g. from a texture atlas) only cover the area
+                if len(args) > 2:
+                    width, height = pygame.Rect(args[2]).size
+                else:
+                    width, height = args[0].get_size()
+
+                if width * height < MIN_OCCLUDER_AREA:
+                    continue
+
+                rect = self.get_command_rect(command)
+            elif kind == DRAW or rect.width * rect.height < MIN_OCCLUDER_AREA:
+                continue
+
+            if self.is_opaque(command):
+                occluders.append((index, target, rect))
+
+        return occluders
+
+    def is_covered(self, index: int, target: pygame.Surface, rect: pygame.Rect, occluders: list[tuple[int, pygame.Surface, pygame.Rect]]) -> bool:
+        """Return whether a rect drawn to target by the command at index is completely covered by a later occluder."""
+        for occluder_index, occluder_target, occluder_rect in occluders:
+            if occluder_index > index and occluder_target is target and occluder_rect.contains(rect):
+                return True
+
+        return False
+
+    def remove_occluded(self, commands: list[tuple]) -> list[tuple]:
+        """
+        Return the commands that are not completely covered by a later opaque command to the same surface.
+
+        Only large commands (see find_occluders()) are used to cover others, so most frames only need one quick pass over the commands.
+        """
+        occluders = self.find_occluders(commands)
+
+        if len(occluders) == 0:
+            return commands
+
+        last_index = occluders[-1][0]
+        visible = []
+
+        for index, command in enumerate(commands[:last_index]):
+            rect = self.get_command_rect(command)
+
+            if rect is not None and self.is_covered(index, command[1], rect, occluders):
+                self.num_skipped += 1
+            else:
+                visible.append(command)
+
+        return visible + commands[last_index:]
+
+    def flush(self) -> None:
+        """Draw every command in the queue (in z order) and empty it."""
+        commands = self.get_commands()
+
+        self.num_commands = len(commands)
+        self.num_skipped = 0
+        self.num_blits_calls = 0
+
+        if self.skip_occluded:
+            commands = self.remove_occluded(commands)
+
+        blit_target = None
+        blit_sequence = []
+
+        for kind, target, args, _ in commands:
+            if kind == BLIT and target is blit_target:
+                blit_sequence.append(args)
+                continue
+
+            if len(blit_sequence) > 0:
+                blit_target.blits(blit_sequence, False)
+                self.num_blits_calls += 1
+
+            if kind == BLIT:
+                blit_target = target
+                blit_sequence = [args]
+            else:
+                blit_target = None
+                blit_sequence = []
+
+                if kind == FILL:
+                    pygame.draw.rect(target, *args)
+                else:
+                    args[0](target, *args[1:])
+
+        if len(blit_sequence) > 0:
+            blit_target.blits(blit_sequence, False)
+            self.num_blits_calls += 1
+
+    def get_stats(self) -> dict[str, int]:
+        """Return a dict of the counters from the last flush (commands, skipped and blits_calls)."""
+        return {
+            "commands": self.num_commands,
+            "skipped": self.num_skipped,
+            "blits_calls": self.num_blits_calls
+        }
+
+
+# The queue that is collecting commands, and the layer of it that blit(), blits(), fill() and draw() add commands to (both None if they should draw straight away)
+active_queue = None
+active_layer = None
+
+
+def start_collecting(queue: RenderQueue, z: int = 0) -> None:
+    """Make blit(), blits(), fill() and draw() add commands to the queue (with the z order) instead of drawing straight away."""
+    global active_queue, active_layer
+
+    active_queue = queue
+    active_layer = queue.get_layer(z)
+
+
+def set_z_order(z: int) -> None:
+    """Give the commands that are added to the collecting queue from now on a different z order."""
+    global active_layer
+
+    active_layer = active_queue.get_layer(z)
+
+
+def stop_collecting() -> None:
+    """Make blit(), blits(), fill() and draw() draw straight away again. The commands already collected are drawn when the queue is flushed."""
+    global active_queue, active_layer
+
+    active_queue = None
+    active_layer = None
+
+
+def record(draw_func: callable) -> list[tuple]:
+    """
+    Call draw_func() and return the commands it adds, instead of adding them to the collecting queue.
+
+    The commands can then be added to the queue with add_commands(), on this frame and on later frames where nothing they draw has changed.
+    """
+    global active_layer
+
+    layer = active_layer
+    active_layer = []
+
+    try:
+        draw_func()
+
+        return active_layer
+    finally:
+        active_layer = layer
+
+
+def add_commands(commands: list[tuple]) -> None:
+    """Add commands returned by record() to the collecting queue."""
+    active_layer.extend(commands)
+
+
+def blit(target: pygame.Surface, source: pygame.Surface, dest: tuple[int, int] | pygame.Rect, area: pygame.Rect | None = None) -> None:
+    """Blit source (or the area of it, if area is not None) onto target at dest, like target.blit(), or add the blit to the collecting queue."""
+    if active_layer is None:
+        target.blit(source, dest, area)
+    elif area is None:
+        active_layer.append((BLIT, target, (source, dest), None))
+    else:
+        active_layer.append((BLIT, target, (source, dest, area), None))
+
+
+def blits(target: pygame.Surface, blit_sequence: list[tuple]) -> None:
+    """Blit every (source, dest) or (source, dest, area) sequence onto target, like target.blits(), or add each blit to the collecting queue."""
+    if active_layer is None:
+        target.blits(blit_sequence, False)
+    else:
+        active_layer.extend((BLIT, target, args, None) for args in blit_sequence)
+
+
+def fill(target: pygame.Surface, colour: tuple[int], rect: pygame.Rect | tuple[int]) -> None:
+    """
+    Fill a rect of target with a solid colour, or add the fill to the collecting queue.
+
+    pygame.draw.rect() is used rather than target.fill(), since fill() does not clip rects that start off the top or left of the surface correctly.
+    """
+    if active_layer is None:
+        pygame.draw.rect(target, colour, rect)
+    else:
+        active_layer.append((FILL, target, (colour, rect), pygame.Rect(rect)))
+
+
+def draw(func: callable, target: pygame.Surface, *args: object, rect: pygame.Rect | None = None) -> None:
+    """
+    Call func(target, *args), or add the call to the collecting queue.
+
+    This is used for the pygame.draw functions, e.g. draw(pygame.draw.circle, surface, colour, center, radius).
+    rect is the area the call draws to, which lets it be skipped if it is covered by later commands (None if it is not known, so it is never skipped).
+    """
+    if active_layer is None:
+        func(target, *args)
+    else:
+        active_layer.append((DRAW, target, (func,) + args, rect))
@@ -0,0 +1,137 @@
+from pygame_ui_toolkit import cache
+from pygame_ui_toolkit import pygame
+
+
+MAX_SHAPES = 256
+
+COLOURKEY_OPTIONS = ((255, 0, 255), (0, 255, 1), (1, 0, 254))
+
+
+shape_cache = cache.LRUCache(MAX_SHAPES)
+
+
+def get_colourkey(*colours: tuple[int] | None) -> tuple[int]:
+    """Return a colour to use as the transparent colourkey that is different to every given colour."""
+    used = [tuple(i[:3]) for i in colours if i != None]
+
+    for colourkey in COLOURKEY_OPTIONS:
+        if colourkey not in used:
+            return colourkey
+
+    raise Exception("Could not find a colourkey that is not used by the shape")
+
+
+def create_surface(width: int, height: int, colourkey: tuple[int]) -> pygame.Surface:
+    """Return a surface filled with the colourkey to draw a shape onto."""
+    surface = pygame.Surface((width, height))
+
+    if pygame.display.get_surface() != None:
+        surface = surface.convert()
+
+    surface.fill(colourkey)
+
+    return surface
+
+
+def finish_surface(surface: pygame.Surface, colourkey: tuple[int]) -> pygame.Surface:
+    """Make the colourkey transparent once the shape has been drawn, so the surface can be blitted quickly."""
+    surface.set_colorkey(colourkey, pygame.RLEACCEL)
+
+    return surface
+
+
+def create_rect(width: int, height: int, background_colour: tuple[int], corner_radius: int, border_colour: tuple[int] | None, border_width: int) -> pygame.Surface:
+    """Return a new surface with a (possibly rounded and bordered) rectangle drawn on it."""
+    colourkey = get_colourkey(background_colour, border_colour)
+    surface = create_surface(width, height, colourkey)
+
+    rect = pygame.Rect(0, 0, width, height)
+    pygame.draw.rect(surface, background_colour, rect, border_radius=corner_radius)
+
+    if border_colour != None:
+        pygame.draw.rect(surface, border_colour, rect, border_width, corner_radius)
+
+    return finish_surface(surface, colourkey)
+
+
+def get_rect(width: int, height: int, background_colour: tuple[int], corner_radius: int = -1, border_colour: tuple[int] | None = None, border_width: int = 0) -> pygame.Surface:
+    """
+    Return a surface with a rectangle drawn on it, to be blitted at the top left corner of the rectangle.
+
+    The same surface is returned for every call with the same arguments, so the rectangle is only drawn once.
+    """
+    key = ("rect", width, height, tuple(background_colour), corner_radius, border_colour and tuple(border_colour), border_width)
+
+    return shape_cache.get(key, lambda: create_rect(width, height, background_colour, corner_radius, border_colour, border_width))
+
+
+def create_circle(radius: int, background_colour: tuple[int], border_colour: tuple[int] | None, border_width: int) -> pygame.Surface:
+    """Return a new surface with a (possibly bordered) circle drawn on it."""
+    colourkey = get_colourkey(background_colour, border_colour)
+    surface = create_surface(2 * radius + 1, 2 * radius + 1, colourkey)
+
+    pygame.draw.circle(surface, background_colour, (radius, radius), radius)
+
+    if border_colour != None:
+        pygame.draw.circle(surface, border_colour, (radius, radius), radius, border_width)
+
+    return finish_surface(surface, colourkey)
+
+
+def get_circle(radius: int, background_colour: tuple[int], border_colour: tuple[int] | None = None, border_width: int = 0) -> pygame.Surface:
+    """
+    Return a surface with a circle drawn on it, to be blitted at (x - radius, y - radius).
+
+    The same surface is returned for every call with the same arguments, so the circle is only drawn once.
+    """
+    key = ("circle", radius, tuple(background_colour), border_colour and tuple(border_colour), border_width)
+
+    return shape_cache.get(key, lambda: create_circle(radius, background_colour, border_colour, border_width))
+
+
+def create_polygon(points: tuple[tuple[int]], width: int, height: int, background_colour: tuple[int], border_colour: tuple[int] | None, border_width: int) -> pygame.Surface:
+    """Return a new surface with a (possibly bordered) polygon drawn on it, where the points are relative to the top left of the surface."""
+    colourkey = get_colourkey(background_colour, border_colour)
+    surface = create_surface(width, height, colourkey)
+
+    pygame.draw.polygon(surface, background_colour, points)
+
+    if border_colour != None:
+        pygame.draw.polygon(surface, border_colour, points, border_width)
+
+    return finish_surface(surface, colourkey)
+
+
+def get_polygon(points: list[tuple[int]], background_colour: tuple[int], border_colour: tuple[int] | None = None, border_width: int = 0) -> tuple[pygame.Surface, tuple[int, int]]:
+    """
+    Return a surface with a polygon drawn on it and the position to blit it to.
+
+    The surface is cached by the shape of the polygon (not its position), so moving a polygon does not draw it again.
+    The surface is padded by border_width, since a border can extend past the points.
+    """
+    x_values = [i[0] for i in points]
+    y_values = [i[1] for i in points]
+
+    min_x = min(x_values) - border_width
+    min_y = min(y_values) - border_width
+
+    width = max(x_values) - min_x + border_width + 1
+    height = max(y_values) - min_y + border_width + 1
+
+    relative_points = tuple((x - min_x, y - min_y) for x, y in points)
+
+    key = ("polygon", relative_points, tuple(background_colour), border_colour and tuple(border_colour), border_width)
+
+    surface = shape_cache.get(key, lambda: create_polygon(relative_points, width, height, background_colour, border_colour, border_width))
+
+    return surface, (min_x, min_y)
+
+
+def clear() -> None:
+    """Remove every cached shape and reset the cache counters."""
+    shape_cache.clear()
+
+
+def get_stats() -> dict[str, int]:
+    """Return a dict of the shape cache counters (size, max_size, bytes, max_bytes, hits, misses and evictions)."""
+    return shape_cache.get_stats()
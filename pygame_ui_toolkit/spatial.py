@@ -0,0 +1,140 @@
+from pygame_ui_toolkit import hit_test
+from pygame_ui_toolkit import pygame
+
+
+DEFAULT_CELL_SIZE = 64
+
+
+class SpatialGrid:
+    """
+    A uniform grid over the bounding rects of elements, used to quickly find which elements contain a point.
+
+    Elements must have get_bounding_rect() and geometry_changed() methods, a spatial_index attribute and everything hit_test.check_point() needs (every button class does).
+    Points are tested against the cached hit rect of each element in their cell, so nothing is recalculated for elements that have not moved.
+    Once inserted, an element tells the grid when it moves or changes size (when x, y, width, height or radius are assigned to, or its geometry_changed() method is called), and only those elements are moved to new cells.
+
+    Attributes
+    ----------
+    cell_size : int, optional
+        the width and height of each grid cell (defaults to DEFAULT_CELL_SIZE)
+    cells : dict[tuple[int, int], set[object]]
+        the elements whose bounding rect overlaps each cell, keyed by cell coordinates
+    element_cells : dict[object, list[tuple[int, int]]]
+        the coordinates of the cells each element is in
+    moved : set[object]
+        the elements that have moved since the grid was last queried
+
+    Methods
+    -------
+    get_cell_keys(rect: pygame.Rect)
+        return the coordinates of every cell that overlaps a rect
+    add_to_cells(element: object, keys: list[tuple[int, int]])
+        add an element to each of the cells with the given coordinates
+    remove_from_cells(element: object)
+        remove an element from every cell it is in
+    insert(element: object)
+        add an element to the grid
+    remove(element: object)
+        remove an element from the grid
+    mark_moved(element: object)
+        record that an element has moved or changed size
+    update_moved()
+        move every element that has been marked as moved into its new cells
+    get_cell(x: int, y: int)
+        return the elements in the cell that contains a point
+    query_point(x: int, y: int)
+        return every element whose hit rect contains the point
+    elements_at(x: int, y: int)
+        return every element that contains the point
+    """
+
+    def __init__(self, cell_size: int = DEFAULT_CELL_SIZE) -> None:
+        """Construct the necessary attributes for the SpatialGrid object."""
+        self.cell_size = cell_size
+
+        self.cells = {}
+        self.element_cells = {}
+
+        self.moved = set()
+
+    def __len__(self) -> int:
+        """Return the number of elements in the grid."""
+        return len(self.element_cells)
+    
+    def __contains__(self, element: object) -> bool:
+        """Return whether an element is in the grid."""
+        return element in self.element_cells
+
+    def get_cell_keys(self, rect: pygame.Rect) -> list[tuple[int, int]]:
+        """Return the coordinates of every cell that overlaps a rect."""
+        min_x = rect.left // self.cell_size
+        min_y = rect.top // self.cell_size
+        max_x = (rect.right - 1) // self.cell_size
+        max_y = (rect.bottom - 1) // self.cell_size
+
+        return [(i, j) for i in range(min_x, max_x + 1) for j in range(min_y, max_y + 1)]
+
+    def add_to_cells(self, element: object, keys: list[tuple[int, int]]) -> None:
+        """Add an element to each of the cells with the given coordinates."""
+        for key in keys:
+            if key in self.cells:
+                self.cells[key].add(element)
+            else:
+                self.cells[key] = {element}
+
+        self.element_cells[element] = keys
+
+    def remove_from_cells(self, element: object) -> None:
+        """Remove an element from every cell it is in."""
+        for key in self.element_cells.pop(element):
+            cell = self.cells[key]
+            cell.discard(element)
+
+            if len(cell) == 0:
+                del self.cells[key]
+
+    def insert(self, element: object) -> None:
+        """Add an element to the grid."""
+        if element in self.element_cells:
+            self.remove_from_cells(element)
+
+        self.add_to_cells(element, self.get_cell_keys(element.get_bounding_rect()))
+
+        element.spatial_index = self
+
+    def remove(self, element: object) -> None:
+        """Remove an element from the grid."""
+        self.remove_from_cells(element)
+        self.moved.discard(element)
+
+        element.spatial_index = None
+
+    def mark_moved(self, element: object) -> None:
+        """Record that an element has moved or changed size. It is moved into its new cells the next time the grid is queried."""
+        self.moved.add(element)
+
+    def update_moved(self) -> None:
+        """Move every element that has been marked as moved into its new cells."""
+        for element in self.moved:
+            keys = self.get_cell_keys(element.get_bounding_rect())
+
+            if keys != self.element_cells[element]:
+                self.remove_from_cells(element)
+                self.add_to_cells(element, keys)
+
+        self.moved.clear()
+
+    def get_cell(self, x: int, y: int) -> set[object]:
+        """Return the elements in the cell that contains a point, moving the elements that have been marked as moved first."""
+        if len(self.moved) > 0:
+            self.update_moved()
+
+        return self.cells.get((x // self.cell_size, y // self.cell_size), ())
+
+    def query_point(self, x: int, y: int) -> list[object]:
+        """Return every element whose (cached) hit rect contains the point. This is a superset of the elements that contain the point."""
+        return [i for i in self.get_cell(x, y) if hit_test.get_cached_hit_rect(i).collidepoint(x, y)]
+    
+    def elements_at(self, x: int, y: int) -> list[object]:
+        """Return every element that contains the point, testing the cached hit rect of each element in the cell before its exact shape (see hit_test.check_point())."""
+        return [i for i in self.get_cell(x, y) if hit_test.check_point(i, x, y)]
@@ -0,0 +1,251 @@
+# Runs are split in half once they are longer than this, so an edit only ever changes a short run
+MAX_RUN_LENGTH = 64
+
+
+def split_runs(text: str) -> list[str]:
+    """Split text into runs of half of MAX_RUN_LENGTH characters, leaving room for each run to grow before it is split again."""
+    run_length = MAX_RUN_LENGTH // 2
+
+    return [text[i : i + run_length] for i in range(0, len(text), run_length)]
+
+
+class TextBuffer:
+    """
+    The text of a text input, with a cursor and selection.
+
+    The text is stored as a list of short runs (at most MAX_RUN_LENGTH characters each) rather than a single string, like the leaves of a rope.
+    Inserting or deleting text only rebuilds the runs it touches, so the cost of an edit does not depend on the length of the text, and the runs that were not touched keep the same string objects.
+    This lets anything cached by run (e.g. rendered text surfaces and their widths, see text_surfaces) be reused after each edit.
+
+    The run that was found last is remembered, so finding the run at the cursor after moving it by a few characters does not search the whole list.
+
+    Attributes
+    ----------
+    runs : list[str]
+        the text, split into runs that are not empty
+    length : int
+        the number of characters in the text
+    cursor : int
+        the index of the character the cursor is in front of (equal to length if it is at the end)
+    selection_anchor : int | None
+        the index the selection was started from (the cursor is the other end of it), or None if no text is selected
+    version : int
+        the number of times the text has changed, so other objects can tell when it changes without comparing the text
+    joined_text : str | None
+        the runs joined into a single string, or None if the text has changed since it was last joined
+    last_run : tuple[int, int]
+        the index and start of the run that was found last
+
+    Methods
+    -------
+    set_text(text: str)
+        replace the text, moving the cursor to the end and clearing the selection
+    get_text()
+        return the text as a single string
+    find_run(index: int)
+        return the index and start of the run that contains a character index
+    text_changed()
+        record that the text has changed
+    insert(text: str)
+        insert text at the cursor, replacing the selected text
+    delete(start: int, end: int)
+        delete the characters from start up to (but not including) end
+    delete_selection()
+        delete the selected text, if there is any
+    backspace()
+        delete the selected text, or the character before the cursor
+    delete_forward()
+        delete the selected text, or the character after the cursor
+    move_cursor(index: int, select: bool = False)
+        move the cursor to an index, selecting the text in between if select is True
+    select_all()
+        select all of the text
+    get_selection()
+        return the start and end of the selected text
+    get_selected_text()
+        return the selected text
+    """
+
+    __slots__ = ("runs", "length", "cursor", "selection_anchor", "version", "joined_text", "last_run")
+
+    def __init__(self, text: str = "") -> None:
+        """Construct the necessary attributes for the TextBuffer object."""
+        self.version = 0
+        self.set_text(text)
+
+    def __len__(self) -> int:
+        """Return the number of characters in the text."""
+        return self.length
+
+    def set_text(self, text: str) -> None:
+        """Replace the text, moving the cursor to the end and clearing the selection."""
+        self.runs = split_runs(text)
+        self.length = len(text)
+
+        self.cursor = self.length
+        self.selection_anchor = None
+
+        self.text_changed()
+        self.joined_text = text
+        self.last_run = (0, 0)
+
+    def get_text(self) -> str:
+        """Return the text as a single string. The string is only joined again after the text has changed."""
+        if self.joined_text == None:
+            self.joined_text = "".join(self.runs)
+
+        return self.joined_text
+
+    def find_run(self, index: int) -> tuple[int, int]:
+        """
+        Return the index and start of the run that contains a character index (between 0 and length).
+
+        An index at the boundary between two runs is treated as the end of the first one, so text typed at the end of a run is added to it.
+        The search starts from the run that was found last.
+        """
+        runs = self.runs
+        run_index, run_start = self.last_run
+
+        if run_index >= len(runs):
+            run_index, run_start = 0, 0
+
+        while index <= run_start and run_index > 0:
+            run_index -= 1
+            run_start -= len(runs[run_index])
+
+        while index > run_start + len(runs[run_index]) and run_index < len(runs) - 1:
+            run_start += len(runs[run_index])
+            run_index += 1
+
+        self.last_run = (run_index, run_start)
+
+        return run_index, run_start
+
+    def text_changed(self) -> None:
+        """Record that the text has changed, so the joined text and anything cached by version are out of date."""
+        self.version += 1
+        self.joined_text = None
+
+    def insert(self, text: str) -> None:
+        """Insert text at the cursor (replacing the selected text, if there is any) and move the cursor to the end of it."""
+        self.delete_selection()
+
+        if len(text) == 0:
+            return
+
+        if len(self.runs) == 0:
+            self.runs = split_runs(text)
+        else:
+            run_index, run_start = self.find_run(self.cursor)
+
+            run = self.runs[run_index]
+            offset = self.cursor - run_start
+
+            new_run = f"{run[:offset]}{text}{run[offset:]}"
+
+            if len(new_run) > MAX_RUN_LENGTH:
+                self.runs[run_index : run_index + 1] = split_runs(new_run)
+            else:
+                self.runs[run_index] = new_run
+
+        self.length += len(text)
+        self.cursor += len(text)
+
+        self.text_changed()
+
+    def delete(self, start: int, end: int) -> None:
+        """Delete the characters from start up to (but not including) end, moving the cursor to start if it was after it."""
+        start = max(start, 0)
+        end = min(end, self.length)
+
+        if start >= end:
+            return
+
+        num_chars = end - start
+        run_index, run_start = self.find_run(start)
+
+        while num_chars > 0:
+            run = self.runs[run_index]
+            offset = start - run_start
+
+            # The start is at the end of this run, so the characters to delete begin in the next one
+            if offset == len(run):
+                run_index += 1
+                run_start += len(run)
+                continue
+
+            num_deleted = min(num_chars, len(run) - offset)
+            new_run = f"{run[:offset]}{run[offset + num_deleted:]}"
+
+            if len(new_run) == 0:
+                del self.runs[run_index]
+            else:
+                self.runs[run_index] = new_run
+
+            num_chars -= num_deleted
+
+        self.length -= end - start
+
+        if self.cursor > start:
+            self.cursor = max(start, self.cursor - (end - start))
+
+        self.selection_anchor = None
+
+        self.text_changed()
+
+    def delete_selection(self) -> bool:
+        """Delete the selected text, if there is any, and return whether anything was deleted."""
+        selection = self.get_selection()
+
+        if selection == None:
+            self.selection_anchor = None
+            return False
+
+        self.delete(*selection)
+        self.cursor = selection[0]
+
+        return True
+
+    def backspace(self) -> None:
+        """Delete the selected text, or the character before the cursor if nothing is selected."""
+        if not self.delete_selection():
+            self.delete(self.cursor - 1, self.cursor)
+
+    def delete_forward(self) -> None:
+        """Delete the selected text, or the character after the cursor if nothing is selected."""
+        if not self.delete_selection():
+            self.delete(self.cursor, self.cursor + 1)
+
+    def move_cursor(self, index: int, select: bool = False) -> None:
+        """
+        Move the cursor to an index (clamped to the text).
+
+        If select is True, the text between the start of the selection (or the old cursor position, if nothing was selected) and the new position is selected. Otherwise, the selection is cleared.
+        """
+        if select and self.selection_anchor == None:
+            self.selection_anchor = self.cursor
+        elif not select:
+            self.selection_anchor = None
+
+        self.cursor = min(max(index, 0), self.length)
+
+    def select_all(self) -> None:
+        """Select all of the text, leaving the cursor at the end."""
+        self.selection_anchor = 0
+        self.cursor = self.length
+
+    def get_selection(self) -> tuple[int, int] | None:
+        """Return the start and end index of the selected text, or None if no text is selected."""
+        if self.selection_anchor == None or self.selection_anchor == self.cursor:
+            return None
+
+        return min(self.selection_anchor, self.cursor), max(self.selection_anchor, self.cursor)
+
+    def get_selected_text(self) -> str:
+        """Return the selected text ("" if no text is selected)."""
+        selection = self.get_selection()
+
+        if selection == None:
+            return ""
+
+        return self.get_text()[selection[0] : selection[1]]
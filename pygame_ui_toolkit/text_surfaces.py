@@ -0,0 +1,50 @@
+from pygame_ui_toolkit import cache
+from pygame_ui_toolkit import pygame
+
+
+MAX_TEXT_SURFACES = 512
+MAX_TEXT_BYTES = 4 * 1024 * 1024
+MAX_TEXT_SIZES = 8192
+
+
+text_cache = cache.LRUCache(MAX_TEXT_SURFACES, MAX_TEXT_BYTES, cache.get_surface_size)
+size_cache = cache.LRUCache(MAX_TEXT_SIZES)
+
+
+def render(font: pygame.font.Font, text: str, antialias: bool, font_colour: tuple[int], background_colour: tuple[int] | None = None) -> pygame.Surface:
+    """
+    Return a surface with the text rendered on it, like font.render().
+
+    The same surface is returned for every call with the same arguments, so text that is shown again (e.g. "ON" and "OFF" labels, or dropdown options) is only rendered once.
+    The font object stands for the font name, size and style, since fonts.get_font() returns the same object for the same arguments.
+    Because surfaces are shared, they should not be drawn onto or changed after they are returned.
+    """
+    key = (text, font, antialias, tuple(font_colour), background_colour and tuple(background_colour))
+
+    return text_cache.get(key, lambda: font.render(text, antialias, font_colour, background_colour))
+
+
+def get_size(font: pygame.font.Font, text: str) -> tuple[int, int]:
+    """
+    Return the width and height of text rendered with font, like font.size(text).
+
+    Sizes are cached, so text that is measured again (e.g. the runs of a text input that were not edited, or single characters) is only measured once.
+    """
+    return size_cache.get((text, font), lambda: font.size(text))
+
+
+def set_max_bytes(max_bytes: int | None) -> None:
+    """Change the maximum total size (in bytes) of the cached text surfaces, removing surfaces if the cache is now too large."""
+    text_cache.max_bytes = max_bytes
+    text_cache.evict()
+
+
+def clear() -> None:
+    """Remove every cached text surface and size and reset the cache counters."""
+    text_cache.clear()
+    size_cache.clear()
+
+
+def get_stats() -> dict[str, int | None]:
+    """Return a dict of the text surface cache counters (size, max_size, bytes, max_bytes, hits, misses and evictions)."""
+    return text_cache.get_stats()
@@ -1,5 +1,7 @@
 from inspect import signature
-from pygame import font
+from operator import attrgetter
+from pygame_ui_toolkit import fonts
+from pygame_ui_toolkit import profiling
 
 
 def find_num_params(func: callable) -> int:
@@ -10,26 +12,102 @@ def find_num_params(func: callable) -> int:
     return len(params)
 
 
-def call_func(func: callable, *args) -> None:
+def do_nothing(*args) -> None:
+    """Accept any number of arguments and do nothing. This is used in place of callbacks that are None."""
+
+
+def bind_func(func: callable) -> callable:
     """
-    Call a function - if it is not None - and pass the appropriate arguments in to it.
-    
+    Return a callable that passes the appropriate arguments into func - if it is not None.
+
+    The number of arguments func accepts is only found once (rather than every time it is called), so the returned callable is cheap enough to call every frame.
+    It should be called with the same arguments that would be passed into call_func().
+    While a profiler is enabled (see profiling.enable()), the time func takes is added to its callbacks phase.
+
     An exception is raised if the function accepts an invalid number of arguments.
     """
 
     if func == None:
-        return
+        return do_nothing
     
     num_params = find_num_params(func)
 
     if num_params == 0:
-        func()
+        return lambda *args: func() if profiling.active_profiler is None else profiling.time_callback(func)
     elif num_params == 1:
-        func(args[0])
+        return lambda first, *args: func(first) if profiling.active_profiler is None else profiling.time_callback(func, first)
     elif num_params == 2:
-        func(args[0], args[1])
+        return lambda first, second, *args: func(first, second) if profiling.active_profiler is None else profiling.time_callback(func, first, second)
     else:
         raise Exception(f"Invalid number of parameters for {func}. {func} should accept 0, 1 or 2 arguments.")
+
+
+def call_func(func: callable, *args) -> None:
+    """
+    Call a function - if it is not None - and pass the appropriate arguments in to it.
+    
+    An exception is raised if the function accepts an invalid number of arguments.
+
+    This finds the number of arguments every time it is called. For functions called every frame, use bind_func() or a CallbackAttribute instead.
+    """
+
+    bind_func(func)(*args)
+
+
+class CallbackAttribute:
+    """
+    A descriptor for callback attributes (such as on_click) that binds the callback when it is assigned.
+
+    Reading the attribute returns the function that was assigned, so it can be stored and reassigned as normal.
+    Assigning to the attribute also stores the result of bind_func() in "_<name>_bound", which should be called instead of using call_func() on hot paths.
+    Reassigning the attribute (e.g. in the presets) replaces the bound callable, so it is never out of date.
+
+    Attributes
+    ----------
+    func_attr : str
+        the name of the attribute the assigned function is stored in
+    bound_attr : str
+        the name of the attribute the bound callable is stored in
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Find the names of the attributes used to store the function and the bound callable."""
+        self.func_attr = f"_{name}"
+        self.bound_attr = f"_{name}_bound"
+
+    def __get__(self, obj: object, obj_type: type = None) -> callable:
+        """Return the function that was assigned to the attribute."""
+        if obj == None:
+            return self
+        
+        return getattr(obj, self.func_attr)
+
+    def __set__(self, obj: object, func: callable) -> None:
+        """Store the function and its bound callable."""
+        setattr(obj, self.func_attr, func)
+        setattr(obj, self.bound_attr, bind_func(func))
+
+
+def geometry_attribute(name: str) -> property:
+    """
+    Return a property for an attribute that affects the hit rect of an element (such as x, y, width, height or radius).
+
+    The value is stored in "_<name>", which must be in the __slots__ of the class.
+    Assigning to the attribute sets the element's hit_rect to None, and marks the element as moved in its spatial index (if it has one), so hit tests always use the current position and size.
+    The value is read with operator.attrgetter() rather than a Python function, since these attributes are read every frame.
+    """
+    value_attr = f"_{name}"
+
+    def set_value(obj: object, value: object) -> None:
+        setattr(obj, value_attr, value)
+        obj.hit_rect = None
+
+        spatial_index = getattr(obj, "spatial_index", None)
+
+        if spatial_index != None:
+            spatial_index.mark_moved(obj)
+
+    return property(attrgetter(value_attr), set_value, doc=f"the {name} of the element (assigning to it updates the hit rect)")
     
 
 def update_font_attrs(obj: object, text: str, font_colour: tuple[int], font_name: str, font_size: int) -> None:
@@ -37,4 +115,37 @@ def update_font_attrs(obj: object, text: str, font_colour: tuple[int], font_name
     obj.text = text
     obj.font_colour = font_colour
 
-    obj.font = font.Font(font_name, font_size)
\ No newline at end of file
+    obj.font = fonts.get_font(font_name, font_size)
+
+def update_rendered_text(obj: object) -> bool:
+    """
+    Render the text of an object again, only if its render state has changed since it was last rendered.
+
+    The object must have a get_render_state() method, a get_text() method and rendered_state, text_surface and text_rect attributes.
+    Returns whether the text was rendered.
+    """
+    render_state = obj.get_render_state()
+
+    if render_state == obj.rendered_state:
+        return False
+
+    obj.text_surface, obj.text_rect = obj.get_text()
+    obj.rendered_state = render_state
+
+    return True
+
+def set_preset_variables(obj: object, preset_name: str, variables: dict) -> None:
+    """
+    Store the variables a preset needs to use later on the object itself.
+
+    The variables are kept in obj.preset_variables (a dict keyed by the preset name), so they are freed along with the object.
+    """
+    if obj.preset_variables == None:
+        obj.preset_variables = {}
+
+    obj.preset_variables[preset_name] = variables
+
+
+def get_preset_variables(obj: object, preset_name: str) -> dict:
+    """Return the variables a preset has stored on an object."""
+    return obj.preset_variables[preset_name]
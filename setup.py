@@ -3,6 +3,9 @@ import setuptools
 
 DEPENDENCIES = ["pygame>=2.0.0"]
 
+# Only needed for some features (e.g. button_array.ButtonArray)
+OPTIONAL_DEPENDENCIES = {"numpy": ["numpy>=1.20"]}
+
 
 with open("README.md", "r") as file:
     FULL_DESC = file.read()
@@ -16,8 +19,9 @@ setuptools.setup(
     long_description=FULL_DESC,
     long_description_content_type="text/markdown",
     url="https://github.com/Ben-Edwards44/pygame-ui-toolkit",
-    packages=setuptools.find_packages(exclude=["examples"]),
+    packages=setuptools.find_packages(exclude=["examples", "benchmarks"]),
     install_requires=DEPENDENCIES,
+    extras_require=OPTIONAL_DEPENDENCIES,
     python_requires=">=3.6",
     license="MIT",
     classifiers=[
@@ -0,0 +1,34 @@
+import os
+
+from pygame_ui_toolkit import pygame, assets, fonts
+
+
+pygame.font.init()
+
+DEFAULT_FONT_PATH = os.path.join(os.path.dirname(pygame.__file__), pygame.font.get_default_font())
+
+
+def test_loaded_font_matches_get_font():
+    fonts.clear()
+
+    loader = assets.AssetLoader(1)
+    loaded = []
+
+    loader.load_font(DEFAULT_FONT_PATH, 30, on_loaded=loaded.append)
+    loader.load_font(None, 24, bold=True, on_loaded=loaded.append)
+    loader.wait()
+    loader.shutdown()
+
+    assert loader.errors == []
+    assert loaded[0] is fonts.get_font(DEFAULT_FONT_PATH, 30)
+    assert loaded[1] is fonts.get_font(None, 24, True)
+
+    assert loaded[0].size("Hello") == pygame.font.Font(DEFAULT_FONT_PATH, 30).size("Hello")
+    assert loaded[1].size("Hello") == fonts.create_font(None, 24, True, False, False).size("Hello")
+
+
+def test_read_font_file():
+    data = fonts.read_font_file(DEFAULT_FONT_PATH)
+
+    assert isinstance(data, bytes) and len(data) > 0
+    assert fonts.read_font_file(None) == None
@@ -0,0 +1,88 @@
+from pygame_ui_toolkit import pygame, input_state, spatial
+from pygame_ui_toolkit.elements import button, text, text_area
+
+
+pygame.font.init()
+
+
+def mouse_over_at(element, pos):
+    """Return the result of element.mouse_over() with the mouse at pos."""
+    input_state.set_state(input_state.InputState(pos, (False, False, False)))
+
+    try:
+        return element.mouse_over()
+    finally:
+        input_state.set_state(None)
+
+
+def test_moved_rect_button():
+    surface = pygame.Surface((400, 400))
+    rect_button = button.RectButton(surface, 50, 50, (255, 0, 0), 40, 20)
+
+    assert mouse_over_at(rect_button, (50, 50))
+
+    rect_button.x = 200
+    rect_button.y = 300
+
+    assert not mouse_over_at(rect_button, (50, 50))
+    assert mouse_over_at(rect_button, (200, 300))
+    assert mouse_over_at(rect_button, (220, 310))
+
+
+def test_resized_rect_button():
+    surface = pygame.Surface((400, 400))
+    rect_button = button.RectButton(surface, 100, 100, (255, 0, 0), 20, 20)
+
+    assert not mouse_over_at(rect_button, (140, 100))
+
+    rect_button.width = 100
+
+    assert mouse_over_at(rect_button, (140, 100))
+
+    rect_button.height = 4
+
+    assert not mouse_over_at(rect_button, (100, 110))
+
+
+def test_resized_circle_button():
+    surface = pygame.Surface((400, 400))
+    circle_button = button.CircleButton(surface, 100, 100, (255, 0, 0), 10)
+
+    assert not mouse_over_at(circle_button, (130, 100))
+
+    circle_button.radius = 40
+
+    assert mouse_over_at(circle_button, (130, 100))
+    assert not mouse_over_at(circle_button, (130, 130))
+
+
+def test_moved_button_in_spatial_index():
+    surface = pygame.Surface((400, 400))
+    rect_button = button.RectButton(surface, 50, 50, (255, 0, 0), 40, 20)
+
+    grid = spatial.SpatialGrid()
+    grid.insert(rect_button)
+
+    assert grid.elements_at(50, 50) == [rect_button]
+
+    rect_button.x = 300
+
+    assert grid.elements_at(50, 50) == []
+    assert grid.elements_at(300, 50) == [rect_button]
+
+
+def test_moved_text_box_and_text_area():
+    surface = pygame.Surface((400, 400))
+    text_box = text.RectTextBox(surface, 50, 50, 40, 20, "Box", (0, 0, 0), (255, 255, 255), 20)
+    area = text_area.TextArea(surface, 100, 100, 60, 60, (0, 0, 0), (255, 255, 255), 20)
+
+    assert mouse_over_at(text_box, (50, 50))
+    assert mouse_over_at(area, (100, 100))
+
+    text_box.x = 250
+    area.y = 300
+
+    assert not mouse_over_at(text_box, (50, 50))
+    assert mouse_over_at(text_box, (250, 50))
+    assert not mouse_over_at(area, (100, 100))
+    assert mouse_over_at(area, (100, 300))
@@ -0,0 +1,61 @@
+from pygame_ui_toolkit import pygame, input_state
+from pygame_ui_toolkit.elements import manager, text_area
+
+
+pygame.font.init()
+
+
+def set_mouse(monkeypatch, pos, left_held):
+    """Make pygame report the mouse at pos, with the left button held down if left_held is True."""
+    monkeypatch.setattr(pygame.mouse, "get_pos", lambda: pos)
+    monkeypatch.setattr(pygame.mouse, "get_pressed", lambda num_buttons=3: (left_held, False, False))
+
+
+def test_snapshot_cleared_after_manager_update(monkeypatch):
+    set_mouse(monkeypatch, (10, 20), False)
+
+    ui_manager = manager.UIManager()
+    ui_manager.update([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, unicode="a")])
+
+    assert input_state.current_state == None
+    assert input_state.get_events() == []
+
+    # Elements updated outside the manager read the mouse from pygame again
+    set_mouse(monkeypatch, (30, 40), False)
+
+    assert input_state.get_mouse_pos() == (30, 40)
+
+
+def test_capture_finds_pressed_buttons_after_clearing(monkeypatch):
+    set_mouse(monkeypatch, (0, 0), False)
+    input_state.capture([])
+    input_state.set_state(None)
+
+    set_mouse(monkeypatch, (0, 0), True)
+    state = input_state.capture([])
+    input_state.set_state(None)
+
+    assert state.pressed == (True, False, False)
+
+    state = input_state.capture([])
+    input_state.set_state(None)
+
+    assert state.pressed == (False, False, False)
+
+
+def test_text_area_scrolls_once_per_wheel_event(monkeypatch):
+    set_mouse(monkeypatch, (100, 100), False)
+
+    surface = pygame.Surface((200, 200))
+    area = text_area.TextArea(surface, 100, 100, 200, 100, (0, 0, 0), (255, 255, 255), 20, text="\n".join(str(i) for i in range(100)), follow_end=False)
+    ui_manager = manager.UIManager([area])
+
+    ui_manager.update([pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=-1)])
+    scroll_position = (area.top_line, area.top_row)
+
+    assert scroll_position != (0, 0)
+
+    ui_manager.update([])
+    area.update([])
+
+    assert (area.top_line, area.top_row) == scroll_position
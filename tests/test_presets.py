@@ -0,0 +1,64 @@
+import gc
+import weakref
+
+from pygame_ui_toolkit import pygame, input_state
+from pygame_ui_toolkit.presets import button_colour_change, button_size_change, input_size_colour_change, slider_value_text
+
+
+pygame.font.init()
+
+NUM_ROUNDS = 5
+
+
+class Callback:
+    """A callback that can be weakly referenced, to check that the preset state holding it is freed."""
+
+    def __call__(self, element):
+        pass
+
+
+def create_elements(surface):
+    """Return one element made by each preset, and the callbacks they were given."""
+    callbacks = [Callback() for _ in range(4)]
+
+    elements = [
+        button_colour_change.create_button((255, 255, 255), (200, 200, 200), (100, 100, 100), surface, 50, 50, 40, 20, on_click=callbacks[0]),
+        button_size_change.create_button((40, 20), (44, 22), (36, 18), surface, 50, 100, (255, 255, 255), on_hover=callbacks[1]),
+        input_size_colour_change.create_text_input((255, 255, 255), (200, 200, 200), (100, 30), (104, 32), (96, 28), surface, 100, 150, (0, 0, 0), 20, on_normal=callbacks[2], on_text_input=callbacks[3]),
+        slider_value_text.create_slider_text(surface, 100, 200, 100, 230, 150, 10, 0, 100, 50, (200, 200, 200), None, 20, (255, 255, 255))
+    ]
+
+    return elements, callbacks
+
+
+def update_elements(elements, mouse_pos, mouse_held):
+    """Update every element for one frame with the mouse at mouse_pos, so the preset callbacks are called."""
+    input_state.set_state(input_state.InputState(mouse_pos, (mouse_held, False, False)))
+
+    try:
+        for element in elements[:2]:
+            element.update_state()
+
+        elements[2].update_state([])
+        elements[3].update_state()
+    finally:
+        input_state.set_state(None)
+
+
+def test_preset_state_is_freed():
+    surface = pygame.Surface((300, 300))
+
+    for _ in range(NUM_ROUNDS):
+        elements, callbacks = create_elements(surface)
+
+        for mouse_pos in ((50, 50), (50, 100), (100, 150), (100, 200)):
+            update_elements(elements, mouse_pos, False)
+            update_elements(elements, mouse_pos, True)
+
+        refs = [weakref.ref(i) for i in elements + callbacks]
+
+        del elements, callbacks
+        gc.collect()
+
+        assert [i() for i in refs] == [None] * len(refs)
+
@@ -0,0 +1,43 @@
+import gc
+import weakref
+
+from pygame_ui_toolkit import pygame, input_state, profiling
+from pygame_ui_toolkit.elements import button, manager
+
+
+def run_frames(ui_manager, profiler, num_frames):
+    """Update and draw every element in the manager for a number of frames, ending each profiler frame."""
+    input_state.set_state(input_state.InputState((0, 0), (False, False, False)))
+
+    try:
+        for _ in range(num_frames):
+            ui_manager.update_elements([])
+            ui_manager.draw_elements()
+            profiler.end_frame()
+    finally:
+        input_state.set_state(None)
+
+
+def test_removed_elements_are_freed():
+    surface = pygame.Surface((200, 200))
+    kept = button.RectButton(surface, 50, 50, (255, 0, 0), 40, 20)
+    removed = button.RectButton(surface, 150, 50, (0, 255, 0), 40, 20)
+
+    ui_manager = manager.UIManager([kept, removed])
+    profiler = profiling.enable()
+
+    try:
+        run_frames(ui_manager, profiler, 3)
+
+        assert {element for element, _ in profiler.get_slowest_elements(10)} == {kept, removed}
+
+        ui_manager.remove(removed)
+        removed_ref = weakref.ref(removed)
+
+        del removed
+        gc.collect()
+
+        assert removed_ref() == None
+        assert [element for element, _ in profiler.get_slowest_elements(10)] == [kept]
+    finally:
+        profiling.disable()
@@ -0,0 +1,165 @@
+from pygame_ui_toolkit import pygame, render_queue
+
+
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+BLUE = (0, 0, 255)
+
+
+def flush(queue, draw_func):
+    """Collect the commands draw_func() adds to the queue, then flush it and return its stats."""
+    render_queue.start_collecting(queue)
+
+    try:
+        draw_func()
+    finally:
+        render_queue.stop_collecting()
+
+    queue.flush()
+
+    return queue.get_stats()
+
+
+def test_fill_covered_by_later_fill_is_skipped():
+    surface = pygame.Surface((200, 200))
+    queue = render_queue.RenderQueue()
+
+    def draw():
+        render_queue.fill(surface, RED, pygame.Rect(20, 20, 30, 30))
+        render_queue.fill(surface, GREEN, pygame.Rect(0, 0, 100, 100))
+
+    stats = flush(queue, draw)
+
+    assert stats["commands"] == 2
+    assert stats["skipped"] == 1
+    assert tuple(surface.get_at((30, 30)))[:3] == GREEN
+
+
+def test_blit_covered_by_later_opaque_blit_is_skipped():
+    surface = pygame.Surface((200, 200))
+    small = pygame.Surface((10, 10))
+    small.fill(RED)
+    large = pygame.Surface((100, 100))
+    large.fill(BLUE)
+
+    queue = render_queue.RenderQueue()
+
+    def draw():
+        render_queue.blit(surface, small, (40, 40))
+        render_queue.blit(surface, large, (0, 0))
+
+    stats = flush(queue, draw)
+
+    assert stats["skipped"] == 1
+    assert tuple(surface.get_at((45, 45)))[:3] == BLUE
+
+
+def test_partly_covered_command_is_drawn():
+    surface = pygame.Surface((200, 200))
+    queue = render_queue.RenderQueue()
+
+    def draw():
+        render_queue.fill(surface, RED, pygame.Rect(90, 90, 30, 30))
+        render_queue.fill(surface, GREEN, pygame.Rect(0, 0, 100, 100))
+
+    stats = flush(queue, draw)
+
+    assert stats["skipped"] == 0
+    assert tuple(surface.get_at((110, 110)))[:3] == RED
+
+
+def test_earlier_occluder_does_not_skip():
+    surface = pygame.Surface((200, 200))
+    queue = render_queue.RenderQueue()
+
+    def draw():
+        render_queue.fill(surface, GREEN, pygame.Rect(0, 0, 100, 100))
+        render_queue.fill(surface, RED, pygame.Rect(20, 20, 30, 30))
+
+    stats = flush(queue, draw)
+
+    assert stats["skipped"] == 0
+    assert tuple(surface.get_at((30, 30)))[:3] == RED
+
+
+def test_transparent_and_small_commands_do_not_occlude():
+    surface = pygame.Surface((200, 200))
+    transparent = pygame.Surface((100, 100), pygame.SRCALPHA)
+    transparent.fill((0, 0, 255, 100))
+
+    queue = render_queue.RenderQueue()
+
+    def draw():
+        render_queue.fill(surface, RED, pygame.Rect(20, 20, 10, 10))
+        render_queue.blit(surface, transparent, (0, 0))
+        render_queue.fill(surface, GREEN, pygame.Rect(20, 20, 20, 20))
+        render_queue.fill(surface, RED, pygame.Rect(150, 150, 10, 10))
+        render_queue.fill(surface, (0, 0, 255, 100), pygame.Rect(100, 100, 100, 100))
+
+    stats = flush(queue, draw)
+
+    # The 20x20 fill is smaller than MIN_OCCLUDER_AREA, and the other large commands are not opaque
+    assert stats["skipped"] == 0
+
+
+def test_occluder_on_other_surface_does_not_skip():
+    surface = pygame.Surface((200, 200))
+    other_surface = pygame.Surface((200, 200))
+    queue = render_queue.RenderQueue()
+
+    def draw():
+        render_queue.fill(surface, RED, pygame.Rect(20, 20, 30, 30))
+        render_queue.fill(other_surface, GREEN, pygame.Rect(0, 0, 100, 100))
+
+    stats = flush(queue, draw)
+
+    assert stats["skipped"] == 0
+    assert tuple(surface.get_at((30, 30)))[:3] == RED
+
+
+def test_higher_z_order_occludes_earlier_commands():
+    surface = pygame.Surface((200, 200))
+    queue = render_queue.RenderQueue()
+
+    def draw():
+        render_queue.set_z_order(1)
+        render_queue.fill(surface, GREEN, pygame.Rect(0, 0, 100, 100))
+        render_queue.set_z_order(0)
+        render_queue.fill(surface, RED, pygame.Rect(20, 20, 30, 30))
+
+    stats = flush(queue, draw)
+
+    assert stats["skipped"] == 1
+    assert tuple(surface.get_at((30, 30)))[:3] == GREEN
+
+
+def test_skip_occluded_false():
+    surface = pygame.Surface((200, 200))
+    queue = render_queue.RenderQueue(skip_occluded=False)
+
+    def draw():
+        render_queue.fill(surface, RED, pygame.Rect(20, 20, 30, 30))
+        render_queue.fill(surface, GREEN, pygame.Rect(0, 0, 100, 100))
+
+    stats = flush(queue, draw)
+
+    assert stats["skipped"] == 0
+    assert tuple(surface.get_at((30, 30)))[:3] == GREEN
+
+
+def test_consecutive_blits_are_batched():
+    surface = pygame.Surface((200, 200))
+    image = pygame.Surface((10, 10))
+    queue = render_queue.RenderQueue()
+
+    def draw():
+        render_queue.blit(surface, image, (0, 0))
+        render_queue.blit(surface, image, (20, 0))
+        render_queue.fill(surface, RED, pygame.Rect(0, 50, 10, 10))
+        render_queue.blit(surface, image, (40, 0))
+
+    stats = flush(queue, draw)
+
+    assert stats["commands"] == 4
+    assert stats["blits_calls"] == 2
+    assert len(queue) == 0
@@ -0,0 +1,163 @@
+import random
+
+from pygame_ui_toolkit import text_buffer
+
+
+def check_runs(buffer, expected_text):
+    """Check that the runs of a buffer hold the expected text, and are not empty or longer than MAX_RUN_LENGTH."""
+    assert buffer.get_text() == expected_text
+    assert "".join(buffer.runs) == expected_text
+    assert len(buffer) == len(expected_text)
+
+    for run in buffer.runs:
+        assert 0 < len(run) <= text_buffer.MAX_RUN_LENGTH
+
+
+def test_split_runs():
+    runs = text_buffer.split_runs("a" * 100)
+
+    assert [len(i) for i in runs] == [32, 32, 32, 4]
+    assert text_buffer.split_runs("") == []
+
+
+def test_insert_at_run_boundary():
+    text = "a" * 32 + "b" * 32
+    buffer = text_buffer.TextBuffer(text)
+
+    buffer.move_cursor(32)
+    buffer.insert("XY")
+
+    # Text typed at the boundary is added to the end of the first run
+    assert buffer.runs[0] == "a" * 32 + "XY"
+    assert buffer.runs[1] == "b" * 32
+    assert buffer.cursor == 34
+    check_runs(buffer, "a" * 32 + "XY" + "b" * 32)
+
+
+def test_insert_splits_long_run():
+    buffer = text_buffer.TextBuffer("a" * 64)
+    old_second_run = buffer.runs[1]
+
+    buffer.move_cursor(10)
+    buffer.insert("X" * 40)
+
+    check_runs(buffer, "a" * 10 + "X" * 40 + "a" * 54)
+    assert buffer.runs[-1] is old_second_run
+    assert buffer.cursor == 50
+
+
+def test_delete_across_runs():
+    text = "".join(chr(ord("a") + i % 26) for i in range(200))
+    buffer = text_buffer.TextBuffer(text)
+
+    buffer.delete(20, 150)
+
+    check_runs(buffer, text[:20] + text[150:])
+    assert buffer.cursor == 70
+
+
+def test_delete_from_run_boundary():
+    text = "a" * 32 + "b" * 32 + "c" * 32
+    buffer = text_buffer.TextBuffer(text)
+
+    buffer.delete(32, 64)
+
+    check_runs(buffer, "a" * 32 + "c" * 32)
+    assert len(buffer.runs) == 2
+
+
+def test_backspace_and_delete_forward_at_run_boundary():
+    text = "a" * 32 + "b" * 32
+    buffer = text_buffer.TextBuffer(text)
+
+    buffer.move_cursor(32)
+    buffer.backspace()
+    buffer.delete_forward()
+
+    check_runs(buffer, "a" * 31 + "b" * 31)
+    assert buffer.cursor == 31
+
+
+def test_selection_replace():
+    buffer = text_buffer.TextBuffer("hello world")
+
+    buffer.move_cursor(6)
+    buffer.move_cursor(11, True)
+
+    assert buffer.get_selected_text() == "world"
+
+    buffer.insert("there")
+
+    check_runs(buffer, "hello there")
+    assert buffer.cursor == 11
+    assert buffer.get_selection() == None
+
+
+def test_selection_replace_across_runs():
+    text = "".join(chr(ord("a") + i % 26) for i in range(150))
+    buffer = text_buffer.TextBuffer(text)
+
+    # Select backwards, so the anchor is after the cursor
+    buffer.move_cursor(100)
+    buffer.move_cursor(40, True)
+
+    assert buffer.get_selection() == (40, 100)
+    assert buffer.get_selected_text() == text[40:100]
+
+    buffer.insert("XYZ")
+
+    check_runs(buffer, text[:40] + "XYZ" + text[100:])
+    assert buffer.cursor == 43
+
+
+def test_select_all_and_backspace():
+    buffer = text_buffer.TextBuffer("a" * 100)
+
+    buffer.select_all()
+    buffer.backspace()
+
+    check_runs(buffer, "")
+    assert buffer.runs == []
+    assert buffer.cursor == 0
+
+    buffer.insert("abc")
+
+    check_runs(buffer, "abc")
+
+
+def test_version_changes_on_edit():
+    buffer = text_buffer.TextBuffer("abc")
+    version = buffer.version
+
+    buffer.move_cursor(1)
+    assert buffer.version == version
+
+    buffer.insert("X")
+    assert buffer.version > version
+
+
+def test_random_edits_match_string():
+    random_gen = random.Random(0)
+
+    text = ""
+    buffer = text_buffer.TextBuffer()
+
+    for _ in range(2000):
+        action = random_gen.random()
+        index = random_gen.randint(0, len(text))
+
+        if action < 0.5:
+            new_text = "".join(random_gen.choice("abcdef") for _ in range(random_gen.randint(1, 70)))
+
+            buffer.move_cursor(index)
+            buffer.insert(new_text)
+
+            text = text[:index] + new_text + text[index:]
+        else:
+            end = min(len(text), index + random_gen.randint(1, 80))
+
+            buffer.delete(index, end)
+
+            text = text[:index] + text[end:]
+
+        check_runs(buffer, text)